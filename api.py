@@ -4,9 +4,18 @@ from datetime import datetime
 import json
 import os
 from collections import defaultdict
+from company_summary import summarize, summary_view
+from security import rate_limit, POST_LIMITS
 
 app = Flask(__name__, static_folder=None)
 CORS(app, supports_credentials=True)
+# Opt-in (RATE_LIMIT=1) per-client limits on the POST routes that do real work
+limiter = rate_limit(app)
+
+# Opt-in per-request timing (Server-Timing header; /metrics when METRICS_TOKEN is set)
+if os.environ.get('INSTRUMENT') == '1':
+    from instrumentation import instrument_app
+    instrument_app(app)
 
 data_file = 'submissions.json'
 applications_file = 'applications.json'
@@ -146,49 +155,27 @@ def serve_css(filename):
 def serve_js(filename):
     return send_from_directory('public/js', filename)
 
+# company_summary rows for submissions.json, rebuilt only when the file changes
+_company_summaries = {'mtime': None, 'companies': []}
+
+def company_summaries():
+    try:
+        mtime = os.stat(data_file).st_mtime_ns
+    except OSError:
+        mtime = None
+    if mtime != _company_summaries['mtime']:
+        # summarize() wants newest first; the file is in submission order
+        summaries = summarize(reversed(load_submissions())).values()
+        companies = [summary_view(s) for s in summaries]
+        for c in companies:
+            del c['success_count'], c['success_rate'], c['recent_ids']
+        companies.sort(key=lambda x: x['total_submissions'], reverse=True)
+        _company_summaries.update(mtime=mtime, companies=companies)
+    return _company_summaries['companies']
+
 @app.route('/api/companies')
 def get_companies():
-    submissions = load_submissions()
-    companies = {}
-    
-    for submission in submissions:
-        company = submission.get('company', '')
-        if not company:
-            continue
-            
-        if company not in companies:
-            companies[company] = {
-                'name': company,
-                'total_submissions': 0,
-                'avg_salary': 0,
-                'salary_count': 0,
-                'recent_roles': set()
-            }
-        
-        companies[company]['total_submissions'] += 1
-        
-        salary = submission.get('salary', '')
-        if salary and str(salary).isdigit():
-            companies[company]['avg_salary'] += int(salary)
-            companies[company]['salary_count'] += 1
-        
-        role = submission.get('role', '')
-        if role:
-            companies[company]['recent_roles'].add(role)
-    
-    result = []
-    for company_data in companies.values():
-        if company_data['salary_count'] > 0:
-            company_data['avg_salary'] = int(company_data['avg_salary'] / company_data['salary_count'])
-        else:
-            company_data['avg_salary'] = None
-        company_data['recent_roles'] = list(company_data['recent_roles'])[:5]
-        del company_data['salary_count']
-        result.append(company_data)
-    
-    result.sort(key=lambda x: x['total_submissions'], reverse=True)
-    
-    return jsonify({'companies': result})
+    return jsonify({'companies': company_summaries()})
 
 @app.route('/api/companies/<company_name>')
 def get_company(company_name):
@@ -255,6 +242,7 @@ def get_experience(experience_id):
     return jsonify({'error': 'Not found'}), 404
 
 @app.route('/api/experiences', methods=['POST'])
+@limiter.limit(POST_LIMITS, methods=['POST'])
 def create_experience():
     data = request.get_json()
     if not data:
@@ -380,6 +368,7 @@ def get_firm_university_data():
     return jsonify(FIRM_UNIVERSITY_DATA)
 
 @app.route('/api/law-match', methods=['POST'])
+@limiter.limit(POST_LIMITS, methods=['POST'])
 def law_match():
     data = request.get_json()
     university = data.get('university', '')
@@ -411,5 +400,12 @@ def law_match():
     
     return jsonify({'results': results})
 
+@app.route('/api/law-match/batch', methods=['POST'])
+@limiter.limit(POST_LIMITS, methods=['POST'])
+def law_match_batch():
+    """Batch version of the full law-match scorer (see law_match_batch.py)."""
+    from law_match_batch import batch_response
+    return batch_response(request, FIRM_UNIVERSITY_DATA)
+
 if __name__ == '__main__':
     app.run(host='0.0.0.0', port=5000, debug=True)
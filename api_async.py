@@ -0,0 +1,85 @@
+# api_async.py
+# ASGI entry point. The I/O-bound JSON endpoints (/api/company-analytics,
+# /api/company-insights, /api/grad-data) run as async Starlette routes over an
+# asyncpg pool, so a slow query parks a coroutine rather than pinning a worker
+# thread and one worker can carry many concurrent analytics polls. Every other
+# path goes to the Flask app (main.app) unchanged, on a2wsgi's thread pool.
+#
+#   uvicorn api_async:app --port 5000
+#   gunicorn api_async:app -k uvicorn.workers.UvicornWorker --workers 2
+#
+# ASYNC_POOL_MIN / ASYNC_POOL_MAX size the pool per worker (default 2/20) and
+# WSGI_THREADS the threads left for the Flask routes (default 8). A sqlite:///
+# DATABASE_URL (dev, loadtest) has no async driver; those queries run the sync
+# db_auth functions in the thread pool instead.
+
+import os
+from contextlib import asynccontextmanager
+from a2wsgi import WSGIMiddleware
+from starlette.applications import Starlette
+from starlette.concurrency import run_in_threadpool
+from starlette.responses import Response
+from starlette.routing import Mount, Route
+
+from main import app as flask_app
+import db_auth
+from company_analytics import company_analytics, company_insights
+from grad_data import load_cards
+
+POOL_MIN = int(os.environ.get('ASYNC_POOL_MIN', '2'))
+POOL_MAX = int(os.environ.get('ASYNC_POOL_MAX', '20'))
+WSGI_THREADS = int(os.environ.get('WSGI_THREADS', '8'))
+SIGNALS_CSV = "out/grad_program_signals.csv"
+
+# db_auth.get_company_applications in asyncpg's $n placeholder style
+COMPANY_APPLICATIONS_SQL = """
+    SELECT a.*, u.first_name as user_name
+    FROM applications a
+    LEFT JOIN users u ON a.user_id = u.id
+    WHERE lower(a.company) = lower($1)
+    ORDER BY a.created_at DESC
+"""
+
+_pool = None
+
+@asynccontextmanager
+async def lifespan(app):
+    global _pool
+    database_url = os.environ.get('DATABASE_URL', '')
+    if database_url and not database_url.startswith('sqlite:///'):
+        import asyncpg
+        _pool = await asyncpg.create_pool(database_url, min_size=POOL_MIN, max_size=POOL_MAX)
+    try:
+        yield
+    finally:
+        if _pool is not None:
+            await _pool.close()
+            _pool = None
+
+async def company_applications(company):
+    if _pool is None:
+        return await run_in_threadpool(db_auth.get_company_applications, company)
+    async with _pool.acquire() as conn:
+        return [dict(r) for r in await conn.fetch(COMPANY_APPLICATIONS_SQL, company)]
+
+def _json(data):
+    """Same body and content type as flask.jsonify"""
+    rv = flask_app.json.response(data)
+    return Response(rv.get_data(), status_code=rv.status_code, media_type=rv.mimetype)
+
+async def api_company_analytics(request):
+    return _json(company_analytics(await company_applications(request.path_params['company_name'])))
+
+async def api_company_insights(request):
+    return _json(company_insights(await company_applications(request.path_params['company_name'])))
+
+async def api_grad_data(request):
+    # File read (first call) and per-firm aggregation stay off the event loop
+    return _json({"firms": await run_in_threadpool(load_cards, SIGNALS_CSV)})
+
+app = Starlette(routes=[
+    Route('/api/company-analytics/{company_name}', api_company_analytics),
+    Route('/api/company-insights/{company_name}', api_company_insights),
+    Route('/api/grad-data', api_grad_data),
+    Mount('/', app=WSGIMiddleware(flask_app, workers=WSGI_THREADS)),
+], lifespan=lifespan)
@@ -3,48 +3,76 @@ from flask import session, request, redirect, url_for, flash
 from werkzeug.security import generate_password_hash, check_password_hash
 import json
 import os
+import threading
 from datetime import datetime
 
 USERS_FILE = 'users.json'
 
+# users.json parsed once and indexed by username, user_id and email; re-read
+# only when the file's stat changes (e.g. another worker created a user)
+_users = {'stat': None, 'by_username': {}, 'by_id': {}, 'by_email': {}}
+_users_lock = threading.Lock()
+
 def init_users_file():
     if not os.path.exists(USERS_FILE):
-        with open(USERS_FILE, 'w') as f:
-            json.dump({}, f)
+        _save_users({})
 
-def create_user(username, email, password):
-    init_users_file()
-    
-    with open(USERS_FILE, 'r') as f:
-        users = json.load(f)
-    
-    # Check if user already exists
-    if username in users or any(user.get('email') == email for user in users.values()):
-        return False
-    
-    # Create new user
-    users[username] = {
-        'email': email,
-        'password_hash': generate_password_hash(password),
-        'created_at': datetime.utcnow().isoformat(),
-        'user_id': f"user_{len(users) + 1}"
-    }
-    
-    with open(USERS_FILE, 'w') as f:
+def _file_stat():
+    st = os.stat(USERS_FILE)
+    return (st.st_ino, st.st_mtime_ns, st.st_size)
+
+def _index_users(users, stat):
+    _users.update(stat=stat, by_username=users,
+                  by_id={u.get('user_id'): name for name, u in users.items()},
+                  by_email={u.get('email'): name for name, u in users.items()})
+
+def _save_users(users):
+    # Write-and-rename, so readers in other processes never see a partial file
+    tmp = f"{USERS_FILE}.{os.getpid()}.tmp"
+    with open(tmp, 'w') as f:
         json.dump(users, f, indent=2)
-    
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp, USERS_FILE)
+
+def _load_users():
+    """The current index; call with _users_lock held"""
+    init_users_file()
+    stat = _file_stat()
+    if stat != _users['stat']:
+        with open(USERS_FILE, 'r') as f:
+            _index_users(json.load(f), stat)
+    return _users
+
+def create_user(username, email, password):
+    with _users_lock:
+        store = _load_users()
+
+        # Check if user already exists
+        if username in store['by_username'] or email in store['by_email']:
+            return False
+
+        # Create new user
+        users = dict(store['by_username'])
+        users[username] = {
+            'email': email,
+            'password_hash': generate_password_hash(password),
+            'created_at': datetime.utcnow().isoformat(),
+            'user_id': f"user_{len(users) + 1}"
+        }
+
+        _save_users(users)
+        _index_users(users, _file_stat())
+
     return True
 
 def authenticate_user(username, password):
-    init_users_file()
-    
-    with open(USERS_FILE, 'r') as f:
-        users = json.load(f)
-    
-    if username in users:
-        if check_password_hash(users[username]['password_hash'], password):
-            return users[username]
-    
+    with _users_lock:
+        user = _load_users()['by_username'].get(username)
+
+    if user and check_password_hash(user['password_hash'], password):
+        return dict(user)
+
     return None
 
 def login_required(f):
@@ -57,15 +85,15 @@ def login_required(f):
 
 def get_current_user():
     if 'user_id' in session:
-        init_users_file()
-        with open(USERS_FILE, 'r') as f:
-            users = json.load(f)
-        
-        for username, user_data in users.items():
-            if user_data.get('user_id') == session['user_id']:
-                return {
-                    'user_id': user_data['user_id'],
-                    'username': username,
-                    'email': user_data.get('email')
-                }
+        with _users_lock:
+            store = _load_users()
+            username = store['by_id'].get(session['user_id'])
+            user_data = store['by_username'].get(username)
+
+        if user_data:
+            return {
+                'user_id': user_data['user_id'],
+                'username': username,
+                'email': user_data.get('email')
+            }
     return None
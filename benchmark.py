@@ -0,0 +1,235 @@
+# benchmark.py
+# Timing + peak-memory benchmarks for the text pipelines over a frozen corpus
+# snapshot (bench/corpus_snapshot.csv). Emits JSON so two commits can be compared:
+#
+#   python benchmark.py --json bench/before.json
+#   ... change extractors / categorizer / experience_* ...
+#   python benchmark.py --json bench/after.json --compare bench/before.json
+
+import csv, io, os, sys, json, time, random, hashlib, argparse, platform, subprocess, tempfile, tracemalloc
+from contextlib import redirect_stdout
+from typing import Callable, Dict, List
+
+SNAPSHOT = os.path.join("bench", "corpus_snapshot.csv")
+SNAPSHOT_SOURCES = ["law_raw.csv", "raw_all.csv"]
+SNAPSHOT_FIELDS = ["thread_title", "thread_url", "post_number", "author", "timestamp", "content"]
+SNAPSHOT_PER_SOURCE = 500
+SNAPSHOT_SEED = 20250815
+
+# --- Snapshot ---------------------------------------------------------------
+def build_snapshot(path: str = SNAPSHOT, per_source: int = SNAPSHOT_PER_SOURCE, seed: int = SNAPSHOT_SEED) -> int:
+    """Freeze a deterministic sample of the raw CSVs (authors blanked) for benchmarking."""
+    rng = random.Random(seed)
+    rows: List[Dict] = []
+    for src in SNAPSHOT_SOURCES:
+        with open(src, newline="", encoding="utf-8") as f:
+            src_rows = [r for r in csv.DictReader(f) if (r.get("content") or "").strip()]
+        picked = sorted(rng.sample(range(len(src_rows)), min(per_source, len(src_rows))))
+        rows.extend(src_rows[i] for i in picked)
+    os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+    with open(path, "w", newline="", encoding="utf-8") as g:
+        w = csv.DictWriter(g, fieldnames=SNAPSHOT_FIELDS, extrasaction="ignore")
+        w.writeheader()
+        for r in rows:
+            w.writerow({**r, "author": ""})
+    return len(rows)
+
+def load_snapshot(path: str = SNAPSHOT) -> List[Dict]:
+    with open(path, newline="", encoding="utf-8") as f:
+        return list(csv.DictReader(f))
+
+def _sha256(path: str) -> str:
+    with open(path, "rb") as f:
+        return hashlib.sha256(f.read()).hexdigest()
+
+# --- Benchmarks -------------------------------------------------------------
+# Each benchmark gets the snapshot rows and returns how many posts it processed.
+BENCHMARKS: Dict[str, Callable[[List[Dict]], int]] = {}
+
+def benchmark(name: str):
+    def register(fn):
+        BENCHMARKS[name] = fn
+        return fn
+    return register
+
+def _clean_posts(rows: List[Dict]) -> List[str]:
+    from experience_quality_v3 import clean_whirlpool_text
+    return [c for c in (clean_whirlpool_text(r["content"]) for r in rows) if c]
+
+@benchmark("clean")
+def bench_clean(rows):
+    from experience_quality_v3 import clean_whirlpool_text
+    for r in rows:
+        clean_whirlpool_text(r["content"])
+    return len(rows)
+
+@benchmark("firm_match")
+def bench_firm_match(rows):
+    from experience_quality_v3 import match_firm
+    for r in rows:
+        match_firm(r["content"], r.get("thread_title", ""))
+    return len(rows)
+
+@benchmark("score_v3")
+def bench_score_v3(rows):
+    from experience_quality_v3 import answer_like, quality_score
+    posts = _clean_posts(rows)
+    for p in posts:
+        answer_like(p); quality_score(p)
+    return len(posts)
+
+@benchmark("score_value")
+def bench_score_value(rows):
+    from experience_value_filter import passes_answer_gate, value_score
+    posts = _clean_posts(rows)
+    for p in posts:
+        passes_answer_gate(p); value_score(p)
+    return len(posts)
+
+@benchmark("score_batch")
+def bench_score_batch(rows):
+    import experience_batch as eb
+    posts = eb.clean_series([r["content"] for r in rows])
+    posts = posts[posts != ""]
+    eb.score_posts(posts)
+    return len(posts)
+
+@benchmark("score_engine")
+def bench_score_engine(rows):
+    import pandas as pd
+    import experience_batch as eb
+    import experience_engine as en
+    df = pd.DataFrame(rows)
+    df["content"] = eb.clean_series(df["content"])
+    df = df[df["content"] != ""]
+    df["firm_name"] = en.match_firms(df["content"], df["thread_title"])
+    en.evaluate(en.extract_features(df["content"]))
+    return len(df)
+
+@benchmark("find_dates")
+def bench_find_dates(rows):
+    from extractors import find_dates_near_keywords
+    for r in rows:
+        text = f"{r.get('thread_title', '')}\n{r['content']}"
+        find_dates_near_keywords(text, r"open(s|ing)?")
+        find_dates_near_keywords(text, r"close(s|ing)?")
+    return len(rows)
+
+@benchmark("categorize")
+def bench_categorize(rows):
+    from categorizer import classify_text
+    for r in rows:
+        classify_text(r["content"], threshold=1.0, top_k=3)
+    return len(rows)
+
+@benchmark("extract_end_to_end")
+def bench_extract(rows):
+    import extract_grad_programs
+    with tempfile.TemporaryDirectory() as tmp:
+        src = os.path.join(tmp, "snapshot.csv")
+        with open(src, "w", newline="", encoding="utf-8") as g:
+            w = csv.DictWriter(g, fieldnames=SNAPSHOT_FIELDS, extrasaction="ignore")
+            w.writeheader(); w.writerows(rows)
+        with redirect_stdout(io.StringIO()):
+            extract_grad_programs.main(in_paths=[src],
+                                       out_csv=os.path.join(tmp, "signals.csv"),
+                                       out_parquet=os.path.join(tmp, "signals.parquet"))
+    return len(rows)
+
+# --- Runner -----------------------------------------------------------------
+def _measure(fn: Callable[[List[Dict]], int], rows: List[Dict], repeat: int) -> Dict:
+    fn(rows)  # warm-up: imports, regex cache
+    best = float("inf"); n = 0
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        n = fn(rows)
+        best = min(best, time.perf_counter() - t0)
+    # peak memory is measured on a separate, untimed run (tracemalloc slows things down)
+    tracemalloc.start()
+    fn(rows)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return {
+        "posts": n,
+        "seconds": round(best, 6),
+        "posts_per_sec": round(n / best, 1) if best > 0 else None,
+        "peak_kb": round(peak / 1024, 1),
+    }
+
+def _git_commit() -> str:
+    try:
+        return subprocess.check_output(["git", "rev-parse", "--short", "HEAD"], text=True,
+                                       stderr=subprocess.DEVNULL).strip()
+    except Exception:
+        return ""
+
+def run(names: List[str], repeat: int = 3, snapshot: str = SNAPSHOT) -> Dict:
+    rows = load_snapshot(snapshot)
+    results = {}
+    for name in names:
+        try:
+            results[name] = _measure(BENCHMARKS[name], rows, repeat)
+        except ImportError as e:
+            results[name] = {"skipped": str(e)}
+    return {
+        "commit": _git_commit(),
+        "python": platform.python_version(),
+        "created_at": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        "corpus": {"path": snapshot, "rows": len(rows), "sha256": _sha256(snapshot)},
+        "repeat": repeat,
+        "results": results,
+    }
+
+def compare(current: Dict, baseline: Dict, tolerance: float = 0.10) -> List[str]:
+    """Names of benchmarks whose throughput dropped by more than `tolerance`."""
+    if baseline.get("corpus", {}).get("sha256") != current["corpus"]["sha256"]:
+        print("Warning: baseline was recorded on a different corpus snapshot")
+    regressions = []
+    for name, cur in current["results"].items():
+        old = baseline.get("results", {}).get(name, {})
+        if not cur.get("posts_per_sec") or not old.get("posts_per_sec"):
+            continue
+        ratio = cur["posts_per_sec"] / old["posts_per_sec"]
+        flag = "REGRESSION" if ratio < 1 - tolerance else ""
+        print(f"  {name:<20} {old['posts_per_sec']:>10.1f} -> {cur['posts_per_sec']:>10.1f} posts/s  ({ratio:5.2f}x) {flag}")
+        if flag:
+            regressions.append(name)
+    return regressions
+
+# --- CLI --------------------------------------------------------------------
+def main():
+    ap = argparse.ArgumentParser(description="Benchmark the text pipelines on a frozen corpus snapshot")
+    ap.add_argument("--only", nargs="+", choices=sorted(BENCHMARKS), default=None, help="Run a subset")
+    ap.add_argument("--repeat", type=int, default=3, help="Timed runs per benchmark (best is kept)")
+    ap.add_argument("--snapshot", default=SNAPSHOT)
+    ap.add_argument("--refresh-snapshot", action="store_true", help="Rebuild the snapshot from the raw CSVs")
+    ap.add_argument("--json", dest="json_out", default=None, help="Write results JSON here")
+    ap.add_argument("--compare", default=None, help="Baseline JSON to compare against")
+    ap.add_argument("--tolerance", type=float, default=0.10, help="Allowed throughput drop (default 10%%)")
+    args = ap.parse_args()
+
+    if args.refresh_snapshot or not os.path.exists(args.snapshot):
+        print(f"Wrote {args.snapshot} ({build_snapshot(args.snapshot)} rows)")
+
+    report = run(args.only or list(BENCHMARKS), args.repeat, args.snapshot)
+    print(f"Corpus: {report['corpus']['rows']} rows  commit: {report['commit'] or '-'}")
+    for name, r in report["results"].items():
+        if "skipped" in r:
+            print(f"  {name:<20} skipped ({r['skipped']})"); continue
+        print(f"  {name:<20} {r['posts_per_sec']:>10.1f} posts/s  {r['seconds']*1000:>9.1f} ms  peak {r['peak_kb']:>9.1f} KB")
+
+    if args.json_out:
+        os.makedirs(os.path.dirname(args.json_out) or ".", exist_ok=True)
+        with open(args.json_out, "w", encoding="utf-8") as g:
+            json.dump(report, g, indent=2)
+        print(f"Wrote {args.json_out}")
+
+    if args.compare:
+        with open(args.compare, encoding="utf-8") as f:
+            baseline = json.load(f)
+        print(f"Compared with {args.compare} (commit {baseline.get('commit') or '-'}):")
+        if compare(report, baseline, args.tolerance):
+            sys.exit(1)
+
+if __name__ == "__main__":
+    main()
@@ -1,20 +1,71 @@
-
 # categorize_insights.py
-import csv, sys
-from categorizer import classify_text, label
+# Add primary_cat / cat_labels columns to a CSV of posts. Streams the input in
+# chunks; with --workers N the chunks are classified on a process pool and
+# written back in input order, with at most 2*N chunks in flight.
+#
+#   python categorize_insights.py in.csv out.csv --workers 8
+import os, csv, sys, time, argparse
+from collections import deque
+from itertools import islice
+from concurrent.futures import ProcessPoolExecutor
+from categorizer import classify_many, label
+
+CHUNK_SIZE = 2000
+
+def classify_chunk(texts):
+    """(primary_cat, cat_labels) for each text; runs in the worker processes."""
+    return [(p or "", ", ".join([label(c) for c in cats]))
+            for p, cats, _ in classify_many(texts, threshold=1.0, top_k=3)]
+
+def _chunks(reader, size):
+    while True:
+        rows = list(islice(reader, size))
+        if not rows:
+            return
+        yield rows
 
-def run(in_path, out_path):
+def run(in_path, out_path, workers=1, chunk_size=CHUNK_SIZE):
+    """Categorize in_path into out_path; returns the number of rows written."""
+    n = 0
+    t0 = time.perf_counter()
     with open(in_path, newline="", encoding="utf-8") as f, open(out_path, "w", newline="", encoding="utf-8") as g:
         r = csv.DictReader(f)
         w = csv.DictWriter(g, fieldnames=r.fieldnames + ["primary_cat","cat_labels"])
         w.writeheader()
-        for row in r:
-            p, cats, _ = classify_text(row.get("content",""), threshold=1.0, top_k=3)
-            row["primary_cat"] = p or ""
-            row["cat_labels"] = ", ".join([label(c) for c in cats])
-            w.writerow(row)
+
+        def write(rows, results):
+            for row, (p, labels) in zip(rows, results):
+                row["primary_cat"] = p
+                row["cat_labels"] = labels
+            w.writerows(rows)
+            return len(rows)
+
+        if workers <= 1:
+            for rows in _chunks(r, chunk_size):
+                n += write(rows, classify_chunk([row.get("content","") for row in rows]))
+        else:
+            with ProcessPoolExecutor(max_workers=workers) as pool:
+                pending = deque()   # (rows, future) in input order
+                for rows in _chunks(r, chunk_size):
+                    pending.append((rows, pool.submit(classify_chunk, [row.get("content","") for row in rows])))
+                    if len(pending) >= 2 * workers:
+                        rows, fut = pending.popleft()
+                        n += write(rows, fut.result())
+                while pending:
+                    rows, fut = pending.popleft()
+                    n += write(rows, fut.result())
+
+    elapsed = time.perf_counter() - t0
+    print(f"Categorized {n} rows in {elapsed:.1f}s ({n / elapsed if elapsed else 0:,.0f} rows/s, "
+          f"{max(workers, 1)} worker{'s' if workers > 1 else ''})", file=sys.stderr)
+    return n
 
 if __name__ == "__main__":
-    in_path = sys.argv[1]; out_path = sys.argv[2]
-    run(in_path, out_path)
-    print("Wrote", out_path)
+    ap = argparse.ArgumentParser(description="Tag posts with categorizer categories")
+    ap.add_argument("in_path")
+    ap.add_argument("out_path")
+    ap.add_argument("--workers", type=int, default=1, help="Processes to classify on (0 = all CPUs)")
+    ap.add_argument("--chunk-size", type=int, default=CHUNK_SIZE, help="Rows per chunk")
+    args = ap.parse_args()
+    run(args.in_path, args.out_path, args.workers or os.cpu_count() or 1, args.chunk_size)
+    print("Wrote", args.out_path)
@@ -31,17 +31,82 @@ CATS = {
     "interview_tips": {"kw": ["tip","advice","be ready","expect","they asked","question was","my experience"], "rx": []},
 }
 
-def _score(text: str):
+# Extra half-points on top of the per-category matches: (slug, keywords, patterns)
+BONUSES = [
+    ("pay_benefits", [], [r"\$[\d,]+", r"\b\d+\s*k\b"]),
+    ("hours_workload", ["billable", "target"], []),
+    ("program_structure", ["rotation", "seat"], []),
+]
+
+_DIGIT_RUN = re.compile(r"\d+")
+
+def _is_word(ch: str) -> bool:
+    return ch.isalnum() or ch == "_"
+
+def compile_rules(cats=CATS, bonuses=BONUSES):
+    """Compile the keyword/regex tables once: each distinct keyword and pattern is
+    checked a single time per text, and its hit is fanned out to every category
+    (and bonus) that uses it."""
+    slugs = list(cats)
+    keywords, patterns = {}, {}   # keyword/pattern -> [(category index, weight)]
+    for i, slug in enumerate(slugs):
+        for k in cats[slug]["kw"]:
+            keywords.setdefault(k, []).append((i, 1.0))
+        for pat in cats[slug]["rx"]:
+            patterns.setdefault(pat, []).append((i, 1.5))
+    for k in [k for _, kws, _ in bonuses for k in kws]:
+        keywords.setdefault(k, [])
+    for pat in [p for _, _, pats in bonuses for p in pats]:
+        patterns.setdefault(pat, [])
+
+    # Patterns that start with \b\d can only match at a digit run that follows a
+    # non-word char, so they're tried there with .match() instead of a full search.
+    compiled = []
+    for pat, targets in patterns.items():
+        compiled.append((re.compile(pat), pat.startswith(r"\b\d"), pat, targets))
+    return {
+        "slugs": slugs,
+        "keywords": list(keywords.items()),
+        "anchored": [(rx, pat, t) for rx, anchored, pat, t in compiled if anchored],
+        "searched": [(rx, pat, t) for rx, anchored, pat, t in compiled if not anchored],
+        "bonuses": [(slugs.index(slug), kws, pats) for slug, kws, pats in bonuses],
+    }
+
+_ENGINE = compile_rules()
+
+def score_vector(text: str, engine=None):
+    """Scores for every category (in CATS order) from a single pass over the rules."""
+    e = engine or _ENGINE
     t = (text or "").lower()
+    scores = [0.0] * len(e["slugs"])
+    hits = set()
+    for k, targets in e["keywords"]:
+        if k in t:
+            hits.add(k)
+            for i, w in targets:
+                scores[i] += w
+    starts = [m.start() for m in _DIGIT_RUN.finditer(t) if m.start() == 0 or not _is_word(t[m.start() - 1])]
+    if starts:
+        for rx, pat, targets in e["anchored"]:
+            if any(rx.match(t, p) for p in starts):
+                hits.add(pat)
+                for i, w in targets:
+                    scores[i] += w
+    for rx, pat, targets in e["searched"]:
+        if rx.search(t):
+            hits.add(pat)
+            for i, w in targets:
+                scores[i] += w
+    for i, kws, pats in e["bonuses"]:
+        if any(k in hits for k in kws) or any(p in hits for p in pats):
+            scores[i] += 0.5
+    return scores
+
+def _score(text: str):
     s = defaultdict(float)
-    for slug, spec in CATS.items():
-        for k in spec["kw"]:
-            if k in t: s[slug] += 1.0
-        for pat in spec["rx"]:
-            if re.search(pat, t): s[slug] += 1.5
-    if re.search(r"\$[\d,]+|\b\d+\s*k\b", t): s["pay_benefits"] += 0.5
-    if "billable" in t or "target" in t: s["hours_workload"] += 0.5
-    if "rotation" in t or "seat" in t: s["program_structure"] += 0.5
+    for slug, sc in zip(_ENGINE["slugs"], score_vector(text)):
+        if sc:
+            s[slug] = sc
     return s
 
 def classify_text(text: str, threshold: float = 1.0, top_k: int = 3):
@@ -53,3 +118,7 @@ def classify_text(text: str, threshold: float = 1.0, top_k: int = 3):
 
 def label(slug: str) -> str:
     return LABELS.get(slug, slug.replace("_"," ").title())
+
+def classify_many(texts, threshold: float = 1.0, top_k: int = 3):
+    """classify_text over an iterable of texts; one (primary, cats, kept) per text."""
+    return [classify_text(t, threshold, top_k) for t in texts]
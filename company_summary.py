@@ -0,0 +1,180 @@
+# company_summary.py
+# Per-company totals behind the homepage and /companies, kept in a
+# company_summary table so those pages read one row per company instead of
+# folding every submission on each request.
+#
+# db_auth.create_submission refreshes the submitting company's row in the same
+# transaction; the bulk loaders (seed_db, migrate_to_db) rebuild() the whole
+# table in theirs.
+# A full rebuild can also run on a schedule:
+#
+#   python company_summary.py refresh               # once
+#   python company_summary.py refresh --every 600   # every 10 minutes
+
+import sys, json, time, argparse
+from typing import Dict, Iterable, List, Optional
+
+RECENT_ROLES = 5         # distinct roles kept per company, newest first
+RECENT_EXPERIENCES = 5   # submission ids kept per company for /companies previews
+FETCH_ROWS = 5000
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS company_summary (
+    company VARCHAR PRIMARY KEY,
+    total_submissions INTEGER NOT NULL DEFAULT 0,
+    success_count INTEGER NOT NULL DEFAULT 0,
+    salary_total BIGINT NOT NULL DEFAULT 0,
+    salary_count INTEGER NOT NULL DEFAULT 0,
+    recent_roles TEXT NOT NULL DEFAULT '[]',
+    recent_ids TEXT NOT NULL DEFAULT '[]',
+    last_submission_at TIMESTAMP,
+    refreshed_at TIMESTAMP
+)
+"""
+
+SOURCE_SQL = "SELECT id, company, role, created_at FROM submissions"
+ORDER_SQL = " ORDER BY created_at DESC, id DESC"
+
+# Claims the company's row first, so concurrent submitters to one firm queue
+# on its row lock and each recount sees the others' committed rows
+CLAIM_SQL = """
+    INSERT INTO company_summary (company) VALUES (%s)
+    ON CONFLICT (company) DO UPDATE SET company = EXCLUDED.company
+"""
+
+UPSERT_SQL = """
+    INSERT INTO company_summary (company, total_submissions, success_count, salary_total, salary_count,
+                                 recent_roles, recent_ids, last_submission_at, refreshed_at)
+    VALUES (%s, %s, %s, %s, %s, %s, %s, %s, NOW())
+    ON CONFLICT (company) DO UPDATE SET
+        total_submissions = EXCLUDED.total_submissions, success_count = EXCLUDED.success_count,
+        salary_total = EXCLUDED.salary_total, salary_count = EXCLUDED.salary_count,
+        recent_roles = EXCLUDED.recent_roles, recent_ids = EXCLUDED.recent_ids,
+        last_submission_at = EXCLUDED.last_submission_at, refreshed_at = EXCLUDED.refreshed_at
+"""
+
+READ_SQL = "SELECT * FROM company_summary ORDER BY total_submissions DESC, last_submission_at DESC, company"
+
+def summarize(rows: Iterable[Dict], out: Optional[Dict] = None) -> Dict[str, Dict]:
+    """Fold submission dicts (newest first) into {company: summary}; `out` accumulates across calls"""
+    out = {} if out is None else out
+    for r in rows:
+        company = r.get('company')
+        if not company:
+            continue
+        s = out.get(company)
+        if s is None:
+            s = out[company] = {'company': company, 'total_submissions': 0, 'success_count': 0,
+                                'salary_total': 0, 'salary_count': 0, 'recent_roles': [],
+                                'recent_ids': [], 'last_submission_at': r.get('created_at')}
+        s['total_submissions'] += 1
+        if r.get('outcome') == 'Success':
+            s['success_count'] += 1
+        salary = r.get('salary', '')
+        if salary and str(salary).isdigit():
+            s['salary_total'] += int(salary)
+            s['salary_count'] += 1
+        role = r.get('role')
+        if role and role not in s['recent_roles'] and len(s['recent_roles']) < RECENT_ROLES:
+            s['recent_roles'].append(role)
+        if r.get('id') is not None and len(s['recent_ids']) < RECENT_EXPERIENCES:
+            s['recent_ids'].append(r['id'])
+    return out
+
+def summary_view(s: Dict, roles: int = RECENT_ROLES) -> Dict:
+    """Template/API shape of a summary row (stored or from summarize())"""
+    recent_roles, recent_ids = s['recent_roles'], s['recent_ids']
+    if isinstance(recent_roles, str):
+        recent_roles, recent_ids = json.loads(recent_roles), json.loads(recent_ids)
+    total = s['total_submissions']
+    return {
+        'name': s['company'],
+        'total_submissions': total,
+        'success_count': s['success_count'],
+        'success_rate': round((s['success_count'] / total) * 100, 1) if total else 0.0,
+        'avg_salary': int(s['salary_total'] / s['salary_count']) if s['salary_count'] else None,
+        'recent_roles': recent_roles[:roles],
+        'recent_ids': recent_ids,
+    }
+
+def _params(s: Dict) -> tuple:
+    return (s['company'], s['total_submissions'], s['success_count'], s['salary_total'], s['salary_count'],
+            json.dumps(s['recent_roles']), json.dumps(s['recent_ids']), s['last_submission_at'])
+
+def _dicts(cur, rows: List) -> List[Dict]:
+    # Plain psycopg2 cursors (the bulk loaders) return tuples
+    if rows and not isinstance(rows[0], dict):
+        cols = [d[0] for d in cur.description]
+        return [dict(zip(cols, r)) for r in rows]
+    return rows
+
+_ready = False
+
+def ensure_table(conn):
+    """Create the table on first use in this process, rebuilding it if it starts out empty"""
+    global _ready
+    if _ready:
+        return
+    cur = conn.cursor()
+    cur.execute(SCHEMA)
+    cur.execute("SELECT COUNT(*) AS n FROM company_summary")
+    row = cur.fetchone()
+    empty = (row['n'] if isinstance(row, dict) else row[0]) == 0
+    cur.close()
+    conn.commit()
+    _ready = True
+    if empty:
+        refresh_all(conn)
+
+def refresh_company(cur, company: str):
+    """Recount one company inside the caller's transaction"""
+    cur.execute(CLAIM_SQL, (company,))
+    # Matched on lower(company) to use submissions_company_idx (db_indexes); other
+    # spellings land in their own summarize() buckets and are dropped by .get()
+    cur.execute(SOURCE_SQL + " WHERE lower(company) = lower(%s)" + ORDER_SQL, (company,))
+    s = summarize(_dicts(cur, cur.fetchall())).get(company)
+    if s is None:
+        cur.execute("DELETE FROM company_summary WHERE company = %s", (company,))
+    else:
+        cur.execute(UPSERT_SQL, _params(s))
+
+def rebuild(cur, lock: bool = True) -> int:
+    """Recount every company inside the caller's transaction; returns companies"""
+    cur.execute(SCHEMA)
+    if lock:
+        # Holds off create_submission's per-company refresh (not readers) until commit
+        cur.execute("LOCK TABLE company_summary IN EXCLUSIVE MODE")
+    cur.execute(SOURCE_SQL + ORDER_SQL)
+    summaries: Dict[str, Dict] = {}
+    for rows in iter(lambda: cur.fetchmany(FETCH_ROWS), []):
+        summarize(_dicts(cur, rows), summaries)
+    cur.execute("DELETE FROM company_summary")
+    cur.executemany(UPSERT_SQL, [_params(s) for s in summaries.values()])
+    return len(summaries)
+
+def refresh_all(conn) -> int:
+    """Rebuild the table in one transaction (readers keep the old rows until commit)"""
+    cur = conn.cursor()
+    n = rebuild(cur, lock=getattr(conn, 'dialect', 'postgres') == 'postgres')
+    cur.close()
+    conn.commit()
+    return n
+
+if __name__ == '__main__':
+    ap = argparse.ArgumentParser(description="Rebuild the company_summary table")
+    ap.add_argument("command", choices=["refresh"])
+    ap.add_argument("--every", type=float, default=0, help="Repeat every N seconds")
+    args = ap.parse_args()
+
+    from db_auth import get_db_connection
+    while True:
+        t0 = time.perf_counter()
+        conn = get_db_connection()
+        try:
+            n = refresh_all(conn)
+        finally:
+            conn.close()
+        print(f"Refreshed {n} companies in {time.perf_counter() - t0:.2f}s", file=sys.stderr)
+        if not args.every:
+            break
+        time.sleep(args.every)
@@ -1,15 +1,23 @@
 import os
-import psycopg2
-import psycopg2.extras
 from flask import request, session, jsonify
 from datetime import datetime
 from functools import wraps
+import company_summary
 
 def get_db_connection():
     """Get database connection"""
     database_url = os.environ.get('DATABASE_URL')
     if not database_url:
         raise ValueError("DATABASE_URL environment variable not set")
+    if database_url.startswith('sqlite:///'):
+        import db_sqlite
+        return db_sqlite.connect(database_url[len('sqlite:///'):])
+    # Imported on first connect so workers boot without loading libpq
+    try:
+        import psycopg2
+        import psycopg2.extras
+    except ImportError:
+        raise ImportError("psycopg2 is required for a Postgres DATABASE_URL")
     return psycopg2.connect(database_url, cursor_factory=psycopg2.extras.RealDictCursor)
 
 def get_current_user():
@@ -90,6 +98,27 @@ def get_user_applications(user_id):
     
     return [dict(app) for app in applications]
 
+def iter_user_applications(user_id, batch_size=500):
+    """Yield a user's applications one at a time, fetched in batches (for streaming exports)"""
+    conn = get_db_connection()
+    # A named cursor is server-side in psycopg2, so only one batch is held at a time
+    cur = conn.cursor(name='user_applications')
+    try:
+        cur.execute("""
+            SELECT * FROM applications 
+            WHERE user_id = %s 
+            ORDER BY created_at DESC
+        """, (user_id,))
+        while True:
+            batch = cur.fetchmany(batch_size)
+            if not batch:
+                break
+            for app in batch:
+                yield dict(app)
+    finally:
+        cur.close()
+        conn.close()
+
 def create_application(user_id, application_data):
     """Create a new application"""
     conn = get_db_connection()
@@ -190,9 +219,64 @@ def get_all_submissions():
     
     return [dict(sub) for sub in submissions]
 
+def get_company_submissions(company):
+    """Submissions for one company (case-insensitive), newest first"""
+    conn = get_db_connection()
+    cur = conn.cursor()
+    
+    cur.execute("""
+        SELECT s.*, u.first_name as user_name 
+        FROM submissions s
+        LEFT JOIN users u ON s.user_id = u.id
+        WHERE lower(s.company) = lower(%s)
+        ORDER BY s.created_at DESC
+    """, (company,))
+    
+    submissions = cur.fetchall()
+    cur.close()
+    conn.close()
+    
+    return [dict(sub) for sub in submissions]
+
+def get_company_summaries():
+    """Per-company totals from company_summary, most submissions first"""
+    conn = get_db_connection()
+    company_summary.ensure_table(conn)
+    cur = conn.cursor()
+    
+    cur.execute(company_summary.READ_SQL)
+    
+    summaries = cur.fetchall()
+    cur.close()
+    conn.close()
+    
+    return [dict(s) for s in summaries]
+
+def get_submissions_by_ids(ids):
+    """Submissions with the given ids, newest first"""
+    if not ids:
+        return []
+    conn = get_db_connection()
+    cur = conn.cursor()
+    
+    cur.execute(f"""
+        SELECT s.*, u.first_name as user_name 
+        FROM submissions s
+        LEFT JOIN users u ON s.user_id = u.id
+        WHERE s.id IN ({', '.join(['%s'] * len(ids))})
+        ORDER BY s.created_at DESC, s.id DESC
+    """, tuple(ids))
+    
+    submissions = cur.fetchall()
+    cur.close()
+    conn.close()
+    
+    return [dict(sub) for sub in submissions]
+
 def create_submission(user_id, submission_data):
-    """Create a new submission"""
+    """Create a new submission and refresh its company's summary row"""
     conn = get_db_connection()
+    company_summary.ensure_table(conn)
     cur = conn.cursor()
     
     cur.execute("""
@@ -224,6 +308,7 @@ def create_submission(user_id, submission_data):
     ))
     
     submission = cur.fetchone()
+    company_summary.refresh_company(cur, submission['company'])
     conn.commit()
     cur.close()
     conn.close()
@@ -246,4 +331,23 @@ def get_all_applications():
     cur.close()
     conn.close()
     
-    return [dict(app) for app in applications]
\ No newline at end of file
+    return [dict(app) for app in applications]
+
+def get_company_applications(company):
+    """Applications for one company (case-insensitive), newest first"""
+    conn = get_db_connection()
+    cur = conn.cursor()
+    
+    cur.execute("""
+        SELECT a.*, u.first_name as user_name 
+        FROM applications a
+        LEFT JOIN users u ON a.user_id = u.id
+        WHERE lower(a.company) = lower(%s)
+        ORDER BY a.created_at DESC
+    """, (company,))
+    
+    applications = cur.fetchall()
+    cur.close()
+    conn.close()
+    
+    return [dict(app) for app in applications]
@@ -0,0 +1,52 @@
+# db_bulk.py
+# COPY FROM STDIN helpers for the bulk loaders (migrate_to_db --bulk, seed_db).
+# Rows are encoded to COPY text format a page at a time as psycopg2 reads them,
+# so a load never holds more than one page of encoded text.
+
+import time
+
+PAGE_ROWS = 10000      # rows encoded per chunk (and per progress line)
+READ_SIZE = 1 << 16    # bytes psycopg2 asks for per read()
+
+def copy_value(v):
+    """One field in COPY text format"""
+    if v is None:
+        return '\\N'
+    return (str(v).replace('\\', '\\\\').replace('\t', '\\t')
+            .replace('\n', '\\n').replace('\r', '\\r'))
+
+class CopyStream:
+    """Read-only file over rows for copy_expert, encoded a page at a time"""
+
+    def __init__(self, rows, label, total, page_rows=PAGE_ROWS):
+        self.rows = iter(rows)
+        self.label, self.total, self.page_rows = label, total, page_rows
+        self.count = 0
+        self.buf, self.pos = '', 0
+        self.started = time.perf_counter()
+
+    def _fill(self):
+        lines = []
+        for row in self.rows:
+            lines.append('\t'.join(copy_value(v) for v in row) + '\n')
+            if len(lines) == self.page_rows:
+                break
+        if lines:
+            self.count += len(lines)
+            rate = self.count / max(time.perf_counter() - self.started, 1e-9)
+            print(f"  {self.label}: staged {self.count}/{self.total} ({rate:,.0f} rows/s)")
+        return ''.join(lines)
+
+    def read(self, size=-1):
+        if self.pos >= len(self.buf):
+            self.buf, self.pos = self._fill(), 0
+        end = len(self.buf) if size is None or size < 0 else self.pos + size
+        out = self.buf[self.pos:end]
+        self.pos += len(out)
+        return out
+
+def copy_rows(cur, table, columns, rows, label, total, page_rows=PAGE_ROWS):
+    """COPY `rows` (tuples in `columns` order) into `table`; returns the number of rows sent"""
+    stream = CopyStream(rows, label, total, page_rows)
+    cur.copy_expert(f"COPY {table} ({', '.join(columns)}) FROM STDIN", stream, size=READ_SIZE)
+    return stream.count
@@ -0,0 +1,69 @@
+# db_indexes.py
+# Secondary indexes behind the db_auth queries. shared/schema.ts declares the
+# same ones for drizzle-kit push; db_sqlite and loadtest create them with their
+# tables. For an existing Postgres:
+#
+#   python db_indexes.py apply    # CREATE INDEX CONCURRENTLY for any that are missing
+#
+# Company lookups are case-insensitive everywhere (main.py compares lower()ed
+# names), so the company indexes are on lower(company).
+
+import os, sys, time
+
+INDEXES = [
+    # (name, table, columns)
+    # get_user_applications / iter_user_applications: one user's tracker, newest first
+    ('applications_user_created_idx', 'applications', 'user_id, created_at DESC'),
+    # get_company_applications (company analytics/insights), narrowed by status
+    ('applications_company_status_idx', 'applications', 'lower(company), status'),
+    # get_company_submissions and company_summary.refresh_company
+    ('submissions_company_idx', 'submissions', 'lower(company)'),
+]
+
+def create_sql(name, table, columns, concurrently=False):
+    return f"CREATE INDEX {'CONCURRENTLY ' if concurrently else ''}IF NOT EXISTS {name} ON {table} ({columns})"
+
+# All of them as one script, appended to the CREATE TABLE schemas
+INDEX_SQL = "".join(create_sql(*ix) + ";\n" for ix in INDEXES)
+
+def apply(database_url):
+    """Create any missing index without blocking writes; returns the names built"""
+    if database_url.startswith('sqlite:///'):
+        import sqlite3, db_sqlite
+        path = database_url[len('sqlite:///'):]
+        conn = sqlite3.connect(path)
+        existing = {r[0] for r in conn.execute("SELECT name FROM sqlite_master WHERE type = 'index'")}
+        conn.close()
+        db_sqlite.init_schema(path)
+        return [name for name, _, _ in INDEXES if name not in existing]
+    import psycopg2
+    conn = psycopg2.connect(database_url)
+    conn.autocommit = True   # CONCURRENTLY can't run inside a transaction block
+    built = []
+    try:
+        with conn.cursor() as cur:
+            for name, table, columns in INDEXES:
+                # An interrupted concurrent build leaves an INVALID index that IF NOT EXISTS would keep
+                cur.execute("SELECT i.indisvalid FROM pg_index i JOIN pg_class c ON c.oid = i.indexrelid "
+                            "WHERE c.relname = %s", (name,))
+                row = cur.fetchone()
+                if row and row[0]:
+                    continue
+                if row:
+                    cur.execute(f"DROP INDEX CONCURRENTLY {name}")
+                t0 = time.perf_counter()
+                cur.execute(create_sql(name, table, columns, concurrently=True))
+                print(f"  {name}: built in {time.perf_counter() - t0:.2f}s")
+                built.append(name)
+    finally:
+        conn.close()
+    return built
+
+if __name__ == '__main__':
+    if sys.argv[1:] != ['apply']:
+        raise SystemExit("usage: python db_indexes.py apply")
+    database_url = os.environ.get('DATABASE_URL')
+    if not database_url:
+        sys.exit("DATABASE_URL not found")
+    built = apply(database_url)
+    print(f"{len(built)} index(es) built, {len(INDEXES) - len(built)} already present")
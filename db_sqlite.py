@@ -0,0 +1,125 @@
+import re
+import sqlite3
+from db_indexes import INDEX_SQL
+
+# SQLite stand-in for the Postgres database behind db_auth, for local dev and
+# load tests. Selected with DATABASE_URL=sqlite:///path/to.db. Only translates
+# the Postgres-isms db_auth actually uses (%s placeholders, NOW()).
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS users (
+    id TEXT PRIMARY KEY,
+    email TEXT UNIQUE,
+    first_name TEXT,
+    last_name TEXT,
+    profile_image_url TEXT,
+    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+);
+CREATE TABLE IF NOT EXISTS applications (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    user_id TEXT NOT NULL REFERENCES users(id),
+    company TEXT NOT NULL,
+    role TEXT NOT NULL,
+    application_date DATE,
+    university TEXT,
+    wam TEXT,
+    status TEXT DEFAULT 'Applied',
+    response_date DATE,
+    priority TEXT DEFAULT 'Medium',
+    notes TEXT,
+    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+);
+CREATE TABLE IF NOT EXISTS submissions (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    user_id TEXT NOT NULL REFERENCES users(id),
+    company TEXT NOT NULL,
+    role TEXT NOT NULL,
+    experience_type TEXT,
+    theme TEXT,
+    application_stages TEXT,
+    interview_experience TEXT,
+    assessment_centre TEXT,
+    program_structure TEXT,
+    salary_benefits TEXT,
+    culture_environment TEXT,
+    hours_workload TEXT,
+    practice_areas TEXT,
+    general_experience TEXT,
+    pro_tip TEXT,
+    advice TEXT,
+    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+);
+"""
+
+def translate(sql):
+    """Rewrite a psycopg2-style query for sqlite3"""
+    sql = sql.replace('%s', '?')
+    return re.sub(r'\bNOW\(\)', 'CURRENT_TIMESTAMP', sql)
+
+def _dict_row(cursor, row):
+    return {col[0]: row[i] for i, col in enumerate(cursor.description)}
+
+class SQLiteCursor:
+    """Just enough of the psycopg2 cursor API for db_auth"""
+
+    def __init__(self, cursor):
+        self._cursor = cursor
+
+    def execute(self, sql, params=()):
+        self._cursor.execute(translate(sql), params)
+        return self
+
+    def executemany(self, sql, seq_of_params):
+        self._cursor.executemany(translate(sql), seq_of_params)
+        return self
+
+    def fetchone(self):
+        return self._cursor.fetchone()
+
+    def fetchall(self):
+        return self._cursor.fetchall()
+
+    def fetchmany(self, size=None):
+        return self._cursor.fetchmany(size or self._cursor.arraysize)
+
+    @property
+    def rowcount(self):
+        return self._cursor.rowcount
+
+    def close(self):
+        self._cursor.close()
+
+class SQLiteConnection:
+    dialect = 'sqlite'   # psycopg2 connections have no such attribute
+
+    def __init__(self, conn):
+        self._conn = conn
+
+    def cursor(self, name=None):
+        # sqlite3 cursors already step through results lazily; name is for psycopg2 parity
+        return SQLiteCursor(self._conn.cursor())
+
+    def commit(self):
+        self._conn.commit()
+
+    def rollback(self):
+        self._conn.rollback()
+
+    def close(self):
+        self._conn.close()
+
+def connect(path):
+    """Open a connection that returns rows as dicts, like RealDictCursor"""
+    conn = sqlite3.connect(path, detect_types=sqlite3.PARSE_DECLTYPES, timeout=30)
+    conn.row_factory = _dict_row
+    return SQLiteConnection(conn)
+
+def init_schema(path):
+    """Create the tables and indexes db_auth expects (idempotent)"""
+    conn = sqlite3.connect(path)
+    conn.execute('PRAGMA journal_mode=WAL')
+    conn.executescript(SCHEMA + INDEX_SQL)
+    conn.commit()
+    conn.close()
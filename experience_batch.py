@@ -0,0 +1,255 @@
+# experience_batch.py
+# Vectorized (pandas/NumPy) twin of the per-string scorers in experience_quality_v3
+# and experience_value_filter. Scores a whole column of posts in one pass; the
+# numbers match the scalar functions exactly.
+
+import re, os, time, argparse, warnings
+from typing import List
+
+import numpy as np
+import pandas as pd
+
+import experience_quality_v3 as v3
+import experience_value_filter as vf
+
+# --- Shared patterns (same expressions as the scalar modules) ---------------
+WORD_RX = r"\b[^\W_]+\b"
+MONEY_RX = r"\$\s*[\d,]+|\b\d+\s*k\b"
+DATE_RX = r"\b({})\b|\b\d{{1,2}}[/-]\d{{1,2}}[/-]\d{{2,4}}\b|\b20\d{{2}}\b"   # .format(MONTHS)
+NUMBER_RX = r"\b\d+\b"
+FIRST_PERSON_RX = r"\b(i|my|we|our|me)\b"
+
+# is_question_strict: any of these on the stripped, lowercased text
+STRICT_QUESTION_PATTERNS = [
+    r'\?',
+    r'^(what|how|when|where|why|which|who|can|could|should|would|will|is|are|does|do|did)\s',
+    r'^(any|anyone|anybody)\s',
+    r'(help|advice|tips|guidance|recommend|suggestion)',
+    r'(looking for|seeking|need|want|wondering)',
+    r'(has anyone|anyone else|does anyone)',
+    r'(please|pls)\s',
+    r'^(hi|hello|hey)\s',
+    r'(thank you|thanks|thx)',
+    r'(appreciate|grateful)',
+    r'(share|tell me|let me know)',
+    r'(experience.*with|thoughts.*on)',
+    r'(worth.*applying|should.*apply)',
+    r'(chances.*getting|likelihood)',
+    r'(interview.*process|application.*process)',
+    r'(good.*firm|best.*firm)',
+    r'(work.*life.*balance|culture.*like)',
+]
+STRICT_SENTENCE_STARTERS = ['what', 'how', 'when', 'where', 'why', 'which', 'who', 'can', 'could',
+                            'should', 'would', 'will', 'is', 'are', 'does', 'do', 'did']
+SHORT_REPLY_WORDS = ["yes", "no", "ok", "thanks", "same"]
+
+def any_rx(terms: List[str]) -> str:
+    """Plain-substring alternation (like `any(k in t for k in terms)`)."""
+    return "|".join(re.escape(k) for k in terms)
+
+def count_terms(lower: pd.Series, terms: List[str]) -> np.ndarray:
+    """How many distinct terms occur as substrings (like `sum(1 for k in terms if k in t)`)."""
+    total = np.zeros(len(lower), dtype=np.int64)
+    for k in terms:
+        total += lower.str.contains(k, regex=False).to_numpy(dtype=bool)
+    return total
+
+def has_pattern(series: pd.Series, pattern: str, flags: int = 0) -> np.ndarray:
+    with warnings.catch_warnings():  # the scalar patterns use capture groups; we only need a hit
+        warnings.simplefilter("ignore", UserWarning)
+        return series.str.contains(pattern, regex=True, flags=flags).to_numpy(dtype=bool)
+
+# --- Cleaning ---------------------------------------------------------------
+def clean_series(posts) -> pd.Series:
+    """Vectorized clean_whirlpool_text (v3) / clean_text (value filter)."""
+    s = pd.Series(posts)
+    is_str = s.map(lambda x: isinstance(x, str)).to_numpy(dtype=bool)
+    t = s.where(is_str, "").astype(str)
+    t = t.str.replace(r"[\u200B-\u200D\uFEFF]", "", regex=True)
+    for pat in v3.NOISE_PATTERNS:
+        t = t.str.replace(pat, "", regex=True, flags=re.IGNORECASE)
+    t = t.str.replace(r"@\w+", "", regex=True)
+    t = t.str.replace(r"(?m)^\s*[>\-\•]+\s*", "", regex=True)
+    t = t.str.replace(r"\s{2,}", " ", regex=True).str.strip()
+    junk = (t.str.len() < 5) | t.str.lower().isin({"deleted", "edited"})
+    return t.mask(junk, "")
+
+# --- Features ---------------------------------------------------------------
+def _word_stats(lower: pd.Series):
+    w = lower.str.findall(WORD_RX).explode()
+    wc = w.groupby(level=0).count().reindex(lower.index, fill_value=0).to_numpy(dtype=np.int64)
+    uw = w.groupby(level=0).nunique().reindex(lower.index, fill_value=0).to_numpy(dtype=np.int64)
+    dens = np.divide(uw, wc, out=np.zeros(len(wc), dtype=float), where=wc > 0)
+    return wc, uw, dens
+
+def _strict_question(s: pd.Series, lower: pd.Series) -> np.ndarray:
+    """Vectorized v3.is_question_strict."""
+    stripped = lower.str.strip()
+    hit = np.zeros(len(s), dtype=bool)
+    for pat in STRICT_QUESTION_PATTERNS:
+        hit |= has_pattern(stripped, pat)
+    hit |= (s.str.strip().str.len() < 50).to_numpy(dtype=bool)
+    # "." sentence split: '?' pieces are already caught above, so only starters matter
+    pieces = s.str.split(".", regex=False).explode()
+    starts = pieces.str.strip().str.lower().str.match("|".join(STRICT_SENTENCE_STARTERS))
+    q_sents = starts.groupby(level=0).sum().reindex(s.index, fill_value=0).to_numpy(dtype=float)
+    n_sents = (s.str.count(r"\.") + 1).to_numpy(dtype=float)
+    hit |= (n_sents > 1) & (q_sents / n_sents > 0.3)
+    return hit
+
+def _meta_low_v3(lower: pd.Series) -> np.ndarray:
+    t = lower.str.strip()
+    n = t.str.len().to_numpy()
+    meta = has_pattern(t, any_rx(v3.META_PHRASES))
+    long_thanks = t.str.contains("thanks", regex=False).to_numpy(dtype=bool) & (n > 160)
+    short_reply = (n < 18) & has_pattern(t, any_rx(SHORT_REPLY_WORDS))
+    return (n == 0) | (meta & ~long_thanks) | (~meta & short_reply)
+
+def _meta_value(lower: pd.Series) -> np.ndarray:
+    n = lower.str.len().to_numpy()
+    return has_pattern(lower, any_rx(vf.META_PHRASES)) | ((n < 18) & has_pattern(lower, any_rx(SHORT_REPLY_WORDS)))
+
+def extract_features(posts) -> pd.DataFrame:
+    """Per-post feature columns shared by both scorers (posts should already be cleaned)."""
+    s = pd.Series(posts).fillna("").astype(str)
+    index = s.index
+    s = s.reset_index(drop=True)
+    lower = s.str.lower()
+
+    wc, uw, dens = _word_stats(lower)
+    program = count_terms(lower, v3.PROGRAM_SIGNALS)
+    past_tense = has_pattern(lower, any_rx(v3.PAST_TENSE_VERBS))
+    has_date = has_pattern(lower, DATE_RX.format(v3.MONTHS))
+    feats = pd.DataFrame({
+        "words": wc,
+        "unique_words": uw,
+        "density": dens,
+        "program_signals": program,
+        "has_money": has_pattern(lower, MONEY_RX),
+        "has_date": has_date,
+        "has_number": has_pattern(lower, NUMBER_RX),
+        "past_tense": past_tense,
+        "first_person": has_pattern(lower, FIRST_PERSON_RX),
+        "is_question": _strict_question(s, lower),
+        "is_meta_low": _meta_low_v3(lower),
+        "answer_regex": has_pattern(s, v3.ANSWER_REGEX.pattern, flags=re.IGNORECASE),
+        # value-filter specific; its term lists reuse the v3 column while they are equal
+        "vf_program_signals": program if vf.PROGRAM_TERMS == v3.PROGRAM_SIGNALS else count_terms(lower, vf.PROGRAM_TERMS),
+        "vf_has_date": has_date if vf.MONTHS == v3.MONTHS else has_pattern(lower, DATE_RX.format(vf.MONTHS)),
+        "vf_past_tense": past_tense if vf.PAST_TENSE == v3.PAST_TENSE_VERBS else has_pattern(lower, any_rx(vf.PAST_TENSE)),
+        "has_question": (s.str.contains("?", regex=False)
+                         | lower.str.strip().str.startswith(tuple(vf.QUESTION_STARTERS))).to_numpy(dtype=bool),
+        "is_meta": _meta_value(lower),
+        "is_speculative": has_pattern(lower, any_rx(vf.SPECULATIVE)),
+        "is_announcement": has_pattern(s, vf.ANNOUNCE_RX.pattern, flags=re.IGNORECASE),
+        "is_blank": (s.str.strip() == "").to_numpy(dtype=bool),
+    })
+    feats.index = index
+    return feats
+
+# --- Scores -----------------------------------------------------------------
+def _short(f: pd.DataFrame, min_words: int) -> np.ndarray:
+    return ((f["words"] < min_words) | (f["unique_words"] < 12)).to_numpy()
+
+def quality_scores(f: pd.DataFrame) -> np.ndarray:
+    """Vectorized v3.quality_score."""
+    wc = f["words"].to_numpy()
+    length_bonus = np.minimum(0.16, np.maximum(0.0, (wc - 28) * 0.0025))
+    dens_bonus = np.minimum(0.10, np.maximum(0.0, (f["density"].to_numpy() - 0.42) * 0.5))
+    prog_bonus = np.minimum(0.26, f["program_signals"].to_numpy() * 0.06)
+    sig_bonus = 0.05 * (f["has_money"].to_numpy(dtype=np.int64) + f["has_date"].to_numpy(dtype=np.int64)
+                        + f["has_number"].to_numpy(dtype=np.int64))
+    pt_bonus = np.where(f["past_tense"].to_numpy(), 0.08, 0.0)
+    fp_bonus = np.where(f["first_person"].to_numpy(), 0.06, 0.0)
+    penalty = np.where(f["is_meta_low"].to_numpy(), 0.10, 0.0) + np.where(_short(f, 22), 0.10, 0.0)
+    score = 0.50 + length_bonus + dens_bonus + prog_bonus + sig_bonus + pt_bonus + fp_bonus - penalty
+    return np.clip(score, 0.0, 1.0)
+
+def value_scores(f: pd.DataFrame) -> np.ndarray:
+    """Vectorized experience_value_filter.value_score."""
+    wc = f["words"].to_numpy()
+    length_bonus = np.minimum(0.14, np.maximum(0.0, (wc - 28) * 0.0025))
+    dens_bonus = np.minimum(0.10, np.maximum(0.0, (f["density"].to_numpy() - 0.42) * 0.5))
+    prog_bonus = np.minimum(0.24, f["vf_program_signals"].to_numpy() * 0.06)
+    sig_bonus = 0.05 * (f["has_money"].to_numpy(dtype=np.int64) + f["vf_has_date"].to_numpy(dtype=np.int64)
+                        + f["has_number"].to_numpy(dtype=np.int64))
+    pt_bonus = np.where(f["vf_past_tense"].to_numpy(), 0.08, 0.0)
+    fp_bonus = np.where(f["first_person"].to_numpy(), 0.06, 0.0)
+    penalty = np.where(f["is_speculative"].to_numpy(), 0.12, 0.0) + np.where(_short(f, 22), 0.10, 0.0)
+    score = 0.50 + length_bonus + dens_bonus + prog_bonus + sig_bonus + pt_bonus + fp_bonus - penalty
+    return np.clip(score, 0.0, 1.0)
+
+def _substantive(f: pd.DataFrame, prefix: str = "") -> np.ndarray:
+    """Shared tail of answer_like / passes_answer_gate (prefix "vf_") once the substance check passed."""
+    evidence = f[prefix + "has_date"] | f["has_money"] | f["has_number"]
+    return ((f[prefix + "past_tense"])
+            | ((f[prefix + "program_signals"] >= 1) & evidence)
+            | (f["first_person"] & (f["words"] >= 22))).to_numpy()
+
+def answer_like(f: pd.DataFrame) -> np.ndarray:
+    """Vectorized v3.answer_like."""
+    thin = ((f["words"] < 18) | (f["unique_words"] < 10)).to_numpy()
+    ok = _substantive(f) | f["answer_regex"].to_numpy()
+    return ~f["is_question"].to_numpy() & ~thin & ok
+
+def passes_answer_gate(f: pd.DataFrame) -> np.ndarray:
+    """Vectorized experience_value_filter.passes_answer_gate."""
+    # question_ratio > 0.5 implies a '?', which has_question already rejects
+    thin = ((f["words"] < 18) | (f["unique_words"] < 10)).to_numpy()
+    gated = f["is_blank"].to_numpy() | f["has_question"].to_numpy() | f["is_meta"].to_numpy()
+    return ~gated & (f["is_announcement"].to_numpy() | (~thin & _substantive(f, "vf_")))
+
+def score_posts(posts) -> pd.DataFrame:
+    """Features plus v3 quality and value-filter scores for a column of cleaned posts."""
+    f = extract_features(posts)
+    f["answer_like"] = answer_like(f)
+    f["quality_score"] = quality_scores(f)
+    f["passes_answer_gate"] = passes_answer_gate(f)
+    f["value_score"] = value_scores(f)
+    return f
+
+# --- Corpus rescoring ----------------------------------------------------------
+def load_posts(inputs: List[str]) -> pd.Series:
+    frames = []
+    for path in inputs:
+        if not os.path.exists(path):
+            print(f"Warning: {path} not found"); continue
+        frames.append(pd.read_csv(path, usecols=lambda c: c == "content", dtype=str))
+    if not frames:
+        return pd.Series([], dtype=str)
+    raw = pd.concat(frames, ignore_index=True)["content"].fillna("").str.strip()
+    return raw[raw != ""].reset_index(drop=True)
+
+def rescore(inputs: List[str], min_score: float = 0.65, min_value: float = 0.58) -> pd.DataFrame:
+    raw = load_posts(inputs)
+    clean = clean_series(raw)
+    clean = clean[clean != ""]
+    scored = score_posts(clean)
+    scored.insert(0, "content", clean)
+    scored["keep_quality"] = scored["answer_like"] & (scored["quality_score"] >= min_score)
+    scored["keep_value"] = scored["passes_answer_gate"] & (scored["value_score"] >= min_value)
+    return scored
+
+# --- CLI --------------------------------------------------------------------
+def main():
+    ap = argparse.ArgumentParser(description="Vectorized corpus rescoring for experience filters")
+    ap.add_argument("--in", dest="inputs", nargs="+",
+                    default=["law_raw.csv", "law_whirlpool_2018_2025.csv", "raw_all.csv"])
+    ap.add_argument("--minscore", dest="minscore", type=float, default=0.65, help="v3 quality threshold")
+    ap.add_argument("--min-value", dest="min_value", type=float, default=0.58, help="value-score threshold")
+    ap.add_argument("--out", dest="out", default=None, help="Write scored rows to CSV")
+    args = ap.parse_args()
+
+    t0 = time.perf_counter()
+    scored = rescore(args.inputs, args.minscore, args.min_value)
+    elapsed = time.perf_counter() - t0
+    print(f"Scored {len(scored)} posts in {elapsed:.2f}s")
+    print(f"  answers-only (v3): {int(scored['answer_like'].sum())}, kept >= {args.minscore}: {int(scored['keep_quality'].sum())}")
+    print(f"  value gate:        {int(scored['passes_answer_gate'].sum())}, kept >= {args.min_value}: {int(scored['keep_value'].sum())}")
+    if args.out:
+        os.makedirs(os.path.dirname(args.out) or ".", exist_ok=True)
+        scored.to_csv(args.out, index=False)
+        print(f"Wrote {args.out}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,260 @@
+# experience_engine.py
+# One scoring engine for forum experiences. The corpus is read, cleaned and
+# firm-matched once, a shared feature frame is extracted once, and every filter
+# variant (strict / value / lenient / legacy / basic) is a scoring profile over
+# those features. Adding a filter = registering a profile.
+
+import os, re, time, argparse
+from typing import Callable, Dict, List, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+import experience_batch as eb
+import experience_filter as basic
+import experience_quality as v1
+import experience_quality_v2 as v2
+from experience_batch import any_rx, count_terms, has_pattern
+from extractors import FIRM_ALIASES
+
+DEFAULT_INPUTS = ["law_raw.csv", "law_whirlpool_2018_2025.csv", "raw_all.csv"]
+SHORT_REPLY_WORDS = eb.SHORT_REPLY_WORDS
+BASIC_MONTH_RX = r"\b(jan|feb|mar|apr|may|jun|jul|aug|sep|oct|nov|dec)\b"
+
+# --- Firm match (one compiled pattern per firm, same order as match_firm) ---
+FIRM_PATTERNS: List[Tuple[str, str]] = [
+    (canonical, r"\b(?:" + "|".join(re.escape(a.lower()) for a in [canonical] + aliases) + r")\b")
+    for canonical, aliases in FIRM_ALIASES.items()
+]
+
+def match_firms(text: pd.Series, title: pd.Series) -> pd.Series:
+    """Vectorized match_firm: first firm (in FIRM_ALIASES order) named in text or title."""
+    hay = (text.fillna("") + " " + title.fillna("")).str.lower()
+    conds = [has_pattern(hay, rx) for _, rx in FIRM_PATTERNS]
+    names = [canonical for canonical, _ in FIRM_PATTERNS]
+    return pd.Series(np.select(conds, names, default=""), index=text.index)
+
+# --- Shared features ----------------------------------------------------------
+def _meta_low(lower: pd.Series, phrases: List[str], short_len: int, keep_long_thanks: bool) -> np.ndarray:
+    t = lower.str.strip()
+    n = t.str.len().to_numpy()
+    meta = has_pattern(t, any_rx(phrases))
+    if keep_long_thanks:
+        meta = meta & ~(t.str.contains("thanks", regex=False).to_numpy(dtype=bool) & (n > 160))
+    short_reply = (n < short_len) & has_pattern(t, any_rx(SHORT_REPLY_WORDS))
+    return (n == 0) | meta | short_reply
+
+def _simple_question(s: pd.Series, lower: pd.Series, starters: List[str]) -> np.ndarray:
+    t = lower.str.strip()
+    return (t.str.endswith("?") | t.str.startswith(tuple(starters))
+            | (s.str.count(r"\?") >= 2)).to_numpy(dtype=bool)
+
+def _basic_clean(s: pd.Series) -> pd.Series:
+    """Vectorized experience_filter.clean_content (its length check re-cleans the text)."""
+    t = s.str.replace(r'^User #\d+.*?(?:Forum Regular|Participant|Whirlpool Enthusiast|Forum Addict).*?reference:.*?whrl\.pl/\w+.*?posted.*?(?:AEST|AEDT)',
+                      '', regex=True, flags=re.IGNORECASE | re.DOTALL)
+    t = t.str.replace(r'User #\d+', '', regex=True, flags=re.IGNORECASE)
+    t = t.str.replace(r'@\w+', '', regex=True)
+    t = t.str.replace(r'posted\s+\d{4}-[A-Za-z]{3}-\d{2},\s+\d{1,2}:\d{2}\s+[ap]m\s+(?:AEST|AEDT)', '',
+                      regex=True, flags=re.IGNORECASE)
+    t = t.str.replace(r'\s+', ' ', regex=True).str.strip()
+    return t.mask((t.str.len() < 5) | t.str.lower().isin(['deleted', 'edited']), '')
+
+def extract_features(posts) -> pd.DataFrame:
+    """Every feature any registered profile reads, computed in one pass over cleaned posts."""
+    f = eb.extract_features(posts)
+    s = pd.Series(posts).fillna("").astype(str).reset_index(drop=True)
+    lower = s.str.lower()
+    basic_clean = _basic_clean(s)
+    n_sents = s.str.count(r"[^!?\.]+[!?\.]").to_numpy(dtype=float)
+    n_qsents = s.str.count(r"[^!?\.]+\?").to_numpy(dtype=float)
+    extra = {
+        "question_ratio": np.divide(n_qsents, n_sents, out=np.zeros(len(s)), where=n_sents > 0),
+        "chars_basic": basic_clean.str.len().to_numpy(),
+        "unique_tokens_basic": basic_clean.str.lower().str.findall(r"\b\w+\b").map(lambda w: len(set(w))).to_numpy(),
+        # experience_quality (v1)
+        "program_signals_v1": count_terms(lower, v1.PROGRAM_SIGNALS),
+        "past_tense_v1": has_pattern(lower, any_rx(v1.PAST_TENSE_VERBS)),
+        "is_question_v1": _simple_question(s, lower, v1.QUESTION_STARTERS),
+        "is_meta_v1": _meta_low(lower, v1.META_PHRASES, 20, True),
+        # experience_quality_v2
+        "program_signals_v2": count_terms(lower, v2.PROGRAM_SIGNALS),
+        "past_tense_v2": has_pattern(lower, any_rx(v2.PAST_TENSE_VERBS)),
+        "is_question_v2": _simple_question(s, lower, v2.QUESTION_STARTERS),
+        "is_meta_v2": _meta_low(lower, v2.META_PHRASES, 18, True),
+        # experience_filter
+        "program_any_basic": has_pattern(lower, any_rx(basic.PROGRAM_SIGNALS)),
+        "past_tense_basic": has_pattern(lower, any_rx(basic.PAST_TENSE_VERBS)),
+        "is_question_basic": _simple_question(s, lower, basic.QUESTION_STARTERS),
+        "is_meta_basic": _meta_low(lower, basic.META_PHRASES, 20, False),
+        "has_numbers_basic": (s.str.contains("$", regex=False).to_numpy(dtype=bool)
+                              | has_pattern(lower, BASIC_MONTH_RX) | f["has_number"].to_numpy()),
+    }
+    for name, col in extra.items():
+        f[name] = col
+    return f
+
+# --- Profiles ---------------------------------------------------------------
+# Each profile maps the feature frame to (score array, gate mask). A post is kept
+# when it passes the gate and scores at least the profile's min_score.
+PROFILES: Dict[str, Dict] = {}
+
+def profile(name: str, min_score: float, description: str = ""):
+    def register(fn: Callable[[pd.DataFrame], Tuple[np.ndarray, np.ndarray]]):
+        PROFILES[name] = {"name": name, "fn": fn, "min_score": min_score, "description": description}
+        return fn
+    return register
+
+def _col(f: pd.DataFrame, name: str) -> np.ndarray:
+    return f[name].to_numpy()
+
+@profile("strict", 0.65, "answers-only (experience_quality_v3)")
+def strict_profile(f):
+    return eb.quality_scores(f), eb.answer_like(f)
+
+@profile("value", 0.58, "answers + announcements (experience_value_filter)")
+def value_profile(f):
+    return eb.value_scores(f), eb.passes_answer_gate(f)
+
+@profile("lenient", 0.55, "short-post friendly, questions excluded (experience_quality_v2)")
+def lenient_profile(f):
+    wc, uw = _col(f, "words"), _col(f, "unique_words")
+    ps = _col(f, "program_signals_v2")
+    length_bonus = np.where(wc >= 30, np.minimum(0.18, (wc - 30) * 0.0025), 0.0)
+    dens_bonus = np.minimum(0.10, np.maximum(0.0, (_col(f, "density") - 0.42) * 0.5))
+    prog_bonus = np.minimum(0.28, ps * 0.06)
+    sig_bonus = 0.05 * (_col(f, "has_money").astype(np.int64) + _col(f, "has_date").astype(np.int64)
+                        + _col(f, "has_number").astype(np.int64))
+    pt_bonus = np.where(_col(f, "past_tense_v2"), 0.08, 0.0)
+    fp_bonus = np.where(_col(f, "first_person"), 0.06, 0.0)
+    mostly_q = (_col(f, "is_question_v2") & (_col(f, "question_ratio") >= 0.66)
+                & (ps == 0) & ~_col(f, "has_number"))
+    penalty = (np.where((wc < 25) | (uw < 12), 0.12, 0.0) + np.where(mostly_q, 0.18, 0.0)
+               + np.where(_col(f, "is_meta_v2"), 0.12, 0.0))
+    score = 0.45 + length_bonus + dens_bonus + prog_bonus + sig_bonus + pt_bonus + fp_bonus - penalty
+    return np.clip(score, 0.0, 1.0), ~_col(f, "is_question_v2")
+
+@profile("legacy", 0.60, "long-post model, questions excluded (experience_quality)")
+def legacy_profile(f):
+    wc, uw = _col(f, "words"), _col(f, "unique_words")
+    length_bonus = np.where(wc >= 60, np.minimum(0.20, (wc - 60) / 1000 * 200), 0.0)
+    dens_bonus = np.minimum(0.10, np.maximum(0.0, (_col(f, "density") - 0.45) * 0.5))
+    prog_bonus = np.minimum(0.20, _col(f, "program_signals_v1") * 0.05)
+    sig_count = (_col(f, "has_money").astype(np.int64) + _col(f, "has_date").astype(np.int64)
+                 + _col(f, "has_number").astype(np.int64))
+    sig_bonus = np.where(sig_count >= 2, 0.10, np.where(sig_count == 1, 0.05, 0.0))
+    past_bonus = np.where(_col(f, "past_tense_v1"), 0.10, 0.0)
+    penalty = (np.where((wc < 80) | (uw < 20), 0.20, 0.0)
+               + np.where(_col(f, "is_question_v1") & (wc < 120), 0.25, 0.0)
+               + np.where(_col(f, "is_meta_v1"), 0.15, 0.0))
+    score = 0.40 + length_bonus + dens_bonus + prog_bonus + sig_bonus + past_bonus - penalty
+    return np.clip(score, 0.0, 1.0), ~_col(f, "is_question_v1")
+
+@profile("basic", 0.50, "original keyword filter (experience_filter)")
+def basic_profile(f):
+    short = (_col(f, "chars_basic") < 100) | (_col(f, "unique_tokens_basic") < 15)
+    score = np.full(len(f), 0.5)
+    score = score + np.where(_col(f, "program_any_basic"), 0.25, 0.0)
+    score = score + np.where(_col(f, "has_numbers_basic"), 0.1, 0.0)
+    score = score + np.where(_col(f, "past_tense_basic"), 0.1, 0.0)
+    score = score + np.where(~short, 0.1, 0.0)
+    score = score - np.where(_col(f, "is_question_basic"), 0.5, 0.0)
+    score = score - np.where(_col(f, "is_meta_basic"), 0.2, 0.0)
+    score = score - np.where(short, 0.2, 0.0)
+    return np.clip(score, 0.0, 1.0), ~_col(f, "is_question_basic")
+
+# --- Corpus -------------------------------------------------------------------
+_CORPUS_CACHE: Dict[Tuple, pd.DataFrame] = {}
+
+def load_corpus(inputs: Optional[List[str]] = None) -> pd.DataFrame:
+    """Read, clean, firm-match and featurize the raw CSVs once (memoized on file mtimes)."""
+    inputs = inputs or DEFAULT_INPUTS
+    key = tuple((p, os.path.getmtime(p)) for p in inputs if os.path.exists(p))
+    if key in _CORPUS_CACHE:
+        return _CORPUS_CACHE[key]
+
+    frames = []
+    for path in inputs:
+        if not os.path.exists(path):
+            print(f"Warning: {path} not found"); continue
+        df = pd.read_csv(path, dtype=str)
+        for col in ["thread_title", "thread_url", "timestamp", "content"]:
+            if col not in df.columns:
+                df[col] = ""
+        frames.append(df[["thread_title", "thread_url", "timestamp", "content"]])
+    if not frames:
+        return pd.DataFrame()
+
+    df = pd.concat(frames, ignore_index=True).fillna("")
+    df["raw_content"] = df["content"].str.strip()
+    df["content"] = eb.clean_series(df["raw_content"])
+    df = df[df["content"] != ""]
+    df["firm_name"] = match_firms(df["content"], df["thread_title"])
+    df = df[df["firm_name"] != ""].reset_index(drop=True)
+
+    corpus = pd.concat([df, extract_features(df["content"])], axis=1)
+    _CORPUS_CACHE.clear()
+    _CORPUS_CACHE[key] = corpus
+    return corpus
+
+def evaluate(corpus: pd.DataFrame, profiles: Optional[List[str]] = None,
+             thresholds: Optional[Dict[str, float]] = None) -> pd.DataFrame:
+    """Add `<profile>_score` / `<profile>_keep` columns for each requested profile."""
+    out = corpus.copy()
+    thresholds = thresholds or {}
+    for name in profiles or list(PROFILES):
+        spec = PROFILES[name]
+        score, gate = spec["fn"](corpus)
+        out[f"{name}_score"] = score
+        out[f"{name}_keep"] = gate & (score >= thresholds.get(name, spec["min_score"]))
+    return out
+
+def compare(scored: pd.DataFrame, a: str, b: str) -> Dict[str, float]:
+    """A/B summary of which posts two profiles keep."""
+    ka, kb = scored[f"{a}_keep"].to_numpy(), scored[f"{b}_keep"].to_numpy()
+    both, either = int((ka & kb).sum()), int((ka | kb).sum())
+    return {
+        f"{a}_kept": int(ka.sum()), f"{b}_kept": int(kb.sum()),
+        "both": both, f"only_{a}": int((ka & ~kb).sum()), f"only_{b}": int((kb & ~ka).sum()),
+        "jaccard": round(both / either, 3) if either else 1.0,
+    }
+
+def rows_for_firm(firm_name: str, profile_name: str = "strict", inputs: Optional[List[str]] = None) -> pd.DataFrame:
+    """Kept posts for one firm under one profile, best first."""
+    corpus = load_corpus(inputs)
+    if corpus.empty:
+        return corpus
+    firm_rows = corpus[corpus["firm_name"].str.lower() == firm_name.lower()]
+    scored = evaluate(firm_rows, [profile_name])
+    kept = scored[scored[f"{profile_name}_keep"]]
+    return kept.sort_values(f"{profile_name}_score", ascending=False)
+
+# --- CLI --------------------------------------------------------------------
+def main():
+    ap = argparse.ArgumentParser(description="Score forum experiences under every filter profile")
+    ap.add_argument("--in", dest="inputs", nargs="+", default=DEFAULT_INPUTS)
+    ap.add_argument("--profiles", nargs="+", default=None, choices=sorted(PROFILES))
+    ap.add_argument("--firm", dest="firm", default=None, help="Optional firm canonical name")
+    ap.add_argument("--compare", nargs=2, metavar=("A", "B"), default=None, help="A/B two profiles")
+    ap.add_argument("--out", dest="out", default=None, help="Write scored rows to CSV")
+    args = ap.parse_args()
+
+    t0 = time.perf_counter()
+    corpus = load_corpus(args.inputs)
+    if args.firm:
+        corpus = corpus[corpus["firm_name"].str.lower() == args.firm.lower()]
+    t1 = time.perf_counter()
+    scored = evaluate(corpus, args.profiles)
+    t2 = time.perf_counter()
+    print(f"Featurized {len(corpus)} firm posts in {t1 - t0:.2f}s; scored profiles in {t2 - t1:.3f}s")
+    for name in args.profiles or list(PROFILES):
+        print(f"  {name:<8} kept {int(scored[f'{name}_keep'].sum()):>5}  ({PROFILES[name]['description']})")
+    if args.compare:
+        print("  " + ", ".join(f"{k}={v}" for k, v in compare(scored, *args.compare).items()))
+    if args.out:
+        os.makedirs(os.path.dirname(args.out) or ".", exist_ok=True)
+        scored.to_csv(args.out, index=False)
+        print(f"Wrote {args.out}")
+
+if __name__ == "__main__":
+    main()
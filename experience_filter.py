@@ -4,6 +4,28 @@ import argparse
 from typing import List, Dict, Optional
 from extractors import FIRM_ALIASES
 
+QUESTION_STARTERS = [
+    'anyone know', 'does anyone', 'has anyone', 'is it true', 'should i',
+    'where can i', 'what are', 'when do', 'how long', 'how do'
+]
+
+META_PHRASES = [
+    'bump', 'following', 'subscribing', 'any updates', 'thanks', 'lol',
+    'lmao', 'haha', 'dm me', 'pm me', 'off-topic'
+]
+
+PROGRAM_SIGNALS = [
+    'offer', 'rejected', 'accepted', 'clerkship', 'graduate program',
+    'rotation', 'ac', 'assessment centre', 'superday', 'paralegal',
+    'salary', 'pay', 'remuneration', 'benefits', 'billable', 'hours',
+    'culture', 'mentor', 'secondment', 'seat', 'practice group', 'training'
+]
+
+PAST_TENSE_VERBS = [
+    'received', 'accepted', 'completed', 'did', 'worked', 'went',
+    'rotated', 'attended', 'participated', 'finished', 'started'
+]
+
 def clean_content(content: str) -> str:
     """Clean forum artifacts and metadata from content - less aggressive version"""
     if not content:
@@ -40,12 +62,7 @@ def is_question(content: str) -> bool:
         return True
 
     # Question starters
-    question_starters = [
-        'anyone know', 'does anyone', 'has anyone', 'is it true', 'should i',
-        'where can i', 'what are', 'when do', 'how long', 'how do'
-    ]
-
-    for starter in question_starters:
+    for starter in QUESTION_STARTERS:
         if content_lower.startswith(starter):
             return True
 
@@ -62,12 +79,7 @@ def is_meta_low(content: str) -> bool:
 
     content_lower = content.lower().strip()
 
-    meta_phrases = [
-        'bump', 'following', 'subscribing', 'any updates', 'thanks', 'lol',
-        'lmao', 'haha', 'dm me', 'pm me', 'off-topic'
-    ]
-
-    for phrase in meta_phrases:
+    for phrase in META_PHRASES:
         if phrase in content_lower:
             return True
 
@@ -102,14 +114,7 @@ def has_program_signals(content: str) -> bool:
 
     content_lower = content.lower()
 
-    signals = [
-        'offer', 'rejected', 'accepted', 'clerkship', 'graduate program',
-        'rotation', 'ac', 'assessment centre', 'superday', 'paralegal',
-        'salary', 'pay', 'remuneration', 'benefits', 'billable', 'hours',
-        'culture', 'mentor', 'secondment', 'seat', 'practice group', 'training'
-    ]
-
-    return any(signal in content_lower for signal in signals)
+    return any(signal in content_lower for signal in PROGRAM_SIGNALS)
 
 def has_numbers(content: str) -> bool:
     """Check if content contains dates, money, or other numbers"""
@@ -144,12 +149,7 @@ def past_tense_hint(content: str) -> bool:
 
     content_lower = content.lower()
 
-    past_verbs = [
-        'received', 'accepted', 'completed', 'did', 'worked', 'went',
-        'rotated', 'attended', 'participated', 'finished', 'started'
-    ]
-
-    return any(verb in content_lower for verb in past_verbs)
+    return any(verb in content_lower for verb in PAST_TENSE_VERBS)
 
 def compute_quality_score(content: str) -> float:
     """Compute quality score from 0 to 1"""
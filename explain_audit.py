@@ -0,0 +1,194 @@
+# explain_audit.py
+# Query-plan audit for db_auth. Seeds a local database (loadtest's tracker
+# data plus seed_db's Auslaw corpus), runs every db_auth query function once
+# while recording the SQL it sends, then EXPLAINs each statement and fails if
+# a plan scans a whole large table, apart from the reads in FULL_SCANS that
+# want every row.
+#
+#   python explain_audit.py --database-url postgresql://localhost/lawgrad_test
+#   python explain_audit.py                     # SQLite stand-in in a temp dir
+#
+# Exit status is 1 on any unexpected scan, so it can gate a schema change.
+# Seeding deletes and re-inserts the loadtest/seed rows: point it at a scratch
+# database, never production.
+
+import os, re, sys, argparse, tempfile
+from typing import Dict, List, Tuple
+
+LARGE_TABLES = {'applications', 'submissions', 'users'}
+# db_auth functions that read every row on purpose (site-wide analytics)
+FULL_SCANS = {'get_all_submissions', 'get_all_applications'}
+DML = ('SELECT', 'INSERT', 'UPDATE', 'DELETE', 'WITH')
+
+class _RecordingCursor:
+    """Cursor proxy that logs each statement before running it"""
+
+    def __init__(self, cur, log):
+        self._cur, self._log = cur, log
+
+    def execute(self, sql, params=None):
+        self._log.append((sql, params))
+        return self._cur.execute(sql) if params is None else self._cur.execute(sql, params)
+
+    def executemany(self, sql, seq_of_params):
+        seq_of_params = list(seq_of_params)
+        self._log.append((sql, seq_of_params[0] if seq_of_params else None))
+        return self._cur.executemany(sql, seq_of_params)
+
+    def __getattr__(self, name):
+        return getattr(self._cur, name)
+
+class _RecordingConnection:
+    def __init__(self, conn, log):
+        self._conn, self._log = conn, log
+
+    def cursor(self, *args, **kwargs):
+        return _RecordingCursor(self._conn.cursor(*args, **kwargs), self._log)
+
+    def __getattr__(self, name):
+        return getattr(self._conn, name)
+
+def seed(database_url: str, applications: int, users: int):
+    import loadtest, seed_db, db_indexes
+    print(f"Seeding {applications} applications for {users} users, plus the Auslaw corpus...")
+    loadtest.seed_database(database_url, applications=applications, users=users)
+    seed_db.seed(database_url)
+    db_indexes.apply(database_url)
+    from db_auth import get_db_connection
+    conn = get_db_connection()
+    cur = conn.cursor()
+    cur.execute("ANALYZE")   # fresh statistics, so the planner sees the real table sizes
+    conn.commit()
+    conn.close()
+
+def workload(user_id: str, company: str):
+    """(name, call) for every db_auth function that queries the database"""
+    import db_auth
+    from flask import Flask
+    app = Flask(__name__)
+    headers = {'X-Replit-User-Id': user_id, 'X-Replit-User-Name': user_id}
+    application = {'company': company, 'role': 'Graduate', 'application_date': '2025-03-01',
+                   'status': 'Applied', 'priority': 'High', 'notes': 'explain_audit'}
+    submission = {'company': company, 'role': 'Graduate', 'experience_type': 'Graduate Program',
+                  'theme': 'Other', 'advice': 'explain_audit'}
+    state = {}
+
+    def current_user():
+        with app.test_request_context(headers=headers):
+            return db_auth.get_current_user()
+
+    def create():
+        state['app'] = db_auth.create_application(user_id, application)
+        return state['app']
+
+    return [
+        ('get_current_user', current_user),
+        ('get_user_applications', lambda: db_auth.get_user_applications(user_id)),
+        ('iter_user_applications', lambda: list(db_auth.iter_user_applications(user_id))),
+        ('create_application', create),
+        ('update_application', lambda: db_auth.update_application(state['app']['id'], user_id,
+                                                                    dict(application, status='Rejected'))),
+        ('delete_application', lambda: db_auth.delete_application(state['app']['id'], user_id)),
+        ('get_company_applications', lambda: db_auth.get_company_applications(company.upper())),
+        ('create_submission', lambda: db_auth.create_submission(user_id, submission)),
+        ('get_company_submissions', lambda: db_auth.get_company_submissions(company.upper())),
+        ('get_company_summaries', db_auth.get_company_summaries),
+        ('get_submissions_by_ids', lambda: db_auth.get_submissions_by_ids([1, 2, 3])),
+        ('get_all_submissions', db_auth.get_all_submissions),
+        ('get_all_applications', db_auth.get_all_applications),
+    ]
+
+def record(calls) -> List[Tuple[str, str, object]]:
+    """Run each call with db_auth's connections recorded: [(function, sql, params)]"""
+    import db_auth
+    connect = db_auth.get_db_connection
+    statements = []
+    try:
+        for name, call in calls:
+            log = []
+            db_auth.get_db_connection = lambda log=log: _RecordingConnection(connect(), log)
+            call()
+            statements += [(name, sql, params) for sql, params in log
+                           if sql.lstrip().upper().startswith(DML)]
+    finally:
+        db_auth.get_db_connection = connect
+    return statements
+
+# --- Plans --------------------------------------------------------------------
+def _postgres_scans(plan: Dict, out: List):
+    if plan.get('Node Type') == 'Seq Scan':
+        out.append(plan.get('Relation Name'))
+    for child in plan.get('Plans', ()):
+        _postgres_scans(child, out)
+
+_ALIAS = re.compile(r'\b(?:FROM|JOIN|UPDATE|INTO)\s+(\w+)(?:\s+(?:AS\s+)?(\w+))?', re.IGNORECASE)
+
+def explain(cur, dialect: str, sql: str, params) -> Tuple[List[str], List[str]]:
+    """(plan lines, tables read by a full sequential scan) for one statement"""
+    args = () if params is None else params
+    if dialect == 'sqlite':
+        cur.execute("EXPLAIN QUERY PLAN " + sql, args)
+        lines = [r['detail'] for r in cur.fetchall()]
+        aliases = {}
+        for table, alias in _ALIAS.findall(sql):
+            aliases[table] = table
+            if alias and alias.upper() not in ('ON', 'WHERE', 'LEFT', 'JOIN', 'ORDER', 'VALUES', 'SET'):
+                aliases[alias] = table
+        # "SCAN s [USING (COVERING) INDEX ...]" reads every row; "SEARCH s ..." is a lookup
+        scans = [aliases.get(m.group(1), m.group(1)) for m in (re.match(r'SCAN (\w+)', d) for d in lines) if m]
+        return lines, scans
+    cur.execute("EXPLAIN (FORMAT JSON) " + sql, args)
+    row = cur.fetchone()
+    plan = (row['QUERY PLAN'] if isinstance(row, dict) else row[0])[0]['Plan']
+    cur.execute("EXPLAIN " + sql, args)
+    lines = [r['QUERY PLAN'] if isinstance(r, dict) else r[0] for r in cur.fetchall()]
+    scans = []
+    _postgres_scans(plan, scans)
+    return lines, scans
+
+def audit(statements, verbose: bool = False) -> bool:
+    from db_auth import get_db_connection
+    conn = get_db_connection()
+    dialect = getattr(conn, 'dialect', 'postgres')
+    cur = conn.cursor()
+    ok = True
+    seen = set()
+    try:
+        for name, sql, params in statements:
+            if (name, sql) in seen:
+                continue
+            seen.add((name, sql))
+            lines, scans = explain(cur, dialect, sql, params)
+            bad = [t for t in scans if t in LARGE_TABLES and name not in FULL_SCANS]
+            ok &= not bad
+            status = 'FAIL' if bad else 'full scan (allowed)' if name in FULL_SCANS and scans else 'OK'
+            print(f"== {name}: {status}")
+            print(f"   {' '.join(sql.split())[:110]}")
+            for line in (lines if verbose or bad else [l for l in lines if 'Scan' in l or 'SCAN' in l or 'SEARCH' in l]):
+                print(f"     {line.strip()}")
+            for t in bad:
+                print(f"   ! sequential scan on {t}")
+    finally:
+        conn.rollback()
+        conn.close()
+    return ok
+
+def main():
+    ap = argparse.ArgumentParser(description="EXPLAIN every db_auth query against a seeded database")
+    ap.add_argument("--database-url", help="Scratch database to seed (default: a temp SQLite file)")
+    ap.add_argument("--applications", type=int, default=50000)
+    ap.add_argument("--users", type=int, default=2000)
+    ap.add_argument("--no-seed", action="store_true", help="Use the database as it is")
+    ap.add_argument("--verbose", action="store_true", help="Print whole plans")
+    args = ap.parse_args()
+
+    database_url = args.database_url or f"sqlite:///{os.path.join(tempfile.mkdtemp(), 'explain.db')}"
+    os.environ["DATABASE_URL"] = database_url
+    if not args.no_seed:
+        seed(database_url, args.applications, args.users)
+    import loadtest
+    ok = audit(record(workload(f"{loadtest.USER_PREFIX}0", 'Allens')), args.verbose)
+    sys.exit(0 if ok else 1)
+
+if __name__ == "__main__":
+    main()
@@ -7,6 +7,7 @@ from extractors import (
     detect_salary, detect_length_months, detect_rotations, find_dates_near_keywords,
     extract_evidence_span, score_confidence, parse_timestamp_to_utcish, parse_date_to_iso
 )
+from label_signals import label_frame
 
 DEFAULT_INPUTS = [
     "law_raw.csv",
@@ -124,6 +125,8 @@ def main(in_paths=None, out_csv="out/grad_program_signals.csv", out_parquet="out
         "salary_annual_aud","evidence_span","thread_title","thread_url","post_number","post_timestamp",
         "source_file","confidence","created_at"
     ])
+    # categories + sanitized evidence, so the firm page doesn't classify per view
+    label_frame(out_df)
 
     os.makedirs(os.path.dirname(out_csv), exist_ok=True)
     out_df.to_csv(out_csv, index=False)
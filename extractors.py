@@ -1,13 +1,20 @@
 
 import re
+import importlib.util
 from datetime import datetime, timedelta
 from typing import Optional, Dict, List
 
-try:
-    from dateutil import parser as du_parser
-    HAVE_DATEUTIL = True
-except Exception:
-    HAVE_DATEUTIL = False
+# dateutil is only needed by the date parsers, so it's imported on first use
+# rather than by everything that wants FIRM_ALIASES
+HAVE_DATEUTIL = importlib.util.find_spec("dateutil") is not None
+_du_parser = None
+
+def _dateutil_parser():
+    global _du_parser
+    if _du_parser is None:
+        from dateutil import parser
+        _du_parser = parser
+    return _du_parser
 
 FIRM_ALIASES: Dict[str, List[str]] = {
     "Clayton Utz": ["clayton utz", "clutz", "claytons"],
@@ -71,7 +78,7 @@ def parse_date_to_iso(s: str) -> Optional[str]:
         return None
     if HAVE_DATEUTIL:
         try:
-            dt = du_parser.parse(s, dayfirst=True, fuzzy=True)
+            dt = _dateutil_parser().parse(s, dayfirst=True, fuzzy=True)
             return dt.date().isoformat()
         except Exception:
             pass
@@ -116,7 +123,7 @@ def parse_timestamp_to_utcish(raw: str) -> str:
     clean = re.sub(r"\b(AEST|AEDT)\b", "", raw, flags=re.IGNORECASE)
     if HAVE_DATEUTIL:
         try:
-            dt = du_parser.parse(clean, dayfirst=True, fuzzy=True)
+            dt = _dateutil_parser().parse(clean, dayfirst=True, fuzzy=True)
             if tz:
                 from datetime import timedelta
                 dt = dt + timedelta(hours=tz_offset)
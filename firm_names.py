@@ -0,0 +1,86 @@
+# firm_names.py
+# Company-name normalization against extractors.FIRM_ALIASES. The alias table is
+# indexed once into dicts (exact lowercase key, then '&'/'+'-spaced key), with an
+# optional trigram-shortlisted fuzzy fallback for typos ("Clayton Utx").
+# Used by main.py at submit time and by the bulk importers.
+
+import difflib
+from collections import defaultdict
+from functools import lru_cache
+from typing import Dict, List, Optional, Set, Tuple
+from extractors import FIRM_ALIASES
+
+FUZZY_MIN_RATIO = 0.85   # difflib ratio needed to accept a fuzzy match
+FUZZY_MIN_LEN = 5        # shorter keys/inputs ("cc", "dla", "hsf") are never fuzzy-matched
+
+def _spaced(s: str) -> str:
+    return s.replace('&', ' & ').replace('+', ' + ')
+
+def _build_indexes():
+    # Insertion order mirrors the old linear scans: every canonical name, then
+    # every alias, then the spaced forms - the first firm to claim a key wins.
+    exact: Dict[str, str] = {}
+    for canonical in FIRM_ALIASES:
+        exact.setdefault(canonical.lower(), canonical)
+    for canonical, aliases in FIRM_ALIASES.items():
+        for alias in aliases:
+            exact.setdefault(alias.lower(), canonical)
+    spaced: Dict[str, str] = {}
+    for canonical, aliases in FIRM_ALIASES.items():
+        for name in [canonical] + aliases:
+            spaced.setdefault(_spaced(name.lower()), canonical)
+    return exact, spaced
+
+EXACT_INDEX, SPACED_INDEX = _build_indexes()
+
+def _trigrams(s: str) -> Set[str]:
+    s = f"  {s} "
+    return {s[i:i + 3] for i in range(len(s) - 2)}
+
+def _build_trigram_index() -> Dict[str, Tuple[str, ...]]:
+    index: Dict[str, List[str]] = defaultdict(list)
+    for key in EXACT_INDEX:
+        if len(key) >= FUZZY_MIN_LEN:
+            for tri in _trigrams(key):
+                index[tri].append(key)
+    # Read-only after import: plain dict of tuples (shared across preforked workers)
+    return {tri: tuple(keys) for tri, keys in index.items()}
+
+TRIGRAM_INDEX = _build_trigram_index()
+
+@lru_cache(maxsize=4096)
+def fuzzy_firm(key: str) -> Optional[str]:
+    """Closest canonical firm for a lowercased name, or None if nothing is close enough."""
+    if len(key) < FUZZY_MIN_LEN:
+        return None
+    shared: Dict[str, int] = defaultdict(int)
+    for tri in _trigrams(key):
+        for candidate in TRIGRAM_INDEX.get(tri, ()):
+            shared[candidate] += 1
+    best, best_ratio = None, FUZZY_MIN_RATIO
+    # Only the keys sharing the most trigrams are worth an edit-distance check
+    for candidate in sorted(shared, key=lambda k: -shared[k])[:10]:
+        ratio = difflib.SequenceMatcher(None, key, candidate).ratio()
+        if ratio >= best_ratio:
+            best, best_ratio = candidate, ratio
+    return EXACT_INDEX[best] if best else None
+
+def canonical_firm(company_name: str, fuzzy: bool = False) -> Optional[str]:
+    """Canonical FIRM_ALIASES name for a company, or None if it isn't a known firm."""
+    if not company_name:
+        return None
+    key = company_name.strip().lower()
+    firm = EXACT_INDEX.get(key)
+    if firm:
+        return firm
+    firm = SPACED_INDEX.get(' '.join(_spaced(key).split()))
+    if firm or not fuzzy:
+        return firm
+    return fuzzy_firm(' '.join(key.split()))
+
+def normalize_company_name(company_name: str, fuzzy: bool = False) -> str:
+    """Normalize company name using firm aliases to handle spaces, nicknames, and variations."""
+    if not company_name:
+        return company_name
+    # Return original if no match found (but title case it)
+    return canonical_firm(company_name, fuzzy) or company_name.strip().title()
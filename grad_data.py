@@ -1,8 +1,7 @@
 from collections import Counter
 from statistics import mean
 from datetime import datetime, date
-import csv
-import os
+from shared_data import signal_table
 
 PROGRAM_LABELS = {
   "graduate":"Graduate Program","clerkship":"Clerkship","summer_clerkship":"Summer Clerkship",
@@ -21,20 +20,14 @@ def _d(x):
   except: return None
 
 def load_grad_signals(csv_path):
-  if not os.path.exists(csv_path):
-    return []
-
-  signals = []
-  with open(csv_path, 'r', encoding='utf-8') as f:
-    reader = csv.DictReader(f)
-    for row in reader:
-      # Remove username/author fields for privacy
-      clean_row = dict(row)
-      for field in ['author', 'username', 'user', 'Author', 'User', 'USERNAME', 'name', 'Name']:
-        if field in clean_row:
-          del clean_row[field]
-      signals.append(clean_row)
-  return signals
+  # Rows come from the shared table (parsed once, author fields already dropped)
+  table = signal_table(csv_path)
+  return table.rows() if table else []
+
+def load_firm_signals(csv_path, firm_name):
+  """load_grad_signals() rows for one firm (case-insensitive), via the table's firm index."""
+  table = signal_table(csv_path)
+  return table.firm_rows(firm_name) if table else []
 
 def aggregate_by_firm(rows):
   firms = {}
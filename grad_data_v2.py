@@ -1,9 +1,9 @@
 
 # grad_data_v2.py
-import csv
 from collections import Counter
 from statistics import mean
 from datetime import datetime, date
+from shared_data import signal_table
 
 PROGRAM_LABELS = {
     "graduate": "Graduate Program",
@@ -25,23 +25,14 @@ def _d(x):
         return datetime.strptime(x.strip(), "%Y-%m-%d").date()
     except: return None
 
+SIGNAL_FIELDS = ("firm_name", "program_type", "city", "intake_year",
+                 "application_close_date", "salary_annual_aud", "evidence_span")
+
 def load_grad_signals(csv_path):
-    rows = []
-    try:
-        with open(csv_path, newline="", encoding="utf-8") as f:
-            for r in csv.DictReader(f):
-                rows.append({
-                    "firm_name": r.get("firm_name","").strip(),
-                    "program_type": r.get("program_type","").strip(),
-                    "city": r.get("city","").strip(),
-                    "intake_year": r.get("intake_year","").strip(),
-                    "application_close_date": r.get("application_close_date","").strip(),
-                    "salary_annual_aud": r.get("salary_annual_aud","").strip(),
-                    "evidence_span": r.get("evidence_span","").strip(),
-                })
-    except FileNotFoundError:
+    table = signal_table(csv_path)
+    if table is None:
         return []
-    return rows
+    return [{k: (v or "").strip() for k, v in r.items()} for r in table.rows(SIGNAL_FIELDS)]
 
 def aggregate_by_firm(rows):
     today = date.today()
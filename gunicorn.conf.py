@@ -0,0 +1,27 @@
+# gunicorn.conf.py
+# Picked up automatically by `gunicorn main:app` / `gunicorn api:app` run from
+# the repo root (Dockerfile, .replit). Command-line flags still win.
+#
+# Preload imports the app once in the master and builds the shared datasets
+# (shared_data.preload) before forking, so workers share them copy-on-write.
+# PRELOAD=0 restores per-worker loading, e.g. for code reload in development.
+
+import os
+
+preload_app = os.environ.get("PRELOAD", "1") != "0"
+
+def when_ready(server):
+    # Runs in the master after the app is loaded, before the first worker fork
+    if not server.cfg.preload_app:
+        return
+    import shared_data
+    stats = shared_data.preload()
+    server.log.info("Preloaded shared data: %s", ", ".join(f"{k}={v}" for k, v in stats.items()))
+    server.log.info("Master memory: %s", shared_data.format_usage(shared_data.memory_usage()))
+
+def post_worker_init(worker):
+    try:
+        import shared_data
+        worker.log.info("Worker %s memory: %s", worker.pid, shared_data.format_usage(shared_data.memory_usage()))
+    except OSError:   # no /proc (macOS)
+        pass
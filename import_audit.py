@@ -0,0 +1,86 @@
+# import_audit.py
+# Import-time audit for the app entry points. Imports each module in a fresh
+# interpreter under `python -X importtime`, reports the slowest imports and
+# fails if boot exceeds the budget or a deferred-only dependency got loaded.
+#
+#   python import_audit.py                      # main and api, 1s budget
+#   python import_audit.py main --top 25 --budget 0.5
+#
+# Exit status is 1 when any module breaks the budget, so it can gate a deploy.
+
+import os, re, sys, time, argparse, subprocess
+
+MODULES = ["main", "api"]
+BUDGET = 1.0   # seconds, interpreter start + import
+RUNS = 3       # best-of, to smooth out a cold page cache
+# Heavy dependencies that should only load on the code paths that use them
+DEFERRED = ["pandas", "pyarrow", "numpy", "dateutil", "psycopg2"]
+
+_LINE = re.compile(r"import time:\s+(\d+) \|\s+(\d+) \|( *)(\S+)")
+
+def profile(module: str, env=None):
+    """One cold import of `module`: (wall seconds, [(name, self_us, cumulative_us, depth)])."""
+    t0 = time.perf_counter()
+    proc = subprocess.run([sys.executable, "-X", "importtime", "-c", f"import {module}"],
+                          capture_output=True, text=True, env=env)
+    wall = time.perf_counter() - t0
+    if proc.returncode != 0:
+        raise RuntimeError(f"import {module} failed:\n{proc.stderr.strip().splitlines()[-1]}")
+    rows = []
+    for line in proc.stderr.splitlines():
+        m = _LINE.match(line)
+        if m:
+            rows.append((m.group(4), int(m.group(1)), int(m.group(2)), (len(m.group(3)) - 1) // 2))
+    return wall, rows
+
+def audit(module: str, budget: float = BUDGET, deferred=DEFERRED, runs: int = RUNS, top: int = 15, env=None) -> bool:
+    results = [profile(module, env) for _ in range(runs)]
+    wall, rows = min(results, key=lambda r: r[0])
+    loaded = {name for name, *_ in rows}
+    eager = [d for d in deferred if d in loaded]
+    ok = wall <= budget and not eager
+
+    print(f"== {module}: {wall:.3f}s boot (best of {runs}, budget {budget:.2f}s), "
+          f"{len(rows)} modules {'OK' if ok else 'FAIL'}")
+    print(f"   {'cumulative':>10} {'self':>8}  module")
+    for name, self_us, cum_us, depth in sorted(rows, key=lambda r: -r[2])[:top]:
+        print(f"   {cum_us / 1000:>8.1f}ms {self_us / 1000:>6.1f}ms  {'  ' * depth}{name}")
+    for d in eager:
+        chain = _import_chain(rows, d)
+        print(f"   ! {d} imported at boot via {' -> '.join(chain)}")
+    return ok
+
+def _import_chain(rows, target):
+    """Path of importers down to `target` (importtime lists children before parents)."""
+    idx = next(i for i, r in enumerate(rows) if r[0] == target)
+    chain, depth = [target], rows[idx][3]
+    for name, _, _, d in rows[idx + 1:]:
+        if d < depth:
+            chain.append(name)
+            depth = d
+    return chain[::-1]
+
+def main():
+    ap = argparse.ArgumentParser(description="Audit import time of the app entry points")
+    ap.add_argument("modules", nargs="*", default=MODULES)
+    ap.add_argument("--budget", type=float, default=BUDGET, help="Max seconds per module")
+    ap.add_argument("--runs", type=int, default=RUNS)
+    ap.add_argument("--top", type=int, default=15, help="Slowest imports to list")
+    ap.add_argument("--allow", nargs="*", default=[], help="Deferred modules to allow at boot")
+    args = ap.parse_args()
+
+    # The app modules only need DATABASE_URL on first connect, but set a harmless one
+    env = dict(os.environ)
+    env.setdefault("DATABASE_URL", "sqlite:///:memory:")
+    deferred = [d for d in DEFERRED if d not in args.allow]
+    ok = True
+    for module in args.modules:
+        try:
+            ok &= audit(module, args.budget, deferred, args.runs, args.top, env)
+        except RuntimeError as e:
+            print(f"== {module}: {e}")
+            ok = False
+    sys.exit(0 if ok else 1)
+
+if __name__ == "__main__":
+    main()
@@ -80,17 +80,10 @@ def generate_realistic_experience(company, comment_theme):
         "timestamp": (datetime.now() - timedelta(days=random.randint(30, 365))).isoformat()
     }
 
-def import_csv_to_json():
-    csv_file_path = 'attached_assets/Auslaw_Comments_with_Themes_and_Firms_1754309543165.csv'
-    json_file_path = 'submissions.json'
-    
-    # Check if CSV file exists
-    if not os.path.exists(csv_file_path):
-        print(f"Error: CSV file not found at {csv_file_path}")
-        return
-    
-    print("Starting fresh - clearing existing data and using only CSV data...")
-    
+CSV_FILE_PATH = 'attached_assets/Auslaw_Comments_with_Themes_and_Firms_1754309543165.csv'
+
+def build_experiences(csv_file_path=CSV_FILE_PATH):
+    """Generate 2-4 experiences per firm in the Auslaw CSV; returns (entries, firms_data)"""
     # Read CSV and extract firms with their themes
     firms_data = {}
     
@@ -106,10 +99,6 @@ def import_csv_to_json():
                     firms_data[company] = []
                 firms_data[company].append(theme)
     
-    print(f"Found {len(firms_data)} unique firms in CSV:")
-    for firm in sorted(firms_data.keys()):
-        print(f"  - {firm} (themes: {', '.join(set(firms_data[firm]))})")
-    
     # Generate experiences based on CSV data
     new_entries = []
     for company, themes in firms_data.items():
@@ -121,6 +110,24 @@ def import_csv_to_json():
             theme = random.choice(themes) if themes else 'Other'
             entry = generate_realistic_experience(company, theme)
             new_entries.append(entry)
+    return new_entries, firms_data
+
+def import_csv_to_json():
+    csv_file_path = CSV_FILE_PATH
+    json_file_path = 'submissions.json'
+    
+    # Check if CSV file exists
+    if not os.path.exists(csv_file_path):
+        print(f"Error: CSV file not found at {csv_file_path}")
+        return
+    
+    print("Starting fresh - clearing existing data and using only CSV data...")
+    
+    new_entries, firms_data = build_experiences(csv_file_path)
+    
+    print(f"Found {len(firms_data)} unique firms in CSV:")
+    for firm in sorted(firms_data.keys()):
+        print(f"  - {firm} (themes: {', '.join(set(firms_data[firm]))})")
     
     # Write new data to JSON file (replacing all existing data)
     with open(json_file_path, 'w', encoding='utf-8') as f:
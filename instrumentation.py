@@ -0,0 +1,233 @@
+# instrumentation.py
+# Opt-in per-request instrumentation for main.py / api.py (INSTRUMENT=1).
+# Records wall time, db_auth query count/time, file reads done through the app
+# module's open() and template render time. Surfaces them as a Server-Timing
+# header on every response and, when METRICS_TOKEN is set, as Prometheus text
+# on /metrics for requests carrying `Authorization: Bearer <METRICS_TOKEN>`.
+#
+# Metrics are per process: with several gunicorn workers each one keeps its own
+# counters, so scrape every worker or run a single worker when profiling.
+
+import os, sys, hmac, time, threading
+from functools import wraps
+from flask import g, request, Response, before_render_template, template_rendered
+
+# Modules whose open() is shadowed so their CSV/JSON loads show up as "file"
+FILE_MODULES = ("grad_data", "grad_data_v2", "shared_data")
+BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+# --- Per-request accounting --------------------------------------------------
+def _record(kind: str, seconds: float):
+    """Add one timed operation to the current request (no-op outside a request)."""
+    try:
+        stats = g._instr
+    except (AttributeError, RuntimeError):
+        return
+    count, total = stats.get(kind, (0, 0.0))
+    stats[kind] = (count + 1, total + seconds)
+
+class _TimedCursor:
+    def __init__(self, cursor):
+        self._cursor = cursor
+
+    def execute(self, *args, **kwargs):
+        t0 = time.perf_counter()
+        try:
+            return self._cursor.execute(*args, **kwargs)
+        finally:
+            _record("db", time.perf_counter() - t0)
+
+    def executemany(self, *args, **kwargs):
+        t0 = time.perf_counter()
+        try:
+            return self._cursor.executemany(*args, **kwargs)
+        finally:
+            _record("db", time.perf_counter() - t0)
+
+    def __getattr__(self, name):
+        return getattr(self._cursor, name)
+
+class _TimedConnection:
+    def __init__(self, conn):
+        self._conn = conn
+
+    def cursor(self, *args, **kwargs):
+        return _TimedCursor(self._conn.cursor(*args, **kwargs))
+
+    def __getattr__(self, name):
+        return getattr(self._conn, name)
+
+class _TimedFile:
+    """File proxy that books open + read time as one 'file' operation on close."""
+    def __init__(self, f, opened_in: float):
+        self._f = f
+        self._elapsed = opened_in
+
+    def _timed(self, fn, *args):
+        t0 = time.perf_counter()
+        try:
+            return fn(*args)
+        finally:
+            self._elapsed += time.perf_counter() - t0
+
+    def read(self, *args):
+        return self._timed(self._f.read, *args)
+
+    def readline(self, *args):
+        return self._timed(self._f.readline, *args)
+
+    def readlines(self, *args):
+        return self._timed(self._f.readlines, *args)
+
+    def __iter__(self):
+        return self
+
+    def __next__(self):
+        return self._timed(self._f.__next__)
+
+    def close(self):
+        if not self._f.closed:
+            self._f.close()
+            _record("file", self._elapsed)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def __getattr__(self, name):
+        return getattr(self._f, name)
+
+def _timed_open(*args, **kwargs):
+    t0 = time.perf_counter()
+    f = open(*args, **kwargs)
+    return _TimedFile(f, time.perf_counter() - t0)
+
+def _timed_get_db_connection(fn):
+    @wraps(fn)
+    def wrapper(*args, **kwargs):
+        t0 = time.perf_counter()
+        conn = fn(*args, **kwargs)
+        _record("db_connect", time.perf_counter() - t0)
+        return _TimedConnection(conn)
+    wrapper._instrumented = True
+    return wrapper
+
+# --- Process-wide metrics ---------------------------------------------------
+class Metrics:
+    """Thread-safe counters keyed by (endpoint, method, status)."""
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.requests = {}    # (endpoint, method, status) -> count
+        self.duration = {}    # endpoint -> [count, sum, bucket counts...]
+        self.ops = {}         # (endpoint, kind) -> [count, seconds]
+
+    def observe(self, endpoint: str, method: str, status: int, seconds: float, stats: dict):
+        with self._lock:
+            key = (endpoint, method, str(status))
+            self.requests[key] = self.requests.get(key, 0) + 1
+            d = self.duration.setdefault(endpoint, [0, 0.0] + [0] * len(BUCKETS))
+            d[0] += 1
+            d[1] += seconds
+            for i, le in enumerate(BUCKETS):
+                if seconds <= le:
+                    d[2 + i] += 1
+            for kind, (count, total) in stats.items():
+                o = self.ops.setdefault((endpoint, kind), [0, 0.0])
+                o[0] += count
+                o[1] += total
+
+    def render(self) -> str:
+        """Prometheus text exposition format (0.0.4)."""
+        with self._lock:
+            lines = ["# HELP http_requests_total Requests handled, by endpoint, method and status.",
+                     "# TYPE http_requests_total counter"]
+            for (ep, method, status), n in sorted(self.requests.items()):
+                lines.append(f'http_requests_total{{endpoint="{ep}",method="{method}",status="{status}"}} {n}')
+
+            lines += ["# HELP http_request_duration_seconds Wall time per request.",
+                      "# TYPE http_request_duration_seconds histogram"]
+            for ep, d in sorted(self.duration.items()):
+                for i, le in enumerate(BUCKETS):
+                    lines.append(f'http_request_duration_seconds_bucket{{endpoint="{ep}",le="{le}"}} {d[2 + i]}')
+                lines.append(f'http_request_duration_seconds_bucket{{endpoint="{ep}",le="+Inf"}} {d[0]}')
+                lines.append(f'http_request_duration_seconds_sum{{endpoint="{ep}"}} {d[1]:.6f}')
+                lines.append(f'http_request_duration_seconds_count{{endpoint="{ep}"}} {d[0]}')
+
+            lines += ["# HELP app_operations_total Timed operations inside requests (db, db_connect, file, template).",
+                      "# TYPE app_operations_total counter"]
+            for (ep, kind), (n, _) in sorted(self.ops.items()):
+                lines.append(f'app_operations_total{{endpoint="{ep}",kind="{kind}"}} {n}')
+            lines += ["# HELP app_operation_seconds_total Time spent in timed operations inside requests.",
+                      "# TYPE app_operation_seconds_total counter"]
+            for (ep, kind), (_, s) in sorted(self.ops.items()):
+                lines.append(f'app_operation_seconds_total{{endpoint="{ep}",kind="{kind}"}} {s:.6f}')
+        return "\n".join(lines) + "\n"
+
+def server_timing(stats: dict, total: float) -> str:
+    parts = []
+    for kind in ("db_connect", "db", "file", "template"):
+        if kind in stats:
+            count, seconds = stats[kind]
+            parts.append(f'{kind};dur={seconds * 1000:.1f};desc="{count}x"')
+    parts.append(f"total;dur={total * 1000:.1f}")
+    return ", ".join(parts)
+
+# --- Wiring -----------------------------------------------------------------
+def instrument_app(app, metrics_path: str = "/metrics"):
+    """Attach timing hooks to `app`, plus a Prometheus endpoint when METRICS_TOKEN is set.
+
+    File reads are timed by shadowing open() in the module that created the
+    app (main / api) and in FILE_MODULES, so only the app's own data loads
+    are counted."""
+    import db_auth
+    if not getattr(db_auth.get_db_connection, "_instrumented", False):
+        db_auth.get_db_connection = _timed_get_db_connection(db_auth.get_db_connection)
+    for name in (app.import_name,) + FILE_MODULES:
+        module = sys.modules.get(name)
+        if module is not None:
+            module.open = _timed_open
+
+    metrics = Metrics()
+    app.extensions["instrumentation"] = metrics
+
+    @app.before_request
+    def _instr_start():
+        g._instr = {}
+        g._instr_t0 = time.perf_counter()
+
+    @app.after_request
+    def _instr_finish(response):
+        stats = getattr(g, "_instr", None)
+        if stats is None:
+            return response
+        total = time.perf_counter() - g._instr_t0
+        endpoint = request.endpoint or "<unmatched>"
+        if endpoint != "_instr_metrics":
+            metrics.observe(endpoint, request.method, response.status_code, total, stats)
+        response.headers["Server-Timing"] = server_timing(stats, total)
+        return response
+
+    def _template_start(_sender, **_extra):
+        g._instr_tpl_t0 = time.perf_counter()
+
+    def _template_done(_sender, **_extra):
+        t0 = getattr(g, "_instr_tpl_t0", None)
+        if t0 is not None:
+            _record("template", time.perf_counter() - t0)
+
+    before_render_template.connect(_template_start, app, weak=False)
+    template_rendered.connect(_template_done, app, weak=False)
+
+    # No token, no endpoint: the per-endpoint counters aren't for the public
+    token = os.environ.get("METRICS_TOKEN")
+    if token:
+        @app.route(metrics_path, endpoint="_instr_metrics")
+        def _instr_metrics():
+            if not hmac.compare_digest(request.headers.get("Authorization", ""), f"Bearer {token}"):
+                return Response("Unauthorized\n", status=401, mimetype="text/plain",
+                                headers={"WWW-Authenticate": "Bearer"})
+            return Response(metrics.render(), mimetype="text/plain; version=0.0.4")
+
+    return metrics
@@ -0,0 +1,57 @@
+# label_signals.py
+# Post-processing stage for grad_program_signals: adds the categorizer's
+# primary_cat / cat_labels and a sanitized copy of evidence_span, so the firm
+# page can read them instead of classifying on every view.
+#
+#   python label_signals.py [out/grad_program_signals.csv]
+import os, re, csv, sys
+from categorizer import classify_text, label
+
+LABEL_COLUMNS = ["primary_cat", "cat_labels", "evidence_clean"]
+LABEL_SEP = ", "
+
+_MENTION = re.compile(r'@\w+')
+_USER_NO = re.compile(r'User #\d+')
+_USERNAME = re.compile(r'\busername:\s*\w+', re.IGNORECASE)
+
+def sanitize_evidence(text):
+    """Strip @mentions / user references and collapse whitespace."""
+    if not text:
+        return text
+    text = _USERNAME.sub('', _USER_NO.sub('', _MENTION.sub('', text)))
+    return ' '.join(text.split())
+
+def label_evidence(evidence):
+    """(primary_cat, cat_labels, evidence_clean) for one evidence span."""
+    if not evidence:
+        return "", "", evidence or ""
+    p, cats, _ = classify_text(evidence, threshold=1.0, top_k=3)
+    return p or "", LABEL_SEP.join(label(c) for c in cats), sanitize_evidence(evidence)
+
+def label_frame(df):
+    """Add LABEL_COLUMNS to a signals DataFrame (used by extract_grad_programs)."""
+    labelled = [label_evidence(e if isinstance(e, str) else "") for e in df["evidence_span"]]
+    for i, col in enumerate(LABEL_COLUMNS):
+        df[col] = [r[i] for r in labelled]
+    return df
+
+def label_csv(path, out_path=None):
+    """Rewrite a signals CSV with LABEL_COLUMNS filled in; other columns are copied verbatim."""
+    out_path = out_path or path
+    with open(path, newline="", encoding="utf-8") as f:
+        r = csv.DictReader(f)
+        fields = [c for c in r.fieldnames if c not in LABEL_COLUMNS] + LABEL_COLUMNS
+        rows = list(r)
+    for row in rows:
+        row.update(zip(LABEL_COLUMNS, label_evidence(row.get("evidence_span", ""))))
+    tmp = out_path + ".tmp"
+    with open(tmp, "w", newline="", encoding="utf-8") as g:
+        w = csv.DictWriter(g, fieldnames=fields, lineterminator="\n")
+        w.writeheader()
+        w.writerows(rows)
+    os.replace(tmp, out_path)
+    return len(rows)
+
+if __name__ == "__main__":
+    path = sys.argv[1] if len(sys.argv) > 1 else "out/grad_program_signals.csv"
+    print(f"Labelled {label_csv(path)} rows in {path}")
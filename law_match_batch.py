@@ -0,0 +1,164 @@
+# law_match_batch.py
+# Batch law-match: rank firms for many candidate profiles at once. Candidates
+# are validated like the /law-match form, scored against every firm in one
+# vectorized pass per chunk (law_match_engine.rank_candidates) and streamed
+# back as NDJSON (one line per candidate) or CSV (one row per match).
+#
+#   python law_match_batch.py students.csv --format csv --out matches.csv
+#   curl -X POST -H 'Content-Type: text/csv' --data-binary @students.csv \
+#        'http://localhost:5000/api/law-match/batch?format=csv'
+#
+# Input columns: uni, wam, interest, preference (required), experience,
+# location, grad_year (form defaults), candidate_id or id (row number if absent).
+
+import io, csv, sys, json, math, argparse
+from datetime import datetime
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
+from law_match_profiles import get_firm_profiles, SIGNALS_CSV
+
+CHUNK = 1000             # candidates per vectorized pass
+MAX_CANDIDATES = 20000   # per HTTP request
+REQUIRED = ['uni', 'wam', 'interest', 'preference']
+DEFAULTS = {'experience': 'none', 'location': 'any', 'grad_year': '2025'}
+CSV_FIELDS = ['candidate_id', 'rank', 'firm', 'score', 'confidence', 'tier',
+              'salary_range', 'uni_percentage', 'reasons', 'error']
+
+# --- Input ------------------------------------------------------------------
+def parse_candidate(row: Dict, index: int) -> Tuple[str, Optional[Dict], Optional[str]]:
+    """Validate one input row; returns (candidate_id, candidate, error)."""
+    cid = str(row.get('candidate_id') or row.get('id') or index)
+    missing = [k for k in REQUIRED if not str(row.get(k) or '').strip()]
+    if missing:
+        return cid, None, f"missing {', '.join(missing)}"
+    try:
+        wam = float(str(row['wam']).strip())
+    except ValueError:
+        return cid, None, "invalid WAM"
+    if not math.isfinite(wam):
+        return cid, None, "invalid WAM"
+    if not 0 <= wam <= 100:
+        return cid, None, "WAM must be between 0 and 100"
+    cand = {k: str(row[k]).strip() for k in REQUIRED if k != 'wam'}
+    cand['wam'] = wam
+    for k, default in DEFAULTS.items():
+        cand[k] = str(row.get(k) or default).strip()
+    return cid, cand, None
+
+def read_rows(text: str, fmt: str) -> List[Dict]:
+    """Rows from CSV, NDJSON or JSON (a list, or {"candidates": [...]}); ValueError
+    unless every row is an object."""
+    if fmt == 'csv':
+        return list(csv.DictReader(io.StringIO(text)))
+    if fmt == 'ndjson':
+        rows = [json.loads(line) for line in text.splitlines() if line.strip()]
+    elif fmt == 'json':
+        data = json.loads(text)
+        rows = data.get('candidates', []) if isinstance(data, dict) else data
+    else:
+        raise ValueError(f"unsupported input format: {fmt}")
+    if not isinstance(rows, list):
+        raise ValueError("expected a list of candidate objects")
+    for n, row in enumerate(rows, 1):
+        if not isinstance(row, dict):
+            raise ValueError(f"candidate {n} is not an object")
+    return rows
+
+# --- Scoring ----------------------------------------------------------------
+def score_rows(rows: Iterable[Dict], uni_data: Dict[str, Dict], month: Optional[int] = None,
+               csv_path: str = SIGNALS_CSV) -> Iterator[Dict]:
+    """Yield {candidate_id, matches} or {candidate_id, error} per row, in input order."""
+    from law_match_engine import rank_candidates  # numpy: loaded on first use
+    firm_profiles, firm_data_lookup = get_firm_profiles(csv_path)
+    month = month or datetime.now().month
+    rows = list(rows)
+    for start in range(0, len(rows), CHUNK):
+        parsed = [parse_candidate(r, start + k + 1) for k, r in enumerate(rows[start:start + CHUNK])]
+        ranked = iter(rank_candidates([c for _, c, err in parsed if not err],
+                                      firm_profiles, firm_data_lookup, uni_data, month))
+        for cid, _, err in parsed:
+            if err:
+                yield {'candidate_id': cid, 'error': err}
+                continue
+            yield {'candidate_id': cid, 'matches': [
+                {'rank': r, 'firm': p['firm'], 'score': round(p['score'], 1), 'confidence': p['confidence'],
+                 'tier': p['tier'], 'salary_range': p['salary_range'],
+                 'uni_percentage': p['uni_percentage'], 'reasons': p['reasons'][:3]}
+                for r, p in enumerate(next(ranked), 1)
+            ]}
+
+# --- Output -----------------------------------------------------------------
+def to_ndjson(results: Iterable[Dict]) -> Iterator[str]:
+    for res in results:
+        yield json.dumps(res) + "\n"
+
+def to_csv(results: Iterable[Dict]) -> Iterator[str]:
+    buf = io.StringIO()
+    w = csv.DictWriter(buf, fieldnames=CSV_FIELDS, extrasaction='ignore')
+    w.writeheader()
+    for res in results:
+        rows = [{'candidate_id': res['candidate_id'], 'error': res['error']}] if 'error' in res else [
+            {**m, 'candidate_id': res['candidate_id'], 'reasons': ' | '.join(m['reasons'])} for m in res['matches']
+        ]
+        w.writerows(rows)
+        yield buf.getvalue()
+        buf.seek(0)
+        buf.truncate()
+
+WRITERS = {'ndjson': (to_ndjson, 'application/x-ndjson'), 'csv': (to_csv, 'text/csv')}
+
+def batch_response(req, uni_data: Dict[str, Dict]):
+    """Flask handler body for POST /api/law-match/batch (CSV upload, CSV/NDJSON/JSON body)."""
+    from flask import Response, jsonify, stream_with_context
+    out_fmt = (req.args.get('format') or ('csv' if 'text/csv' in req.headers.get('Accept', '') else 'ndjson')).lower()
+    if out_fmt not in WRITERS:
+        return jsonify({'error': f"format must be one of {', '.join(WRITERS)}"}), 400
+
+    upload = req.files.get('file')
+    if upload:
+        text = upload.read().decode('utf-8-sig')
+        in_fmt = 'ndjson' if upload.filename.endswith(('.ndjson', '.jsonl')) else \
+                 'json' if upload.filename.endswith('.json') else 'csv'
+    else:
+        text = req.get_data(as_text=True)
+        mimetype = req.mimetype or ''
+        in_fmt = 'csv' if 'csv' in mimetype else 'ndjson' if 'ndjson' in mimetype else 'json'
+    try:
+        rows = read_rows(text, in_fmt)
+    except ValueError as e:
+        return jsonify({'error': f"could not parse {in_fmt} input: {e}"}), 400
+    if len(rows) > MAX_CANDIDATES:
+        return jsonify({'error': f"at most {MAX_CANDIDATES} candidates per request"}), 413
+
+    writer, mimetype = WRITERS[out_fmt]
+    return Response(stream_with_context(writer(score_rows(rows, uni_data))), mimetype=mimetype)
+
+# --- CLI --------------------------------------------------------------------
+def main():
+    ap = argparse.ArgumentParser(description="Rank law firms for a file of candidate profiles")
+    ap.add_argument("input", help="Candidates file (.csv, .ndjson/.jsonl or .json), or - for stdin CSV")
+    ap.add_argument("--format", choices=list(WRITERS), default="csv", help="Output format")
+    ap.add_argument("--out", default="-", help="Output path (default: stdout)")
+    ap.add_argument("--month", type=int, default=None, help="Score as if in this month (1-12)")
+    ap.add_argument("--signals", default=SIGNALS_CSV)
+    args = ap.parse_args()
+
+    from main import FIRM_UNIVERSITY_DATA
+    if args.input == "-":
+        text, in_fmt = sys.stdin.read(), "csv"
+    else:
+        with open(args.input, encoding="utf-8-sig") as f:
+            text = f.read()
+        in_fmt = "ndjson" if args.input.endswith((".ndjson", ".jsonl")) else \
+                 "json" if args.input.endswith(".json") else "csv"
+
+    writer, _ = WRITERS[args.format]
+    out = sys.stdout if args.out == "-" else open(args.out, "w", newline="", encoding="utf-8")
+    try:
+        for chunk in writer(score_rows(read_rows(text, in_fmt), FIRM_UNIVERSITY_DATA, args.month, args.signals)):
+            out.write(chunk)
+    finally:
+        if out is not sys.stdout:
+            out.close()
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,383 @@
+# law_match_engine.py
+# Vectorized law-match scorer. Firm profiles (law_match_profiles) are encoded
+# once as NumPy feature arrays; a candidate is then scored against every firm
+# in a handful of array operations instead of a per-firm if/elif ladder.
+# score_firms() returns the same {firm: {score, profile, reasons,
+# uni_percentage, confidence}} dict as the original per-firm loop from main.py;
+# tests/test_law_match_engine.py checks that on random candidates.
+
+from datetime import datetime
+from typing import Callable, Dict, List, Optional, Tuple, Union
+import numpy as np
+
+GO8_UNIS = ['University of Melbourne', 'University of Sydney', 'UNSW']
+TIER_WEIGHTS = {'top': 1.5, 'mid-top': 1.2}
+INTEREST_KEYWORDS = {
+    'commercial': ['corporate', 'm&a', 'banking', 'finance', 'commercial', 'capital markets'],
+    'litigation': ['litigation', 'dispute', 'resolution', 'employment', 'arbitration'],
+    'family': ['family'],
+    'criminal': ['criminal'],
+    'employment': ['employment', 'workplace', 'industrial'],
+    'property': ['property', 'real estate', 'construction'],
+    'tax': ['tax', 'revenue'],
+    'technology': ['technology', 'ip', 'intellectual property', 'data'],
+    'energy': ['energy', 'resources', 'mining', 'oil'],
+    'other': []
+}
+MEMO_LIMIT = 1024   # per-uni/interest/location feature columns kept per matrix
+
+# --- Feature matrix ---------------------------------------------------------
+_MATRICES: Dict[Tuple[int, int], Tuple] = {}   # (id(profiles), id(uni_data)) -> (profiles, uni_data, matrix)
+
+def build_matrix(firm_profiles: Dict[str, Dict], firm_data_lookup: Dict[str, Dict],
+                 uni_data: Dict[str, Dict]) -> Dict:
+    """Encode the candidate-independent firm features as arrays (one slot per firm)."""
+    names = list(firm_profiles)
+    profiles = [firm_profiles[n] for n in names]
+
+    def col(key, default=0):
+        return np.array([p.get(key, default) for p in profiles], dtype=float)
+
+    def has_any(words):
+        return np.array([any(w in p.get('culture', '').lower() for w in words) for p in profiles])
+
+    return {
+        'names': names,
+        'profiles': profiles,
+        'lookup': firm_data_lookup,
+        'uni_data': uni_data,
+        'market_activity': col('market_activity'),
+        'csv_confidence': col('csv_confidence', 0.5),
+        'csv_mentions': col('csv_mentions'),
+        'prestige': col('prestige_score'),
+        'training': col('training_score'),
+        'worklife': col('worklife_score'),
+        'avg_salary': col('avg_salary', 75000),
+        'wam_threshold': np.array([p.get('wam_threshold', 75) for p in profiles]),
+        'tier_top': np.array([p['tier'] == 'top' for p in profiles]),
+        'tier_weight': np.array([TIER_WEIGHTS.get(p['tier'], 1.0) for p in profiles]),
+        'competitive': np.array([p['competitive_level'] for p in profiles]),
+        'tech_strength': np.array([any('tech' in s.lower() or 'ip' in s.lower() for s in p['strengths'])
+                                   for p in profiles]),
+        'culture_experienced': has_any(['traditional', 'demanding']),
+        'culture_supportive': has_any(['supportive', 'development', 'mentoring']),
+        'culture_team': has_any(['collaborative', 'team']),
+        'memo': {},
+    }
+
+def get_matrix(firm_profiles: Dict[str, Dict], firm_data_lookup: Dict[str, Dict],
+               uni_data: Dict[str, Dict]) -> Dict:
+    """build_matrix() memoized on the profile store object (rebuilt with it)."""
+    key = (id(firm_profiles), id(uni_data))
+    cached = _MATRICES.get(key)
+    if cached and cached[0] is firm_profiles and cached[1] is uni_data:
+        return cached[2]
+    matrix = build_matrix(firm_profiles, firm_data_lookup, uni_data)
+    _MATRICES.clear()
+    _MATRICES[key] = (firm_profiles, uni_data, matrix)
+    return matrix
+
+def _memo(m: Dict, kind: str, key: str, build: Callable):
+    """Per-candidate-attribute feature columns, computed once per distinct value."""
+    memo = m['memo']
+    hit = memo.get((kind, key))
+    if hit is None:
+        if len(memo) >= MEMO_LIMIT:
+            memo.clear()
+        hit = memo[(kind, key)] = build()
+    return hit
+
+def _uni_columns(m: Dict, uni: str):
+    def build():
+        raw = [m['uni_data'].get(f, {}).get(uni, m['uni_data'].get(f, {}).get('Other', 0)) for f in m['names']]
+        return np.array(raw, dtype=float), raw
+    return _memo(m, 'uni', uni, build)
+
+def _interest_columns(m: Dict, interest: str):
+    def build():
+        keywords = INTEREST_KEYWORDS.get(interest, [])
+        matched = [[s for s in p['strengths'] if any(k.lower() in s.lower() for k in keywords)]
+                   for p in m['profiles']]
+        target = 'clerkship' if interest == 'clerkship' else 'graduate'
+        programs = [p.get('program_offerings', []) for p in m['profiles']]
+        return {
+            'count': np.array([len(x) for x in matched]),
+            'matched': matched,
+            'program_match': np.array([any(target in prog.lower() for prog in ps) for ps in programs]),
+            'has_programs': np.array([bool(ps) for ps in programs]),
+        }
+    return _memo(m, 'interest', interest, build)
+
+def _location_columns(m: Dict, location: str):
+    def build():
+        loc = location.lower()
+        cities = [next((c for c in p.get('active_cities', []) if loc in c.lower()), None) for p in m['profiles']]
+        top_city = [(m['lookup'].get(f) or {}).get('top_city') for f in m['names']]
+        return {
+            'city': cities,
+            'city_match': np.array([c is not None for c in cities]),
+            'top_city_match': np.array([bool(t) and loc in t.lower() for t in top_city]),
+        }
+    return _memo(m, 'location', location, build)
+
+# --- Vectorized scorer ------------------------------------------------------
+# A rule's reason is fixed text, or reason(c, i) for candidate row c and firm column i
+Reason = Union[str, Callable[[int, int], str]]
+
+# Candidates are rows and firms are columns: candidate attributes are (C, 1)
+# columns that broadcast against (F,) firm features. Every `score +=` mirrors
+# one add in the original loop (mutually exclusive branches share one add), so the
+# float results are bit-identical.
+def _score_matrix(m: Dict, cands: List[Dict], month: int) -> Dict:
+    C, n = len(cands), len(m['names'])
+    shape = (C, n)
+
+    def column(values):
+        return np.array(values)[:, None]
+
+    wam = column([c['wam'] for c in cands]).astype(float)
+    interest = column([c['interest'] for c in cands])
+    preference = column([c['preference'] for c in cands])
+    experience = column([c['experience'] for c in cands])
+    grad_2025 = column([c['grad_year'] == '2025' for c in cands])
+    is_prestige, is_training = preference == 'prestige', preference == 'training'
+    is_worklife, is_salary = preference == 'worklife', preference == 'salary'
+    exp_none, exp_some, exp_ext = experience == 'none', experience == 'some', experience == 'extensive'
+
+    ma, conf, mentions = m['market_activity'], m['csv_confidence'], m['csv_mentions']
+    salary, competitive, profiles = m['avg_salary'], m['competitive'], m['profiles']
+    rules: List[Tuple[np.ndarray, Reason]] = []   # (mask, reason) in the original loop's order
+
+    def rule(mask, reason):
+        rules.append((np.broadcast_to(mask, shape), reason))
+
+    score = np.full(shape, 40.0)
+
+    # Market activity and data quality
+    activity = ma * 15
+    act_hi = activity >= 10
+    act_mid = ~act_hi & (activity >= 5)
+    score += np.where(act_hi | act_mid, activity, 0.0)
+    rule(act_hi, "High recent graduate recruitment activity")
+    rule(act_mid, "Active graduate recruitment")
+    dq_hi = (conf >= 0.8) & (mentions >= 10)
+    dq_good = ~dq_hi & (conf >= 0.7) & (mentions >= 5)
+    score += np.where(dq_hi, 8, np.where(dq_good, 5, 0))
+
+    # University representation
+    uni_cols = [_uni_columns(m, c['uni']) for c in cands]
+    pct = np.stack([u[0] for u in uni_cols])
+    pct_raw = [u[1] for u in uni_cols]
+    uni_weight = m['tier_weight'] * (1.0 + (conf - 0.5))
+    uni_bands = [pct >= 25, (pct < 25) & (pct >= 15), (pct < 15) & (pct >= 8), (pct < 8) & (pct >= 3)]
+    score += np.select(uni_bands, [30 * uni_weight, 22 * uni_weight, 12 * uni_weight, 6 * uni_weight], 0.0)
+    for band, label in zip(uni_bands, ['Excellent', 'Strong', 'Good', 'Some'], strict=True):
+        rule(band, lambda c, i, label=label: f"{label} {cands[c]['uni']} representation ({pct_raw[c][i]}%)")
+
+    # WAM against a threshold nudged by market competition
+    adj = np.where(ma > 0.7, 2, np.where(ma < 0.3, -2, 0))
+    threshold = m['wam_threshold'] + adj
+    thresholds = threshold.tolist()
+    diff = wam - threshold
+    wam_band = np.select([diff >= 12, diff >= 7, diff >= 3, diff >= 0, diff >= -3, diff >= -7], np.arange(6), 6)
+    score += np.array([40, 30, 20, 12, 3, -5, -15])[wam_band]
+    wam_reasons = [
+        lambda c, i: f"WAM significantly exceeds expectations ({cands[c]['wam']:.1f} vs ~{thresholds[i]})",
+        lambda c, _i: f"WAM well above requirements ({cands[c]['wam']:.1f})",
+        lambda c, _i: f"WAM above typical threshold ({cands[c]['wam']:.1f})",
+        lambda c, _i: f"WAM meets current market expectations ({cands[c]['wam']:.1f})",
+        "WAM slightly below market average",
+        "WAM below typical requirements",
+        "WAM significantly below expectations",
+    ]
+    for b, reason in enumerate(wam_reasons):
+        rule(wam_band == b, reason)
+
+    # Preference alignment
+    pref_weight = 0.3
+    score += np.select([is_prestige, is_training, is_worklife, is_salary],
+                       [m['prestige'] * pref_weight, m['training'] * pref_weight, m['worklife'] * pref_weight,
+                        np.minimum(25, (salary - 70000) / 1000)], 0.0)
+    rule(is_prestige, lambda _c, i: f"High prestige rating ({profiles[i]['prestige_score']}/100)")
+    rule(is_training, lambda _c, i: f"Strong training programs ({profiles[i]['training_score']}/100)")
+    rule(is_worklife, lambda _c, i: f"Good work-life balance ({profiles[i]['worklife_score']}/100)")
+    rule(is_salary, lambda _c, i: f"Competitive salary (${profiles[i]['avg_salary']:,.0f})")
+
+    # Experience level fit
+    very_high, high, moderate = competitive == 'very_high', competitive == 'high', competitive == 'moderate'
+    score += np.select([exp_ext & very_high, exp_some & (high | moderate), exp_none & moderate, exp_none & high],
+                       [15, 12, 15, 5], 0)
+    rule(exp_none & moderate, "Welcomes graduates without prior legal experience")
+
+    # Practice area alignment
+    interest_cols = [_interest_columns(m, c['interest']) for c in cands]
+    practice_count = np.stack([ic['count'] for ic in interest_cols])
+    tech = (interest == 'technology') & m['tech_strength']
+    score += practice_count * 20 + np.where(tech, 10, 0)
+    rule(practice_count > 1, lambda c, i: f"Multiple practice strengths: {', '.join(interest_cols[c]['matched'][i][:2])}")
+    rule(practice_count == 1, lambda c, i: f"Leading expertise in {interest_cols[c]['matched'][i][0]}")
+    rule(tech, "Strong in high-growth technology practice")
+
+    # Location
+    no = np.zeros(n, dtype=bool)
+    loc_cols = [_location_columns(m, c['location']) if c['location'] != 'any' else None for c in cands]
+    location_match = np.stack([lc['city_match'] if lc else no for lc in loc_cols])
+    presence = ~location_match & np.stack([lc['top_city_match'] if lc else no for lc in loc_cols])
+    score += np.where(location_match, 12, np.where(presence, 6, 0))
+    rule(location_match, lambda c, i: f"Active recruitment in {loc_cols[c]['city'][i]}")
+    rule(presence, lambda c, _i: f"Established presence in {cands[c]['location']}")
+
+    # Program type
+    program_interest = (interest == 'clerkship') | (interest == 'graduate')
+    program_match = program_interest & np.stack([ic['program_match'] for ic in interest_cols])
+    has_programs = program_interest & np.stack([ic['has_programs'] for ic in interest_cols])
+    score += np.where(program_match, 10, np.where(has_programs, 5, 0))
+
+    # Career progression
+    timing = exp_ext & is_prestige & m['tier_top'] & (ma > 0.5)
+    training_excellence = exp_none & is_training & (m['training'] >= 85)
+    score += np.where(timing, 12, np.where(training_excellence, 15, 0))
+    rule(timing, "Perfect timing for experienced candidate seeking prestige")
+    rule(training_excellence, "Excellent graduate development programs")
+
+    # Recruitment season (month is shared by the whole batch)
+    if 2 <= month <= 5:
+        season, season_bonus, season_reason = grad_2025 & (ma > 0.7), 8, "High recruitment activity this season"
+    elif month >= 8:
+        season, season_bonus, season_reason = grad_2025 & (ma > 0.4), 6, "Still actively recruiting late in season"
+    else:
+        season, season_bonus, season_reason = np.zeros(shape, dtype=bool), 0, ""
+    score += np.where(season, season_bonus, 0)
+    rule(season, season_reason)
+
+    # Go8 WAM context (same for every firm)
+    go8 = column([c['uni'] in GO8_UNIS for c in cands])
+    score += np.where(go8, np.where(wam >= 80, 8, 3), 0)
+    rule(go8 & (wam >= 80), "Strong WAM from prestigious Go8 university")
+
+    # Strategic preference matching
+    top_pay = is_salary & (salary >= 85000)
+    good_pay = is_salary & (salary < 85000) & (salary >= 80000)
+    reputation = is_prestige & m['tier_top'] & (ma * 0.3 + conf * 0.4 > 0.6)
+    score += np.select([top_pay, good_pay, reputation], [18, 12, 15], 0)
+    rule(top_pay, lambda _c, i: f"Top-tier compensation (${profiles[i].get('avg_salary', 75000):,.0f})")
+    rule(good_pay, lambda _c, i: f"Competitive salary package (${profiles[i].get('avg_salary', 75000):,.0f})")
+    rule(reputation, "Market-leading reputation and visibility")
+
+    # Experience / culture fit
+    experienced_fit = exp_ext & m['culture_experienced']
+    culture_fit = exp_none & m['culture_supportive']
+    team_fit = exp_some & m['culture_team']
+    score += np.select([experienced_fit, culture_fit, team_fit], [8, 12, 10], 0)
+    rule(experienced_fit, "Culture rewards experienced professionals")
+    rule(culture_fit, "Supportive culture for new graduates")
+    rule(team_fit, "Collaborative environment values diverse experience")
+
+    # Confidence from the factor counts (practice_match counts once per matched strength)
+    outstanding = wam_band == 0
+    has_high = outstanding | (wam_band == 1) | (pct >= 25) | act_hi | dq_hi
+    n_medium = ((wam_band == 2).astype(int) + ((pct < 25) & (pct >= 15)) + practice_count
+                + location_match + dq_good)
+    n_factors = (act_hi.astype(int) + act_mid + dq_hi + dq_good + (pct >= 8) + (wam_band <= 3)
+                 + practice_count + location_match + program_match + training_excellence + culture_fit)
+    confidence = np.select(
+        [(n_factors >= 4) | (has_high & (n_factors >= 2)) | outstanding,
+         (n_factors >= 3) | has_high | (n_medium >= 2),
+         (n_factors >= 2) | (n_medium >= 1)],
+        ['Very High', 'High', 'Medium'], 'Low')
+
+    return {'score': score, 'confidence': confidence, 'pct_raw': pct_raw, 'rules': rules}
+
+def _clamp(s: float):
+    # max(0, min(100, s)) keeps the int bound when clamped; the template shows 100, not 100.0
+    return 100 if s >= 100 else 0 if s <= 0 else s
+
+def _reason(reason: Reason, c: int, i: int) -> str:
+    return reason if isinstance(reason, str) else reason(c, i)
+
+def _reasons_for(rules: List, c: int, i: int, limit: int = 4) -> List[str]:
+    reasons = []
+    for mask, reason in rules:
+        if mask[c, i]:
+            reasons.append(_reason(reason, c, i))
+            if len(reasons) == limit:
+                break
+    return reasons
+
+def score_firms(candidate: Dict, firm_profiles: Dict[str, Dict], firm_data_lookup: Dict[str, Dict],
+                uni_data: Dict[str, Dict], month: Optional[int] = None) -> Dict[str, Dict]:
+    """Score every firm for one candidate. Same output as the original per-firm loop."""
+    m = get_matrix(firm_profiles, firm_data_lookup, uni_data)
+    res = _score_matrix(m, [candidate], month or datetime.now().month)
+    n = len(m['names'])
+
+    reasons = [[] for _ in range(n)]
+    for mask, reason in res['rules']:
+        for i in np.flatnonzero(mask[0]).tolist():
+            if len(reasons[i]) < 4:   # Limit to top 4 reasons
+                reasons[i].append(_reason(reason, 0, i))
+
+    scores = res['score'][0].tolist()
+    confidence = res['confidence'][0].tolist()
+    return {
+        firm: {
+            'score': _clamp(scores[i]),
+            'profile': m['profiles'][i],
+            'reasons': reasons[i],
+            'uni_percentage': res['pct_raw'][0][i],
+            'confidence': confidence[i],
+        }
+        for i, firm in enumerate(m['names'])
+    }
+
+def select_top_firms(ranked: List[Tuple]) -> List[Tuple]:
+    """Diversified shortlist from (firm, score, tier) sorted by score, highest first.
+
+    Keeps the top scorer, then up to four more that are close in score or add a
+    tier not yet picked; pads to three from the top of the ranking if needed."""
+    top, tiers = [], set()
+    for item in ranked:
+        _, score, tier = item
+        if not top:
+            top.append(item)
+            tiers.add(tier)
+        elif len(top) < 5:
+            gap = top[0][1] - score
+            if gap <= 20 or (tier not in tiers and gap <= 35 and score >= 50) or gap <= 10:
+                top.append(item)
+                tiers.add(tier)
+        else:
+            break
+    while len(top) < min(3, len(ranked)):
+        for item in ranked:
+            if item not in top:
+                top.append(item)
+                break
+    return top
+
+def rank_candidates(candidates: List[Dict], firm_profiles: Dict[str, Dict], firm_data_lookup: Dict[str, Dict],
+                    uni_data: Dict[str, Dict], month: Optional[int] = None) -> List[List[Dict]]:
+    """Score many candidates in one pass; per candidate, the shortlisted firms in rank order."""
+    if not candidates:
+        return []
+    m = get_matrix(firm_profiles, firm_data_lookup, uni_data)
+    res = _score_matrix(m, candidates, month or datetime.now().month)
+    names, profiles = m['names'], m['profiles']
+    tiers = [p['tier'] for p in profiles]
+    # Rank on the clamped score; ties keep profile order, like sorted(..., reverse=True)
+    order = np.argsort(-np.clip(res['score'], 0, 100), axis=1, kind='stable')
+    scores = res['score'].tolist()
+
+    results = []
+    for c, row in enumerate(order.tolist()):
+        ranked = [(i, _clamp(scores[c][i]), tiers[i]) for i in row]
+        results.append([{
+            'firm': names[i],
+            'score': score,
+            'confidence': str(res['confidence'][c, i]),
+            'tier': tier,
+            'salary_range': profiles[i].get('salary_range', 'Contact for details'),
+            'uni_percentage': res['pct_raw'][c][i],
+            'reasons': _reasons_for(res['rules'], c, i),
+        } for i, score, tier in select_top_firms(ranked)])
+    return results
@@ -0,0 +1,182 @@
+# law_match_profiles.py
+# Firm profiles for /law-match: hand-curated base profiles merged with salary
+# data from load_cards_v2 and activity/confidence/cities from the signals CSV.
+# None of this depends on the candidate, so it's built once and rebuilt only
+# when the signals file changes.
+
+import os, threading
+from typing import Dict, Tuple
+from grad_data_v2 import load_cards as load_cards_v2
+from shared_data import signal_table
+
+SIGNALS_CSV = "out/grad_program_signals.csv"
+
+BASE_PROFILES = {
+    'Allens': {
+        'tier': 'top', 'prestige_score': 95, 'training_score': 90, 'worklife_score': 65,
+        'competitive_level': 'very_high', 'wam_threshold': 82,
+        'strengths': ['Corporate M&A', 'Banking & Finance', 'Competition Law'],
+        'culture': 'Traditional, high-performing, competitive'
+    },
+    'King & Wood Mallesons': {
+        'tier': 'top', 'prestige_score': 95, 'training_score': 85, 'worklife_score': 60,
+        'competitive_level': 'very_high', 'wam_threshold': 83,
+        'strengths': ['Asia-Pacific focus', 'Corporate M&A', 'Capital Markets'],
+        'culture': 'International, demanding, prestigious'
+    },
+    'Herbert Smith Freehills': {
+        'tier': 'top', 'prestige_score': 90, 'training_score': 88, 'worklife_score': 68,
+        'competitive_level': 'very_high', 'wam_threshold': 81,
+        'strengths': ['Dispute Resolution', 'Energy & Resources', 'Corporate'],
+        'culture': 'Global outlook, collaborative, high standards'
+    },
+    'Gilbert + Tobin': {
+        'tier': 'top', 'prestige_score': 88, 'training_score': 92, 'worklife_score': 75,
+        'competitive_level': 'high', 'wam_threshold': 78,
+        'strengths': ['Litigation', 'Corporate Advisory', 'Employment'],
+        'culture': 'Innovative, collegial, quality-focused'
+    },
+    'Clayton Utz': {
+        'tier': 'mid-top', 'prestige_score': 85, 'training_score': 85, 'worklife_score': 70,
+        'competitive_level': 'high', 'wam_threshold': 76,
+        'strengths': ['Insurance', 'Construction', 'Government Advisory'],
+        'culture': 'Client-focused, collaborative, supportive'
+    },
+    'Ashurst': {
+        'tier': 'mid-top', 'prestige_score': 82, 'training_score': 80, 'worklife_score': 72,
+        'competitive_level': 'high', 'wam_threshold': 75,
+        'strengths': ['Infrastructure', 'Corporate', 'Financial Services'],
+        'culture': 'International, team-oriented, developmental'
+    },
+    'MinterEllison': {
+        'tier': 'mid', 'prestige_score': 78, 'training_score': 85, 'worklife_score': 75,
+        'competitive_level': 'moderate', 'wam_threshold': 73,
+        'strengths': ['Government', 'Health', 'Workplace Relations'],
+        'culture': 'Diverse, inclusive, development-focused'
+    },
+    'Corrs Chambers Westgarth': {
+        'tier': 'mid', 'prestige_score': 75, 'training_score': 82, 'worklife_score': 78,
+        'competitive_level': 'moderate', 'wam_threshold': 72,
+        'strengths': ['Corporate', 'Competition', 'Intellectual Property'],
+        'culture': 'Collegiate, supportive, quality work'
+    },
+    'Lander & Rogers': {
+        'tier': 'mid', 'prestige_score': 70, 'training_score': 88, 'worklife_score': 85,
+        'competitive_level': 'moderate', 'wam_threshold': 70,
+        'strengths': ['Family Law', 'Commercial', 'Property'],
+        'culture': 'Melbourne-focused, mentoring, work-life balance'
+    }
+}
+
+# Fallback salary estimates when the signals have no pay data for a firm
+SALARY_ESTIMATES = {
+    'top': {'avg': 87000, 'range': '82-95k'},
+    'mid-top': {'avg': 82000, 'range': '76-88k'},
+    'mid': {'avg': 75000, 'range': '70-82k'}
+}
+
+def load_csv_insights(csv_path: str = SIGNALS_CSV) -> Dict[str, Dict]:
+    """Per-firm mentions, recent (2024+) activity, mean confidence, cities and program types."""
+    csv_insights = {}
+    table = signal_table(csv_path)
+    if table is not None:
+        for row in table.rows(('firm_name', 'intake_year', 'confidence', 'city', 'program_type')):
+            firm_name = row.get('firm_name', '').strip()
+            if not firm_name:
+                continue
+            if firm_name not in csv_insights:
+                csv_insights[firm_name] = {
+                    'total_mentions': 0, 'recent_activity': 0,
+                    'avg_confidence': 0, 'cities': set(), 'program_types': set(),
+                    'confidence_scores': [], 'years': set()
+                }
+
+            data = csv_insights[firm_name]
+            data['total_mentions'] += 1
+
+            # Track recent activity (2024-2025)
+            year = row.get('intake_year', '')
+            if year and year.isdigit() and int(year) >= 2024:
+                data['recent_activity'] += 1
+                data['years'].add(int(year))
+
+            confidence = row.get('confidence', '')
+            if confidence:
+                try:
+                    data['confidence_scores'].append(float(confidence))
+                except ValueError:
+                    pass
+
+            city = row.get('city', '').strip()
+            if city and city != 'Other/Unknown':
+                data['cities'].add(city)
+
+            program_type = row.get('program_type', '').strip()
+            if program_type and program_type != 'ambiguous':
+                data['program_types'].add(program_type)
+
+    for data in csv_insights.values():
+        if data['confidence_scores']:
+            data['avg_confidence'] = sum(data['confidence_scores']) / len(data['confidence_scores'])
+        data['cities'] = list(data['cities'])
+        data['program_types'] = list(data['program_types'])
+    return csv_insights
+
+def build_firm_profiles(csv_path: str = SIGNALS_CSV) -> Tuple[Dict[str, Dict], Dict[str, Dict]]:
+    """Merge BASE_PROFILES with real salary data and CSV insights.
+
+    Returns (firm_profiles, firm_data_lookup); the lookup is the load_cards_v2
+    card per firm, used for the top_city location fallback."""
+    firms = load_cards_v2(csv_path)
+    firm_data_lookup = {firm['name']: firm for firm in firms}
+    csv_insights = load_csv_insights(csv_path)
+    max_activity = max([data.get('recent_activity', 0) for data in csv_insights.values()] + [1])
+
+    firm_profiles = {}
+    for firm_name, base_profile in BASE_PROFILES.items():
+        profile = base_profile.copy()
+
+        real_data = firm_data_lookup.get(firm_name)
+        if real_data and real_data.get('avg_salary'):
+            profile['avg_salary'] = real_data['avg_salary']
+            profile['salary_range'] = real_data.get('salary_range', f"${real_data['avg_salary']:,.0f}")
+        else:
+            est = SALARY_ESTIMATES.get(profile['tier'], SALARY_ESTIMATES['mid'])
+            profile['avg_salary'] = est['avg']
+            profile['salary_range'] = est['range']
+
+        csv_data = csv_insights.get(firm_name, {})
+        profile['csv_activity'] = csv_data.get('recent_activity', 0)
+        profile['csv_confidence'] = csv_data.get('avg_confidence', 0.5)
+        profile['csv_mentions'] = csv_data.get('total_mentions', 0)
+        profile['active_cities'] = csv_data.get('cities', [])
+        profile['program_offerings'] = csv_data.get('program_types', [])
+
+        # Market activity score (0-1), relative to the busiest firm in the CSV
+        profile['market_activity'] = csv_data.get('recent_activity', 0) / max_activity if max_activity > 0 else 0
+
+        firm_profiles[firm_name] = profile
+    return firm_profiles, firm_data_lookup
+
+_STORE: Dict[str, Tuple] = {}   # csv_path -> (mtime, firm_profiles, firm_data_lookup)
+_STORE_LOCK = threading.Lock()
+
+def get_firm_profiles(csv_path: str = SIGNALS_CSV) -> Tuple[Dict[str, Dict], Dict[str, Dict]]:
+    """Cached build_firm_profiles(); rebuilt when the signals file's mtime changes.
+
+    The returned dicts are shared between requests - treat them as read-only."""
+    mtime = os.path.getmtime(csv_path) if os.path.exists(csv_path) else None
+    cached = _STORE.get(csv_path)
+    if cached and cached[0] == mtime:
+        return cached[1], cached[2]
+    with _STORE_LOCK:
+        cached = _STORE.get(csv_path)
+        if cached and cached[0] == mtime:
+            return cached[1], cached[2]
+        firm_profiles, firm_data_lookup = build_firm_profiles(csv_path)
+        _STORE[csv_path] = (mtime, firm_profiles, firm_data_lookup)
+        return firm_profiles, firm_data_lookup
+
+def profiles_version(csv_path: str = SIGNALS_CSV):
+    """Changes whenever get_firm_profiles() would rebuild (the signals file's mtime)."""
+    return os.path.getmtime(csv_path) if os.path.exists(csv_path) else None
@@ -0,0 +1,305 @@
+# loadtest.py
+# Reproducible HTTP load test for main.py. Seeds a local database (SQLite
+# stand-in by default, or a local Postgres via --database-url) from
+# seed_submissions.json plus synthetic tracker applications, boots the app
+# (werkzeug thread or a gunicorn subprocess) and drives the main routes at a
+# configurable concurrency, reporting p50/p95/p99 latency and throughput.
+#
+#   python loadtest.py --concurrency 16 --requests 200
+#   python loadtest.py --server gunicorn --workers 2 --threads 8 --json out/loadtest.json
+
+import os, sys, json, time, random, socket, argparse, tempfile, threading, subprocess
+import urllib.error, urllib.parse, urllib.request
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date, datetime, timedelta
+from typing import Dict, List, Optional
+
+SEED_FILE = "seed_submissions.json"
+USER_PREFIX = "loadtest-"
+
+UNIVERSITIES = [
+    "University of Melbourne", "Monash University", "University of Sydney", "UNSW",
+    "University of Queensland", "Australian National University", "Macquarie University",
+    "University of Adelaide", "UTS",
+]
+STATUSES = [
+    "Applied", "Online Assessment Received", "Online Assessment Completed",
+    "Phone Interview Scheduled", "Assessment Centre Invited", "Final Interview Scheduled",
+    "Offered", "Rejected",
+]
+INTERESTS = ["commercial", "banking", "litigation", "employment", "property", "tax", "family", "other"]
+PREFERENCES = ["prestige", "salary", "worklife", "training"]
+EXPERIENCE = ["none", "some", "extensive"]
+LOCATIONS = ["any", "melbourne", "sydney", "brisbane", "perth", "adelaide"]
+
+POSTGRES_SCHEMA = """
+CREATE TABLE IF NOT EXISTS users (
+    id VARCHAR PRIMARY KEY DEFAULT gen_random_uuid(),
+    email VARCHAR UNIQUE, first_name VARCHAR, last_name VARCHAR, profile_image_url VARCHAR,
+    created_at TIMESTAMP DEFAULT NOW(), updated_at TIMESTAMP DEFAULT NOW()
+);
+CREATE TABLE IF NOT EXISTS applications (
+    id INTEGER PRIMARY KEY GENERATED BY DEFAULT AS IDENTITY,
+    user_id VARCHAR NOT NULL REFERENCES users(id), company VARCHAR NOT NULL, role VARCHAR NOT NULL,
+    application_date DATE, university VARCHAR, wam VARCHAR, status VARCHAR DEFAULT 'Applied',
+    response_date DATE, priority VARCHAR DEFAULT 'Medium', notes TEXT,
+    created_at TIMESTAMP DEFAULT NOW(), updated_at TIMESTAMP DEFAULT NOW()
+);
+CREATE TABLE IF NOT EXISTS submissions (
+    id INTEGER PRIMARY KEY GENERATED BY DEFAULT AS IDENTITY,
+    user_id VARCHAR NOT NULL REFERENCES users(id), company VARCHAR NOT NULL, role VARCHAR NOT NULL,
+    experience_type VARCHAR, theme VARCHAR, application_stages TEXT, interview_experience TEXT,
+    assessment_centre TEXT, program_structure TEXT, salary_benefits TEXT, culture_environment TEXT,
+    hours_workload TEXT, practice_areas TEXT, general_experience TEXT, pro_tip TEXT, advice TEXT,
+    created_at TIMESTAMP DEFAULT NOW()
+);
+"""
+
+# --- Seeding ----------------------------------------------------------------
+def _stamp(dt: datetime) -> str:
+    return dt.strftime("%Y-%m-%d %H:%M:%S")
+
+def firm_names() -> List[str]:
+    from extractors import FIRM_ALIASES
+    return list(FIRM_ALIASES)
+
+def seed_submission_rows(user_id: str, rng: random.Random) -> List[tuple]:
+    """seed_submissions.json mapped onto the submissions table columns."""
+    if not os.path.exists(SEED_FILE):
+        return []
+    with open(SEED_FILE, encoding="utf-8") as f:
+        seeds = json.load(f)
+    rows = []
+    for s in seeds:
+        created = datetime(2025, 1, 1) + timedelta(days=rng.randint(0, 240), minutes=rng.randint(0, 1440))
+        rows.append((
+            user_id, s.get("company") or "Unknown", s.get("experience_type") or "Graduate",
+            s.get("experience_type"), (s.get("key_themes") or ["Other"])[0],
+            s.get("selection_process"), s.get("interview_tips"), "", "",
+            s.get("pay_benefits"), s.get("culture_env"), s.get("hours_workload"), "",
+            s.get("card_text"), "", "", _stamp(created),
+        ))
+    return rows
+
+def generate_applications(n: int, user_ids: List[str], rng: random.Random) -> List[tuple]:
+    """Synthetic tracker applications spread over firms, unis, statuses and dates."""
+    firms = firm_names()
+    rows = []
+    for _ in range(n):
+        applied = date(2025, 2, 1) + timedelta(days=rng.randint(0, 180))
+        status = rng.choice(STATUSES)
+        responded = applied + timedelta(days=rng.randint(3, 45)) if status != "Applied" else None
+        rows.append((
+            rng.choice(user_ids), rng.choice(firms), rng.choice(["Summer Clerk", "Graduate Lawyer", "Paralegal"]),
+            applied.isoformat(), rng.choice(UNIVERSITIES), f"{rng.uniform(65, 92):.1f}", status,
+            responded.isoformat() if responded else None, rng.choice(["High", "Medium", "Low"]), "",
+            _stamp(datetime.combine(applied, datetime.min.time())),
+        ))
+    return rows
+
+def seed_database(database_url: str, applications: int = 2000, users: int = 200, seed: int = 42) -> Dict[str, int]:
+    """Create tables if needed, drop previous load-test rows and insert a fresh seeded dataset."""
+    os.environ["DATABASE_URL"] = database_url
+    from db_auth import get_db_connection
+    import company_summary
+    rng = random.Random(seed)
+
+    if database_url.startswith("sqlite:///"):
+        import db_sqlite
+        db_sqlite.init_schema(database_url[len("sqlite:///"):])
+    conn = get_db_connection()
+    cur = conn.cursor()
+    if not database_url.startswith("sqlite:///"):
+        from db_indexes import INDEX_SQL
+        cur.execute(POSTGRES_SCHEMA + INDEX_SQL)
+
+    for table in ("applications", "submissions"):
+        cur.execute(f"DELETE FROM {table} WHERE user_id LIKE %s", (USER_PREFIX + "%",))
+    cur.execute("DELETE FROM users WHERE id LIKE %s", (USER_PREFIX + "%",))
+
+    user_ids = [f"{USER_PREFIX}{i}" for i in range(users)]
+    seed_user = f"{USER_PREFIX}seed"
+    cur.executemany("""
+        INSERT INTO users (id, email, first_name, created_at, updated_at)
+        VALUES (%s, %s, %s, NOW(), NOW())
+    """, [(u, f"{u}@loadtest.local", u) for u in user_ids + [seed_user]])
+
+    subs = seed_submission_rows(seed_user, rng)
+    cur.executemany("""
+        INSERT INTO submissions (
+            user_id, company, role, experience_type, theme,
+            application_stages, interview_experience, assessment_centre,
+            program_structure, salary_benefits, culture_environment,
+            hours_workload, practice_areas, general_experience,
+            pro_tip, advice, created_at
+        ) VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s)
+    """, subs)
+
+    apps = generate_applications(applications, user_ids, rng)
+    cur.executemany("""
+        INSERT INTO applications (
+            user_id, company, role, application_date, university, wam,
+            status, response_date, priority, notes, created_at, updated_at
+        ) VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, NOW())
+    """, apps)
+
+    conn.commit()
+    cur.close()
+    company_summary.refresh_all(conn)
+    conn.close()
+    return {"users": len(user_ids) + 1, "submissions": len(subs), "applications": len(apps)}
+
+# --- Routes under test ------------------------------------------------------
+# Each route builds (method, path, form body or None, headers) from the shared RNG.
+def _auth_headers(rng: random.Random) -> Dict[str, str]:
+    uid = f"{USER_PREFIX}{rng.randint(0, 9)}"
+    return {"X-Replit-User-Id": uid, "X-Replit-User-Name": uid}
+
+def _firm(rng: random.Random) -> str:
+    return urllib.parse.quote(rng.choice(firm_names()[:12]))
+
+ROUTES = {
+    "index": lambda rng: ("GET", "/", None, {}),
+    "company": lambda rng: ("GET", f"/company/{_firm(rng)}", None, {}),
+    "companies": lambda rng: ("GET", "/companies", None, {}),
+    "law_match": lambda rng: ("POST", "/law-match", {
+        "uni": rng.choice(UNIVERSITIES), "wam": f"{rng.uniform(65, 92):.1f}",
+        "interest": rng.choice(INTERESTS), "preference": rng.choice(PREFERENCES),
+        "experience": rng.choice(EXPERIENCE), "location": rng.choice(LOCATIONS), "grad_year": "2025",
+    }, {}),
+    "tracker_analytics": lambda rng: ("GET", "/tracker/analytics", None, _auth_headers(rng)),
+    "company_insights": lambda rng: ("GET", f"/api/company-insights/{_firm(rng)}", None, {}),
+}
+
+# --- Server -----------------------------------------------------------------
+def _free_port() -> int:
+    with socket.socket() as s:
+        s.bind(("127.0.0.1", 0))
+        return s.getsockname()[1]
+
+def _wait_for_port(port: int, timeout: float = 30.0):
+    deadline = time.time() + timeout
+    while time.time() < deadline:
+        try:
+            with socket.create_connection(("127.0.0.1", port), timeout=0.5):
+                return
+        except OSError:
+            time.sleep(0.1)
+    raise RuntimeError(f"server did not start on port {port}")
+
+def start_server(kind: str, port: int, workers: int, threads: int):
+    """Boot main:app; returns a stop() callable."""
+    if kind == "gunicorn":
+        proc = subprocess.Popen([
+            sys.executable, "-m", "gunicorn", "-b", f"127.0.0.1:{port}", "main:app",
+            "--workers", str(workers), "--threads", str(threads), "--timeout", "120",
+        ], env=dict(os.environ))
+        _wait_for_port(port)
+        return lambda: (proc.terminate(), proc.wait(timeout=30))
+
+    import logging
+    from werkzeug.serving import make_server
+    import main
+    logging.getLogger("werkzeug").setLevel(logging.ERROR)
+    server = make_server("127.0.0.1", port, main.app, threaded=True)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    _wait_for_port(port)
+    return server.shutdown
+
+# --- Driver -----------------------------------------------------------------
+def _request(base: str, method: str, path: str, form: Optional[Dict], headers: Dict) -> tuple:
+    data = urllib.parse.urlencode(form).encode() if form is not None else None
+    req = urllib.request.Request(base + path, data=data, method=method, headers=headers)
+    t0 = time.perf_counter()
+    try:
+        with urllib.request.urlopen(req, timeout=60) as resp:
+            resp.read()
+            status = resp.status
+    except urllib.error.HTTPError as e:
+        e.read()
+        status = e.code
+    except Exception:
+        status = 0
+    return time.perf_counter() - t0, status
+
+def _percentile(sorted_vals: List[float], pct: float) -> float:
+    if not sorted_vals:
+        return 0.0
+    k = max(0, min(len(sorted_vals) - 1, int(round(pct / 100 * len(sorted_vals) + 0.5)) - 1))
+    return sorted_vals[k]
+
+def drive(base: str, route: str, requests: int, concurrency: int, seed: int) -> Dict:
+    rng = random.Random(f"{seed}:{route}")
+    calls = [ROUTES[route](rng) for _ in range(requests)]
+    t0 = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=concurrency) as pool:
+        results = list(pool.map(lambda c: _request(base, *c), calls))
+    wall = time.perf_counter() - t0
+    lat = sorted(r[0] * 1000 for r in results)
+    statuses: Dict[str, int] = {}
+    for _, code in results:
+        statuses[str(code)] = statuses.get(str(code), 0) + 1
+    return {
+        "requests": requests,
+        "concurrency": concurrency,
+        "p50_ms": round(_percentile(lat, 50), 2),
+        "p95_ms": round(_percentile(lat, 95), 2),
+        "p99_ms": round(_percentile(lat, 99), 2),
+        "max_ms": round(lat[-1], 2) if lat else 0.0,
+        "throughput_rps": round(requests / wall, 1) if wall > 0 else None,
+        "errors": sum(n for code, n in statuses.items() if not code.startswith(("2", "3"))),
+        "statuses": statuses,
+    }
+
+# --- CLI --------------------------------------------------------------------
+def main():
+    ap = argparse.ArgumentParser(description="Load-test main.py routes against a seeded local database")
+    ap.add_argument("--database-url", default=None,
+                    help="Postgres URL to seed and use (default: temporary SQLite stand-in)")
+    ap.add_argument("--server", choices=["werkzeug", "gunicorn"], default="werkzeug")
+    ap.add_argument("--workers", type=int, default=2, help="gunicorn workers")
+    ap.add_argument("--threads", type=int, default=8, help="gunicorn threads per worker")
+    ap.add_argument("--routes", nargs="+", choices=list(ROUTES), default=list(ROUTES))
+    ap.add_argument("--requests", type=int, default=100, help="Requests per route")
+    ap.add_argument("--concurrency", type=int, default=8)
+    ap.add_argument("--applications", type=int, default=2000, help="Synthetic tracker applications to seed")
+    ap.add_argument("--users", type=int, default=200, help="Synthetic users to seed")
+    ap.add_argument("--seed", type=int, default=42)
+    ap.add_argument("--json", dest="json_out", default=None, help="Write results JSON here")
+    args = ap.parse_args()
+
+    tmpdir = None
+    database_url = args.database_url
+    if not database_url:
+        tmpdir = tempfile.TemporaryDirectory()
+        database_url = "sqlite:///" + os.path.join(tmpdir.name, "loadtest.db")
+
+    counts = seed_database(database_url, args.applications, args.users, args.seed)
+    print(f"Seeded {counts} into {database_url.split('@')[-1]}")
+
+    port = _free_port()
+    stop = start_server(args.server, port, args.workers, args.threads)
+    base = f"http://127.0.0.1:{port}"
+    report = {"server": args.server, "workers": args.workers, "threads": args.threads,
+              "seeded": counts, "routes": {}}
+    try:
+        print(f"{'route':<18} {'p50':>8} {'p95':>8} {'p99':>8} {'rps':>8} {'errors':>7}")
+        for route in args.routes:
+            r = drive(base, route, args.requests, args.concurrency, args.seed)
+            report["routes"][route] = r
+            print(f"{route:<18} {r['p50_ms']:>8.1f} {r['p95_ms']:>8.1f} {r['p99_ms']:>8.1f} "
+                  f"{r['throughput_rps']:>8.1f} {r['errors']:>7}  {r['statuses']}")
+    finally:
+        stop()
+        if tmpdir:
+            tmpdir.cleanup()
+
+    if args.json_out:
+        os.makedirs(os.path.dirname(args.json_out) or ".", exist_ok=True)
+        with open(args.json_out, "w", encoding="utf-8") as g:
+            json.dump(report, g, indent=2)
+        print(f"Wrote {args.json_out}")
+
+if __name__ == "__main__":
+    main()
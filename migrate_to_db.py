@@ -1,7 +1,13 @@
 import json
 import os
+import sys
+import time
+import argparse
 import psycopg2
 from datetime import datetime
+from firm_names import canonical_firm
+from db_bulk import PAGE_ROWS, copy_rows
+import company_summary
 
 def migrate_applications_to_db():
     """Migrate applications from JSON file to database"""
@@ -134,7 +140,7 @@ def migrate_submissions_to_db():
                 ) VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s)
             """, (
                 user_id,
-                sub.get('company'),
+                canonical_firm(sub.get('company'), fuzzy=True) or sub.get('company'),
                 sub.get('role'),
                 sub.get('experience_type'),
                 sub.get('theme'),
@@ -159,6 +165,7 @@ def migrate_submissions_to_db():
     
     conn.commit()
     cur.close()
+    company_summary.refresh_all(conn)
     conn.close()
     
     print(f"Successfully migrated {migrated_count} submissions to database")
@@ -168,8 +175,158 @@ def migrate_submissions_to_db():
         os.rename('submissions.json', 'submissions.json.backup')
         print("Original submissions.json backed up to submissions.json.backup")
 
+# --- Bulk mode ---------------------------------------------------------------
+# COPY both JSON files into temp staging tables, then move them with one
+# set-based statement per target table, all in a single transaction.
+
+APPLICATION_STAGE = ['seq', 'user_id', 'user_name', 'email', 'company', 'role', 'application_date',
+                     'university', 'wam', 'status', 'response_date', 'priority', 'notes',
+                     'created_at', 'updated_at']
+SUBMISSION_STAGE = ['seq', 'user_id', 'user_name', 'email', 'company', 'role', 'experience_type', 'theme',
+                    'application_stages', 'interview_experience', 'assessment_centre',
+                    'program_structure', 'salary_benefits', 'culture_environment',
+                    'hours_workload', 'practice_areas', 'general_experience',
+                    'pro_tip', 'advice', 'created_at']
+
+def application_row(seq, app, now):
+    """Staging row for one legacy application (None if it has no user_id), same defaults as the loop above"""
+    user_id = app.get('user_id')
+    if not user_id:
+        return None
+    user_name = app.get('user_name', 'Unknown User')
+    return (seq, user_id, user_name, f"{user_name}@replit.local", app.get('company'), app.get('role'),
+            app.get('application_date') or None, app.get('university'), app.get('wam'),
+            app.get('status', 'Applied'), app.get('response_date') or None, app.get('priority', 'Medium'),
+            app.get('notes', ''), app.get('timestamp', now), app.get('updated', now))
+
+def submission_row(seq, sub, now):
+    """Staging row for one legacy submission; ones without a user_id go to 'anonymous'"""
+    user_name = sub.get('user_name', 'Anonymous User')
+    return (seq, sub.get('user_id') or 'anonymous', user_name, f"{user_name}@replit.local",
+            canonical_firm(sub.get('company'), fuzzy=True) or sub.get('company'),
+            sub.get('role'), sub.get('experience_type'), sub.get('theme'),
+            sub.get('application_stages'), sub.get('interview_experience'), sub.get('assessment_centre'),
+            sub.get('program_structure'), sub.get('salary_benefits'), sub.get('culture_environment'),
+            sub.get('hours_workload'), sub.get('practice_areas'), sub.get('general_experience'),
+            sub.get('pro_tip'), sub.get('advice'), sub.get('timestamp', now))
+
+STAGE_SQL = f"""
+    CREATE TEMP TABLE stage_applications (seq integer, {', '.join(c + ' text' for c in APPLICATION_STAGE[1:])}) ON COMMIT DROP;
+    CREATE TEMP TABLE stage_submissions (seq integer, {', '.join(c + ' text' for c in SUBMISSION_STAGE[1:])}) ON COMMIT DROP;
+"""
+
+# First staged row per user wins (applications before submissions, then file
+# order), like the per-row loop. An email another user already has is left NULL
+# instead of failing the whole batch on users.email's unique constraint.
+UPSERT_USERS_SQL = """
+    INSERT INTO users (id, email, first_name, created_at, updated_at)
+    SELECT u.user_id,
+           CASE WHEN u.email_rank = 1 AND NOT EXISTS (
+                    SELECT 1 FROM users x WHERE x.email = u.email AND x.id <> u.user_id)
+                THEN u.email END,
+           u.user_name, NOW(), NOW()
+    FROM (
+        SELECT f.*, ROW_NUMBER() OVER (PARTITION BY f.email ORDER BY f.src, f.seq) AS email_rank
+        FROM (
+            SELECT DISTINCT ON (user_id) user_id, user_name, email, src, seq
+            FROM (SELECT user_id, user_name, email, 0 AS src, seq FROM stage_applications
+                  UNION ALL
+                  SELECT user_id, user_name, email, 1 AS src, seq FROM stage_submissions) s
+            ORDER BY user_id, src, seq
+        ) f
+    ) u
+    ON CONFLICT (id) DO UPDATE SET updated_at = NOW()
+"""
+
+INSERT_APPLICATIONS_SQL = """
+    INSERT INTO applications (
+        user_id, company, role, application_date, university, wam,
+        status, response_date, priority, notes, created_at, updated_at
+    )
+    SELECT user_id, company, role, application_date::date, university, wam,
+           status, response_date::date, priority, notes, created_at::timestamp, updated_at::timestamp
+    FROM stage_applications ORDER BY seq
+"""
+
+INSERT_SUBMISSIONS_SQL = """
+    INSERT INTO submissions (
+        user_id, company, role, experience_type, theme,
+        application_stages, interview_experience, assessment_centre,
+        program_structure, salary_benefits, culture_environment,
+        hours_workload, practice_areas, general_experience,
+        pro_tip, advice, created_at
+    )
+    SELECT user_id, company, role, experience_type, theme,
+           application_stages, interview_experience, assessment_centre,
+           program_structure, salary_benefits, culture_environment,
+           hours_workload, practice_areas, general_experience,
+           pro_tip, advice, created_at::timestamp
+    FROM stage_submissions ORDER BY seq
+"""
+
+def _load_json(path):
+    if not os.path.exists(path):
+        print(f"No {path} found, skipping")
+        return []
+    with open(path, 'r') as f:
+        return json.load(f) or []
+
+def bulk_migrate(database_url, applications_path='applications.json', submissions_path='submissions.json',
+                 page_rows=PAGE_ROWS):
+    """Migrate both JSON files with COPY + set-based upserts in one transaction; returns (applications, submissions)"""
+    applications = _load_json(applications_path)
+    submissions = _load_json(submissions_path)
+    if not applications and not submissions:
+        print("Nothing to migrate")
+        return 0, 0
+
+    now = datetime.utcnow().isoformat()
+    app_rows = [r for r in (application_row(i, a, now) for i, a in enumerate(applications)) if r]
+    skipped = len(applications) - len(app_rows)
+    if skipped:
+        print(f"Skipping {skipped} applications with no user_id")
+
+    started = time.perf_counter()
+    conn = psycopg2.connect(database_url)
+    try:
+        with conn:   # one transaction: commits on success, rolls back on any error
+            with conn.cursor() as cur:
+                cur.execute(STAGE_SQL)
+                copy_rows(cur, 'stage_applications', APPLICATION_STAGE, app_rows,
+                          'applications', len(app_rows), page_rows)
+                copy_rows(cur, 'stage_submissions', SUBMISSION_STAGE,
+                          (submission_row(i, s, now) for i, s in enumerate(submissions)),
+                          'submissions', len(submissions), page_rows)
+                for label, sql in [('users', UPSERT_USERS_SQL), ('applications', INSERT_APPLICATIONS_SQL),
+                                   ('submissions', INSERT_SUBMISSIONS_SQL)]:
+                    t0 = time.perf_counter()
+                    cur.execute(sql)
+                    print(f"  {label}: {cur.rowcount} rows written in {time.perf_counter() - t0:.2f}s")
+                print(f"  company_summary: {company_summary.rebuild(cur)} companies")
+    finally:
+        conn.close()
+
+    print(f"Bulk-migrated {len(app_rows)} applications and {len(submissions)} submissions "
+          f"in {time.perf_counter() - started:.1f}s")
+    for path, rows in [(applications_path, app_rows), (submissions_path, submissions)]:
+        if rows:
+            os.rename(path, path + '.backup')
+            print(f"Original {path} backed up to {path}.backup")
+    return len(app_rows), len(submissions)
+
 if __name__ == "__main__":
+    ap = argparse.ArgumentParser(description="Migrate applications.json / submissions.json into the database")
+    ap.add_argument("--bulk", action="store_true", help="COPY + set-based upserts in one transaction")
+    ap.add_argument("--page-rows", type=int, default=PAGE_ROWS, help="Rows per COPY chunk in --bulk mode")
+    args = ap.parse_args()
+
     print("Starting migration to database...")
-    migrate_applications_to_db()
-    migrate_submissions_to_db()
-    print("Migration completed!")
\ No newline at end of file
+    if args.bulk:
+        database_url = os.environ.get('DATABASE_URL')
+        if not database_url:
+            sys.exit("DATABASE_URL not found")
+        bulk_migrate(database_url, page_rows=args.page_rows)
+    else:
+        migrate_applications_to_db()
+        migrate_submissions_to_db()
+    print("Migration completed!")
@@ -0,0 +1,76 @@
+# page_cache.py
+# Rendered-page cache for main.py's public read routes. Anonymous responses are
+# kept per (path, query args, data version), where the data version is the
+# mtime of each source file plus a submissions change stamp. Cached pages carry
+# an ETag and Last-Modified, so browsers and CDNs revalidate with a 304.
+#
+# Signed-in requests (Replit auth header present) always render fresh, since
+# their pages carry the user's nav. With a shared SHARED_STATE_URL store, a page
+# rendered by one worker serves them all.
+
+import os, hashlib, threading
+from functools import wraps
+from flask import request, make_response, Response
+from shared_state import make_cache
+
+AUTH_HEADER = 'X-Replit-User-Id'
+
+def _mtime_ns(path: str) -> int:
+    try:
+        return os.stat(path).st_mtime_ns
+    except OSError:
+        return 0
+
+class PageCache:
+    """Decorator-based response cache; call bump() whenever submissions change."""
+
+    def __init__(self, sources, stamp_path: str, maxsize: int = 256, ttl: float = 300):
+        self.sources = tuple(sources) + (stamp_path,)
+        self.stamp_path = stamp_path
+        self.pages = make_cache('pages', maxsize, ttl)
+        self._changes = 0
+        self._lock = threading.Lock()
+
+    def bump(self):
+        """Invalidate every cached page. The local counter covers this process; the
+        stamp file's mtime reaches the other workers on the host, and clearing a
+        shared store reaches other hosts."""
+        with self._lock:
+            self._changes += 1
+        self.pages.clear()
+        try:
+            with open(self.stamp_path, 'a'):
+                os.utime(self.stamp_path)
+        except OSError as e:
+            print(f"Page cache stamp not updated: {e}")
+
+    def version(self):
+        # A per-process counter in a shared key would split the entries by worker
+        return tuple(_mtime_ns(p) for p in self.sources) + (0 if self.pages.shared else self._changes,)
+
+    def cached(self, fn):
+        @wraps(fn)
+        def wrapper(*args, **kwargs):
+            if request.headers.get(AUTH_HEADER):
+                return fn(*args, **kwargs)
+            version = self.version()
+            key = (request.path, tuple(sorted(request.args.items(multi=True))), version)
+            page = self.pages.get(key)
+            if page is None:
+                rv = make_response(fn(*args, **kwargs))
+                if rv.status_code != 200:
+                    return rv
+                body = rv.get_data()
+                # Last-Modified is the newest source; ETag covers anything finer
+                page = (body, rv.content_type, hashlib.sha1(body).hexdigest(),
+                        max(version[:-1]) / 1e9 or None)
+                self.pages.set(key, page)
+            body, content_type, etag, last_modified = page
+            resp = Response(body, content_type=content_type)
+            resp.set_etag(etag)
+            if last_modified:
+                resp.last_modified = last_modified
+            resp.headers['Cache-Control'] = 'public, no-cache'
+            resp.vary.add(AUTH_HEADER)
+            return resp.make_conditional(request)
+        return wrapper
@@ -1,10 +1,8 @@
 import os
 from flask import request, abort
-from flask_wtf.csrf import CSRFProtect
-from flask_cors import CORS
-from flask_talisman import Talisman
 from flask_limiter import Limiter
 from flask_limiter.util import get_remote_address
+from shared_state import limiter_storage_uri
 
 USE_REPLIT_AUTH = os.getenv("USE_REPLIT_AUTH", "false").lower() == "true"
 CORS_ORIGINS = [o.strip() for o in os.getenv(
@@ -12,6 +10,29 @@ CORS_ORIGINS = [o.strip() for o in os.getenv(
     "http://localhost:3000,https://*.repl.co"
 ).split(",") if o.strip()]
 
+# X-Forwarded-For hops added by proxies in front of the app. 0 (gunicorn serving
+# directly, as in the Dockerfile) keys on the socket peer, since the header is
+# then whatever the client sent; set it to the deployment's proxy count.
+TRUSTED_PROXIES = int(os.getenv("TRUSTED_PROXIES", "0"))
+RATE_LIMITS = ["200/day", "60/hour"]   # harden_app's site-wide defaults
+POST_LIMITS = os.getenv("POST_RATE_LIMITS", "30/minute;300/hour")   # per client, for limiter.limit()
+
+def client_address():
+    """Client IP as reported by the nearest trusted proxy, else the socket peer"""
+    if TRUSTED_PROXIES:
+        hops = [h.strip() for h in request.headers.get("X-Forwarded-For", "").split(",") if h.strip()]
+        if len(hops) >= TRUSTED_PROXIES:
+            return hops[-TRUSTED_PROXIES]
+    return get_remote_address()
+
+def rate_limit(app, default_limits=()):
+    """Limiter counting in the SHARED_STATE_URL store, so limits hold across
+    workers rather than per process. Off unless RATE_LIMIT=1; routes opt in
+    with @limiter.limit(POST_LIMITS, methods=["POST"])."""
+    app.config.setdefault("RATELIMIT_ENABLED", os.getenv("RATE_LIMIT", "0") == "1")
+    return Limiter(client_address, app=app, default_limits=list(default_limits),
+                   storage_uri=limiter_storage_uri())
+
 def get_replit_user(req):
     """Only returns a user dict when USE_REPLIT_AUTH==true AND request came via Replit."""
     if not USE_REPLIT_AUTH:
@@ -26,6 +47,10 @@ def get_replit_user(req):
     return {"id": uid, "name": name}
 
 def harden_app(app):
+    from flask_wtf.csrf import CSRFProtect
+    from flask_cors import CORS
+    from flask_talisman import Talisman
+
     # Secrets / cookies
     app.config.setdefault("SECRET_KEY", os.getenv("SECRET_KEY", "change-me"))
     app.config.setdefault("WTF_CSRF_TIME_LIMIT", None)
@@ -56,7 +81,8 @@ def harden_app(app):
     )
 
     # Basic rate limiting
-    Limiter(get_remote_address, app=app, default_limits=["200/day", "60/hour"])
+    app.config.setdefault("RATELIMIT_ENABLED", True)
+    rate_limit(app, RATE_LIMITS)
 
     if USE_REPLIT_AUTH:
         @app.before_request
@@ -0,0 +1,185 @@
+# seed_db.py
+# Seed the submissions table straight from the CSV generators (seed_from_csv,
+# import_csv) instead of going through submissions.json and create_submission.
+#
+#   python seed_db.py                      # whole Auslaw corpus, one row per comment
+#   python seed_db.py --firms-only         # only comments tied to a firm
+#   python seed_db.py --source sampled     # seed_from_csv's 2-4 per firm
+#   python seed_db.py --source import-csv  # import_csv's generated experiences
+#
+# Re-runs are idempotent: generation is seeded (--seed), row n always gets id
+# SEED_ID_BASE + n, and rows are upserted on id, with seed rows past the end of
+# the new set deleted. Postgres loads via COPY into a temp table and set-based
+# statements in one transaction; a sqlite:/// DATABASE_URL (dev, loadtest)
+# gets the same upserts through executemany.
+
+import os, re, csv, sys, time, random, argparse
+from datetime import datetime
+from firm_names import canonical_firm, EXACT_INDEX
+from db_bulk import PAGE_ROWS, copy_rows
+import company_summary
+
+SEED_ID_BASE = 2_000_000_000   # far above the serial ids real submissions get
+SEED_USER_PREFIX = 'seed_user_'
+SOURCES = ['corpus', 'sampled', 'import-csv']
+AUSLAW_CSV = 'attached_assets/Auslaw_Comments_with_Themes_and_Firms_1754309543165.csv'
+UNATTRIBUTED = 'Unattributed'   # company for corpus comments that name no firm
+
+SEED_COLUMNS = ['id', 'user_id', 'user_name', 'company', 'role', 'experience_type', 'theme',
+                'application_stages', 'interview_experience', 'assessment_centre',
+                'program_structure', 'salary_benefits', 'culture_environment',
+                'hours_workload', 'practice_areas', 'general_experience',
+                'pro_tip', 'advice', 'created_at']
+SUBMISSION_COLUMNS = [c for c in SEED_COLUMNS if c != 'user_name']
+
+# Longest alias first, so "King & Wood Mallesons" wins over "KWM"-style prefixes
+_FIRM_MENTION = re.compile(r"\b(" + "|".join(re.escape(k) for k in sorted(EXACT_INDEX, key=len, reverse=True))
+                           + r")\b", re.IGNORECASE)
+
+def corpus_comments(csv_path=AUSLAW_CSV, firms_only=False):
+    """Every non-empty Auslaw comment as (company, theme, cleaned comment). Company is the
+    tagged Business, else the first firm the comment names, else UNATTRIBUTED."""
+    from seed_from_csv import clean_text
+    out = []
+    with open(csv_path, newline="", encoding="utf-8") as f:
+        for row in csv.DictReader(f):
+            comment = (row.get("Comment") or "").strip()
+            if not comment:
+                continue
+            company = (row.get("Business") or "").strip()
+            company = canonical_firm(company, fuzzy=True) or company
+            if not company:
+                m = _FIRM_MENTION.search(comment)
+                company = EXACT_INDEX[m.group(1).lower()] if m else None
+            if company or not firms_only:
+                out.append((company or UNATTRIBUTED, (row.get("Theme") or "Other").strip(), clean_text(comment)))
+    return out
+
+def build_entries(source, seed, min_per_firm=2, max_per_firm=4, firms_only=False):
+    """Generated submission dicts for `source`, reproducible for a given seed"""
+    random.seed(seed)
+    if source == 'corpus':
+        from seed_from_csv import create_share_story_entry
+        return [create_share_story_entry(*c) for c in corpus_comments(firms_only=firms_only)]
+    if source == 'sampled':
+        from seed_from_csv import build_share_story_submissions
+        return build_share_story_submissions(min_per_firm, max_per_firm)
+    from import_csv import build_experiences
+    entries = build_experiences()[0]
+    for e in entries:
+        e['user_id'] = f"{SEED_USER_PREFIX}{random.randint(1000, 9999)}"
+        e['user_name'] = f"Graduate{random.randint(100, 999)}"
+        if e.get('salary'):
+            e['salary_benefits'] = f"${int(e['salary']):,} base, ${int(e.get('bonus') or 0):,} bonus"
+    return entries
+
+def seed_row(n, entry):
+    """Row in SEED_COLUMNS order for the n-th entry"""
+    user_id = entry.get('user_id') or f"{SEED_USER_PREFIX}{n}"
+    if not user_id.startswith(SEED_USER_PREFIX):
+        user_id = SEED_USER_PREFIX + user_id
+    return (SEED_ID_BASE + n, user_id, entry.get('user_name') or 'Seed User',
+            canonical_firm(entry.get('company'), fuzzy=True) or entry.get('company'),
+            *(entry.get(c) for c in SEED_COLUMNS[4:-1]), entry.get('timestamp'))
+
+# Re-runs refresh content but keep created_at. Only seed users' rows are ever
+# overwritten or deleted, in case a real submission landed in the seed range.
+_SEED_ONLY = f"substr(submissions.user_id, 1, {len(SEED_USER_PREFIX)}) = '{SEED_USER_PREFIX}'"
+_UPSERT_SET = ', '.join(f"{c} = EXCLUDED.{c}" for c in SUBMISSION_COLUMNS[1:-1])
+
+STAGE_SQL = f"""
+    CREATE TEMP TABLE stage_seed (id integer, {', '.join(c + ' text' for c in SEED_COLUMNS[1:])}) ON COMMIT DROP
+"""
+
+UPSERT_USERS_SQL = """
+    INSERT INTO users (id, email, first_name, created_at, updated_at)
+    SELECT DISTINCT ON (user_id) user_id, user_id || '@seed.local', user_name, NOW(), NOW()
+    FROM stage_seed ORDER BY user_id, id
+    ON CONFLICT DO NOTHING
+"""
+
+UPSERT_SUBMISSIONS_SQL = f"""
+    INSERT INTO submissions ({', '.join(SUBMISSION_COLUMNS)})
+    SELECT {', '.join(SUBMISSION_COLUMNS[:-1])}, created_at::timestamp FROM stage_seed ORDER BY id
+    ON CONFLICT (id) DO UPDATE SET {_UPSERT_SET} WHERE {_SEED_ONLY}
+"""
+
+DELETE_STALE_SQL = f"DELETE FROM submissions WHERE id >= %s AND {_SEED_ONLY}"
+
+# sqlite3 has no COPY or DISTINCT ON; the same upserts a row at a time
+SQLITE_USER_SQL = "INSERT INTO users (id, email, first_name) VALUES (%s, %s, %s) ON CONFLICT DO NOTHING"
+SQLITE_SUBMISSION_SQL = f"""
+    INSERT INTO submissions ({', '.join(SUBMISSION_COLUMNS)})
+    VALUES ({', '.join(['%s'] * len(SUBMISSION_COLUMNS))})
+    ON CONFLICT (id) DO UPDATE SET {_UPSERT_SET} WHERE {_SEED_ONLY}
+"""
+
+def _seed_postgres(database_url, rows, page_rows):
+    import psycopg2
+    conn = psycopg2.connect(database_url)
+    try:
+        with conn:   # one transaction: commits on success, rolls back on any error
+            with conn.cursor() as cur:
+                cur.execute(STAGE_SQL)
+                copy_rows(cur, 'stage_seed', SEED_COLUMNS, rows, 'seed', len(rows), page_rows)
+                for label, sql, params in [('users', UPSERT_USERS_SQL, None),
+                                           ('submissions', UPSERT_SUBMISSIONS_SQL, None),
+                                           ('stale', DELETE_STALE_SQL, (SEED_ID_BASE + len(rows),))]:
+                    t0 = time.perf_counter()
+                    cur.execute(sql, params)
+                    print(f"  {label}: {cur.rowcount} rows in {time.perf_counter() - t0:.2f}s")
+                print(f"  company_summary: {company_summary.rebuild(cur)} companies")
+    finally:
+        conn.close()
+
+def _timestamp(value):
+    return datetime.fromisoformat(value) if value else datetime.utcnow()
+
+def _seed_sqlite(path, rows):
+    import db_sqlite
+    db_sqlite.init_schema(path)
+    conn = db_sqlite.connect(path)
+    try:
+        cur = conn.cursor()
+        users = {}
+        for r in rows:
+            users.setdefault(r[1], (r[1], f"{r[1]}@seed.local", r[2]))
+        cur.executemany(SQLITE_USER_SQL, list(users.values()))
+        # datetime objects, so sqlite3 stores the form its TIMESTAMP converter reads back
+        cur.executemany(SQLITE_SUBMISSION_SQL, [r[:2] + r[3:-1] + (_timestamp(r[-1]),) for r in rows])
+        cur.execute(DELETE_STALE_SQL, (SEED_ID_BASE + len(rows),))
+        print(f"  users: {len(users)}, submissions: {len(rows)}, stale removed: {cur.rowcount}")
+        print(f"  company_summary: {company_summary.rebuild(cur, lock=False)} companies")
+        conn.commit()
+    finally:
+        conn.close()
+
+def seed(database_url, source='corpus', seed=0, min_per_firm=2, max_per_firm=4, firms_only=False,
+         page_rows=PAGE_ROWS):
+    """Generate and load seed submissions; returns the number of rows seeded"""
+    t0 = time.perf_counter()
+    entries = build_entries(source, seed, min_per_firm, max_per_firm, firms_only)
+    rows = [seed_row(n, e) for n, e in enumerate(entries)]
+    print(f"Built {len(rows)} {source} rows in {time.perf_counter() - t0:.1f}s")
+    t0 = time.perf_counter()
+    if database_url.startswith('sqlite:///'):
+        _seed_sqlite(database_url[len('sqlite:///'):], rows)
+    else:
+        _seed_postgres(database_url, rows, page_rows)
+    print(f"Seeded {len(rows)} submissions in {time.perf_counter() - t0:.1f}s")
+    return len(rows)
+
+if __name__ == "__main__":
+    ap = argparse.ArgumentParser(description="Bulk-load generated seed submissions into the database")
+    ap.add_argument("--source", choices=SOURCES, default="corpus", help="Which generator to seed from")
+    ap.add_argument("--seed", type=int, default=0, help="Random seed; same seed, same rows")
+    ap.add_argument("--min-per-firm", type=int, default=2, help="For --source sampled")
+    ap.add_argument("--max-per-firm", type=int, default=4, help="For --source sampled")
+    ap.add_argument("--firms-only", action="store_true", help="For --source corpus: skip comments naming no firm")
+    ap.add_argument("--page-rows", type=int, default=PAGE_ROWS, help="Rows per COPY chunk")
+    args = ap.parse_args()
+
+    database_url = os.environ.get('DATABASE_URL')
+    if not database_url:
+        sys.exit("DATABASE_URL not found")
+    seed(database_url, args.source, args.seed, args.min_per_firm, args.max_per_firm, args.firms_only, args.page_rows)
@@ -4,6 +4,7 @@
 import csv, re, os, json, argparse, statistics, random
 from typing import List, Dict, Optional, Tuple
 from datetime import datetime, timedelta
+from firm_names import canonical_firm
 
 CSV_PATHS = ["law_raw.csv", "law_whirlpool_2018_2025.csv", "raw_all.csv"]
 
@@ -65,6 +66,7 @@ def load_csv_data() -> List[Dict]:
         reader = csv.DictReader(f)
         for row in reader:
             company = row.get("Business", "").strip()
+            company = canonical_firm(company, fuzzy=True) or company
             theme = row.get("Theme", "Other").strip()
             comment = row.get("Comment", "").strip()
             
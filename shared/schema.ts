@@ -7,6 +7,7 @@ import {
   varchar,
   text,
   integer,
+  bigint,
   date,
 } from "drizzle-orm/pg-core";
 
@@ -52,7 +53,11 @@ export const applications = pgTable("applications", {
   notes: text("notes"),
   createdAt: timestamp("created_at").defaultNow(),
   updatedAt: timestamp("updated_at").defaultNow(),
-});
+}, (table) => [
+  // Kept in step with db_indexes.py
+  index("applications_user_created_idx").on(table.userId, table.createdAt.desc()),
+  index("applications_company_status_idx").on(sql`lower(${table.company})`, table.status),
+]);
 
 export type Application = typeof applications.$inferSelect;
 export type InsertApplication = typeof applications.$inferInsert;
@@ -77,7 +82,24 @@ export const submissions = pgTable("submissions", {
   proTip: text("pro_tip"),
   advice: text("advice"),
   createdAt: timestamp("created_at").defaultNow(),
-});
+}, (table) => [
+  index("submissions_company_idx").on(sql`lower(${table.company})`),
+]);
 
 export type Submission = typeof submissions.$inferSelect;
-export type InsertSubmission = typeof submissions.$inferInsert;
\ No newline at end of file
+export type InsertSubmission = typeof submissions.$inferInsert;
+
+// Per-company totals over submissions (maintained by company_summary.py)
+export const companySummary = pgTable("company_summary", {
+  company: varchar("company").primaryKey(),
+  totalSubmissions: integer("total_submissions").notNull().default(0),
+  successCount: integer("success_count").notNull().default(0),
+  salaryTotal: bigint("salary_total", { mode: "number" }).notNull().default(0),
+  salaryCount: integer("salary_count").notNull().default(0),
+  recentRoles: text("recent_roles").notNull().default("[]"),
+  recentIds: text("recent_ids").notNull().default("[]"),
+  lastSubmissionAt: timestamp("last_submission_at"),
+  refreshedAt: timestamp("refreshed_at"),
+});
+
+export type CompanySummary = typeof companySummary.$inferSelect;
\ No newline at end of file
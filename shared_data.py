@@ -0,0 +1,259 @@
+# shared_data.py
+# Read-only datasets shared by every gunicorn worker. The signals CSV is held
+# once as a compact column store (SignalTable) that grad_data, grad_data_v2
+# and law_match_profiles read instead of re-parsing the file.
+# With preload on (gunicorn.conf.py), preload() builds the table, the firm
+# profiles, the law-match feature matrix and the firm-alias indexes in the
+# master and freezes them out of the GC before fork, so workers share those
+# pages copy-on-write rather than each building their own.
+#
+#   python shared_data.py report <gunicorn master pid>   # RSS/PSS per worker
+
+import gc, os, csv, sys, math, threading
+from array import array
+from typing import Dict, List, Optional, Tuple
+
+# Dropped when the table is loaded, so author details never reach a page
+PRIVATE_FIELDS = ('author', 'username', 'user', 'Author', 'User', 'USERNAME', 'name', 'Name')
+
+_NAN = float('nan')
+
+def _code_array(codes: List[int], n_values: int) -> array:
+    return array('B' if n_values <= 0xFF else 'H' if n_values <= 0xFFFF else 'I', codes)
+
+class _CategoryColumn:
+    """Few distinct strings: interned values plus one small code per row."""
+    __slots__ = ('values', 'codes')
+
+    def __init__(self, values: Tuple, codes: array):
+        self.values, self.codes = values, codes
+
+    def __getitem__(self, i: int):
+        return self.values[self.codes[i]]
+
+    def nbytes(self) -> int:
+        return (sys.getsizeof(self.values) + sys.getsizeof(self.codes)
+                + sum(sys.getsizeof(v) for v in self.values if v is not None))
+
+class _TextPool:
+    """Distinct free-text values for a whole table, packed into one UTF-8 blob.
+    Columns share it, so e.g. evidence_clean costs nothing where it equals evidence_span."""
+    __slots__ = ('blob', 'offsets', '_codes')
+
+    def __init__(self):
+        self.blob, self.offsets, self._codes = b'', array('I', [0]), {}
+
+    def add(self, value: str) -> int:
+        return self._codes.setdefault(value, len(self._codes))
+
+    def pack(self):
+        encoded = [v.encode('utf-8') for v in self._codes]
+        for b in encoded:
+            self.offsets.append(self.offsets[-1] + len(b))
+        self.blob = b''.join(encoded)
+        self._codes = None
+
+    def __getitem__(self, code: int) -> str:
+        return self.blob[self.offsets[code]:self.offsets[code + 1]].decode('utf-8')
+
+    def nbytes(self) -> int:
+        return sys.getsizeof(self.blob) + sys.getsizeof(self.offsets)
+
+class _TextColumn:
+    """Free text: one code per row into the table's _TextPool."""
+    __slots__ = ('pool', 'codes')
+
+    def __init__(self, pool: _TextPool, codes: array):
+        self.pool, self.codes = pool, codes
+
+    def __getitem__(self, i: int) -> str:
+        return self.pool[self.codes[i]]
+
+    def nbytes(self) -> int:
+        return sys.getsizeof(self.codes)
+
+class _NumberColumn:
+    """Numeric strings kept as doubles; they format back to the exact CSV text."""
+    __slots__ = ('values', 'ints')
+
+    def __init__(self, values: array, ints: bool):
+        self.values, self.ints = values, ints
+
+    def __getitem__(self, i: int) -> str:
+        x = self.values[i]
+        if x != x:
+            return ''
+        return str(int(x)) if self.ints else repr(x)
+
+    def nbytes(self) -> int:
+        return sys.getsizeof(self.values)
+
+def _number_column(values: List) -> Optional[_NumberColumn]:
+    """A _NumberColumn if every value round-trips through float (or is empty), else None."""
+    out = array('d')
+    ints = floats = True
+    for v in values:
+        if v == '':
+            out.append(_NAN)
+            continue
+        try:
+            x = float(v)
+        except (TypeError, ValueError):
+            return None
+        if not math.isfinite(x):
+            return None
+        ints = ints and abs(x) < 2 ** 53 and x == int(x) and v == str(int(x))
+        floats = floats and v == repr(x)
+        if not (ints or floats):
+            return None
+        out.append(x)
+    return _NumberColumn(out, ints)
+
+def _encode(values: List, pool: _TextPool):
+    column = _number_column(values)
+    if column is not None:
+        return column
+    distinct: Dict = {}
+    codes = [distinct.setdefault(v, len(distinct)) for v in values]
+    if len(distinct) <= 0xFF or None in distinct:
+        return _CategoryColumn(tuple(sys.intern(v) if v is not None else None for v in distinct),
+                               _code_array(codes, len(distinct)))
+    codes = [pool.add(v) for v in values]
+    return _TextColumn(pool, array('I', codes))
+
+class SignalTable:
+    """Signals CSV as a struct of arrays, one encoded column per CSV column.
+
+    Rows are materialized as fresh dicts on access (callers may mutate them);
+    firm_rows() slices by firm through a per-firm row index."""
+    __slots__ = ('columns', 'data', 'length', 'pool', 'firm_index')
+
+    def __init__(self, columns: Tuple[str, ...], data: Tuple, length: int, pool: Optional[_TextPool] = None):
+        self.columns = columns
+        self.pool = pool
+        self.data = dict(zip(columns, data))
+        self.length = length
+        index: Dict[str, array] = {}
+        if 'firm_name' in self.data:
+            firms = self.data['firm_name']
+            for i in range(length):
+                index.setdefault((firms[i] or '').lower(), array('I')).append(i)
+        self.firm_index = index
+
+    @classmethod
+    def from_csv(cls, csv_path: str) -> 'SignalTable':
+        with open(csv_path, newline='', encoding='utf-8') as f:
+            reader = csv.reader(f)
+            header = next(reader, [])
+            keep = [i for i, c in enumerate(header) if c not in PRIVATE_FIELDS]
+            width = len(header)
+            cols = [[] for _ in keep]
+            for rec in reader:
+                if not rec:
+                    continue
+                if len(rec) < width:   # short rows read as None, like DictReader
+                    rec = rec + [None] * (width - len(rec))
+                for col, i in zip(cols, keep):
+                    col.append(rec[i])
+        length = len(cols[0]) if cols else 0
+        pool = _TextPool()
+        data = tuple(_encode(c, pool) for c in cols)
+        pool.pack()
+        return cls(tuple(header[i] for i in keep), data, length, pool)
+
+    def __len__(self):
+        return self.length
+
+    def __iter__(self):
+        for i in range(self.length):
+            yield self.row(i)
+
+    def row(self, i: int, fields=None) -> Dict:
+        data = self.data
+        return {f: (data[f][i] if f in data else None) for f in (fields or self.columns)}
+
+    def rows(self, fields=None, ids=None) -> List[Dict]:
+        """Fresh row dicts (all columns, or just `fields`), for every row or the given ids."""
+        return [self.row(i, fields) for i in (range(self.length) if ids is None else ids)]
+
+    def firm_rows(self, firm: str, fields=None) -> List[Dict]:
+        """Rows whose firm_name matches `firm` case-insensitively, in file order."""
+        return self.rows(fields, self.firm_index.get((firm or '').lower(), ()))
+
+    def nbytes(self) -> int:
+        return (sum(c.nbytes() for c in self.data.values()) + (self.pool.nbytes() if self.pool else 0)
+                + sum(sys.getsizeof(k) + sys.getsizeof(ids) for k, ids in self.firm_index.items()))
+
+_TABLES: Dict[str, Tuple] = {}   # csv_path -> (mtime, SignalTable)
+_lock = threading.Lock()
+
+def signal_table(csv_path: str) -> Optional[SignalTable]:
+    """Shared SignalTable for csv_path (None if missing); reloaded when its mtime changes."""
+    try:
+        mtime = os.path.getmtime(csv_path)
+    except OSError:
+        return None
+    cached = _TABLES.get(csv_path)
+    if cached and cached[0] == mtime:
+        return cached[1]
+    with _lock:
+        cached = _TABLES.get(csv_path)
+        if cached and cached[0] == mtime:
+            return cached[1]
+        table = SignalTable.from_csv(csv_path)
+        _TABLES[csv_path] = (mtime, table)
+        return table
+
+def preload(csv_path: Optional[str] = None, uni_data: Optional[Dict] = None) -> Dict:
+    """Build every shared dataset now, then gc.freeze() them. Call in the master before fork."""
+    from law_match_profiles import get_firm_profiles, SIGNALS_CSV
+    from law_match_engine import get_matrix
+    import firm_names   # alias indexes are built at import
+    csv_path = csv_path or SIGNALS_CSV
+    table = signal_table(csv_path)
+    firm_profiles, firm_data_lookup = get_firm_profiles(csv_path)
+    if uni_data is None:
+        uni_data = getattr(sys.modules.get('main'), 'FIRM_UNIVERSITY_DATA', None)
+    if uni_data is not None:
+        get_matrix(firm_profiles, firm_data_lookup, uni_data)
+    gc.collect()
+    # Frozen objects are skipped by the collector, so its passes in the workers
+    # don't write to (and un-share) the preloaded pages
+    gc.freeze()
+    return {'signals': len(table) if table else 0,
+            'signals_kb': table.nbytes() // 1024 if table else 0, 'firms': len(firm_profiles),
+            'aliases': len(firm_names.EXACT_INDEX), 'frozen': gc.get_freeze_count()}
+
+# --- Memory report ----------------------------------------------------------
+def memory_usage(pid='self') -> Dict[str, int]:
+    """kB from /proc/<pid>/smaps_rollup: rss, pss, shared (clean+dirty), private (clean+dirty)."""
+    fields = {}
+    with open(f'/proc/{pid}/smaps_rollup') as f:
+        for line in f:
+            parts = line.split()
+            if len(parts) >= 2 and parts[0].endswith(':') and parts[1].isdigit():
+                fields[parts[0][:-1]] = int(parts[1])
+    return {'rss': fields.get('Rss', 0), 'pss': fields.get('Pss', 0),
+            'shared': fields.get('Shared_Clean', 0) + fields.get('Shared_Dirty', 0),
+            'private': fields.get('Private_Clean', 0) + fields.get('Private_Dirty', 0)}
+
+def format_usage(usage: Dict[str, int]) -> str:
+    return '  '.join(f"{k}={v / 1024:.1f}MB" for k, v in usage.items())
+
+def worker_pids(master_pid: int) -> List[int]:
+    with open(f'/proc/{master_pid}/task/{master_pid}/children') as f:
+        return [int(p) for p in f.read().split()]
+
+def report(master_pid: int):
+    """Print memory for a gunicorn master and each of its workers."""
+    total_pss = 0
+    for label, pid in [('master', master_pid)] + [('worker', p) for p in worker_pids(master_pid)]:
+        usage = memory_usage(pid)
+        total_pss += usage['pss']
+        print(f"{label:<7} {pid:>7}  {format_usage(usage)}")
+    print(f"total PSS {total_pss / 1024:.1f}MB")
+
+if __name__ == '__main__':
+    if len(sys.argv) != 3 or sys.argv[1] != 'report':
+        raise SystemExit("usage: python shared_data.py report <gunicorn master pid>")
+    report(int(sys.argv[2]))
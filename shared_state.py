@@ -0,0 +1,228 @@
+# shared_state.py
+# Where the response caches (page_cache, main's LAW_MATCH_CACHE) and the rate
+# limiter (security.harden_app) keep their state. The default is per process,
+# so with several gunicorn workers or autoscale instances each one renders its
+# own pages and counts its own requests. SHARED_STATE_URL picks a shared store:
+#
+#   memory://                      per-process TTLCache / flask-limiter memory (default)
+#   sqlite:////tmp/lawgrad_state.db  one file for every worker on the host
+#   redis://host:6379/0            every instance (needs the redis package)
+#
+# Cached values are pickled into the store, so it must be private to the app.
+# The SQLite limiter storage supports flask-limiter's default fixed-window
+# strategy only.
+
+import os, time, pickle, sqlite3, hashlib, threading
+from cache import TTLCache
+
+SHARED_STATE_URL = os.environ.get('SHARED_STATE_URL', 'memory://')
+
+def _digest(key) -> str:
+    # Cache keys are tuples of str/int/float, whose repr is stable across processes
+    return hashlib.sha1(repr(key).encode()).hexdigest()
+
+# --- SQLite (single host) ---------------------------------------------------------
+SQLITE_SCHEMA = """
+CREATE TABLE IF NOT EXISTS cache_entries (
+    namespace TEXT NOT NULL,
+    key TEXT NOT NULL,
+    expires_at REAL NOT NULL,
+    value BLOB NOT NULL,
+    PRIMARY KEY (namespace, key)
+);
+CREATE INDEX IF NOT EXISTS cache_entries_expiry_idx ON cache_entries (namespace, expires_at);
+CREATE TABLE IF NOT EXISTS rate_limits (
+    key TEXT PRIMARY KEY,
+    count INTEGER NOT NULL,
+    expires_at REAL NOT NULL
+);
+"""
+
+class SQLiteStore:
+    """One connection per thread per process onto a WAL-mode file, so forked
+    workers and their threads never share a handle."""
+
+    def __init__(self, path: str):
+        self.path = path
+        self._local = threading.local()
+        conn = self.connect()
+        conn.executescript(SQLITE_SCHEMA)
+
+    def connect(self) -> sqlite3.Connection:
+        conn = getattr(self._local, 'conn', None)
+        if conn is None or self._local.pid != os.getpid():
+            conn = sqlite3.connect(self.path, timeout=5, isolation_level=None, check_same_thread=False)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            self._local.conn, self._local.pid = conn, os.getpid()
+        return conn
+
+_stores = {}
+_stores_lock = threading.Lock()
+
+def sqlite_store(url: str) -> SQLiteStore:
+    path = url[len('sqlite:///'):]
+    with _stores_lock:
+        if path not in _stores:
+            _stores[path] = SQLiteStore(path)
+        return _stores[path]
+
+class SQLiteCache:
+    """TTLCache interface over a SQLiteStore table. Entries expire `ttl` seconds
+    after being set; past maxsize the oldest-set ones are dropped."""
+    shared = True
+
+    def __init__(self, store: SQLiteStore, namespace: str, maxsize: int = 1024, ttl: float = 600):
+        self.store, self.namespace = store, namespace
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.hits = 0     # this process's lookups; the entries themselves are shared
+        self.misses = 0
+
+    def get(self, key, default=None):
+        row = self.store.connect().execute(
+            "SELECT value FROM cache_entries WHERE namespace = ? AND key = ? AND expires_at > ?",
+            (self.namespace, _digest(key), time.time())).fetchone()
+        if row is None:
+            self.misses += 1
+            return default
+        self.hits += 1
+        return pickle.loads(row[0])
+
+    def set(self, key, value):
+        now = time.time()
+        conn = self.store.connect()
+        conn.execute("INSERT OR REPLACE INTO cache_entries (namespace, key, expires_at, value) VALUES (?, ?, ?, ?)",
+                     (self.namespace, _digest(key), now + self.ttl, pickle.dumps(value, pickle.HIGHEST_PROTOCOL)))
+        conn.execute("""
+            DELETE FROM cache_entries WHERE namespace = ? AND (expires_at <= ? OR key IN (
+                SELECT key FROM cache_entries WHERE namespace = ? ORDER BY expires_at DESC LIMIT -1 OFFSET ?))
+        """, (self.namespace, now, self.namespace, self.maxsize))
+
+    def clear(self):
+        self.store.connect().execute("DELETE FROM cache_entries WHERE namespace = ?", (self.namespace,))
+
+    def stats(self) -> dict:
+        size = self.store.connect().execute(
+            "SELECT COUNT(*) FROM cache_entries WHERE namespace = ? AND expires_at > ?",
+            (self.namespace, time.time())).fetchone()[0]
+        return {'backend': 'sqlite', 'size': size, 'maxsize': self.maxsize, 'ttl': self.ttl,
+                'hits': self.hits, 'misses': self.misses}
+
+# Resets an expired window and increments in one statement, so concurrent
+# workers never both start a fresh window for the same key
+INCR_SQL = """
+    INSERT INTO rate_limits (key, count, expires_at) VALUES (?, ?, ?)
+    ON CONFLICT (key) DO UPDATE SET
+        count = CASE WHEN rate_limits.expires_at <= ? THEN excluded.count ELSE rate_limits.count + excluded.count END,
+        expires_at = CASE WHEN rate_limits.expires_at <= ? THEN excluded.expires_at ELSE rate_limits.expires_at END
+    RETURNING count
+"""
+
+_limits_storage = None
+
+def _register_sqlite_limits_storage():
+    """Define (and so register with `limits`) a storage for sqlite:/// URIs"""
+    global _limits_storage
+    if _limits_storage is not None:
+        return
+    from limits.storage import Storage
+
+    class SQLiteLimitsStorage(Storage):
+        STORAGE_SCHEME = ['sqlite']
+
+        def __init__(self, uri: str, wrap_exceptions: bool = False, **options):
+            self.store = sqlite_store(uri)
+            super().__init__(uri, wrap_exceptions=wrap_exceptions, **options)
+
+        @property
+        def base_exceptions(self):
+            return sqlite3.Error
+
+        def incr(self, key: str, expiry: float, amount: int = 1) -> int:
+            now = time.time()
+            return self.store.connect().execute(INCR_SQL, (key, amount, now + expiry, now, now)).fetchone()[0]
+
+        def get(self, key: str) -> int:
+            row = self.store.connect().execute(
+                "SELECT count FROM rate_limits WHERE key = ? AND expires_at > ?", (key, time.time())).fetchone()
+            return row[0] if row else 0
+
+        def get_expiry(self, key: str) -> float:
+            row = self.store.connect().execute(
+                "SELECT expires_at FROM rate_limits WHERE key = ? AND expires_at > ?", (key, time.time())).fetchone()
+            return row[0] if row else time.time()
+
+        def check(self) -> bool:
+            try:
+                self.store.connect().execute("SELECT 1")
+                return True
+            except sqlite3.Error:
+                return False
+
+        def reset(self) -> int:
+            return self.store.connect().execute("DELETE FROM rate_limits").rowcount
+
+        def clear(self, key: str) -> None:
+            self.store.connect().execute("DELETE FROM rate_limits WHERE key = ?", (key,))
+
+    _limits_storage = SQLiteLimitsStorage
+
+# --- Redis (every instance) ---------------------------------------------------------
+class RedisCache:
+    """TTLCache interface over Redis. Entries expire server-side after `ttl`;
+    maxsize is left to the server's maxmemory policy."""
+    shared = True
+
+    def __init__(self, url: str, namespace: str, maxsize: int = 1024, ttl: float = 600):
+        import redis
+        self.client = redis.Redis.from_url(url)
+        self.prefix = f"cache:{namespace}:"
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key, default=None):
+        value = self.client.get(self.prefix + _digest(key))
+        if value is None:
+            self.misses += 1
+            return default
+        self.hits += 1
+        return pickle.loads(value)
+
+    def set(self, key, value):
+        self.client.set(self.prefix + _digest(key), pickle.dumps(value, pickle.HIGHEST_PROTOCOL),
+                        px=int(self.ttl * 1000))
+
+    def _keys(self):
+        return self.client.scan_iter(match=self.prefix + '*', count=500)
+
+    def clear(self):
+        keys = list(self._keys())
+        if keys:
+            self.client.delete(*keys)
+
+    def stats(self) -> dict:
+        return {'backend': 'redis', 'size': sum(1 for _ in self._keys()), 'maxsize': self.maxsize,
+                'ttl': self.ttl, 'hits': self.hits, 'misses': self.misses}
+
+# --- Selection ------------------------------------------------------------------------
+def make_cache(namespace: str, maxsize: int = 1024, ttl: float = 600, url: str = None):
+    """A TTLCache-compatible cache in the SHARED_STATE_URL store; `namespace`
+    keeps callers sharing one store apart"""
+    url = url or SHARED_STATE_URL
+    if url.startswith('sqlite:///'):
+        return SQLiteCache(sqlite_store(url), namespace, maxsize, ttl)
+    if url.startswith(('redis://', 'rediss://')):
+        return RedisCache(url, namespace, maxsize, ttl)
+    if url != 'memory://':
+        raise ValueError(f"Unsupported SHARED_STATE_URL: {url}")
+    return TTLCache(maxsize, ttl)
+
+def limiter_storage_uri(url: str = None) -> str:
+    """flask-limiter storage_uri for the SHARED_STATE_URL store"""
+    url = url or SHARED_STATE_URL
+    if url.startswith('sqlite:///'):
+        _register_sqlite_limits_storage()
+    return url
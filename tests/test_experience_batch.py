@@ -0,0 +1,47 @@
+# tests/test_experience_batch.py
+# The vectorized scorer must reproduce the scalar functions it replaces: v3's
+# clean_whirlpool_text / answer_like / quality_score and the value filter's
+# clean_text / passes_answer_gate / value_score, post by post, on the bench
+# corpus snapshot.
+
+import pandas as pd
+import pytest
+
+import experience_batch as eb
+import experience_quality_v3 as v3
+import experience_value_filter as vf
+
+SNAPSHOT = "bench/corpus_snapshot.csv"
+
+@pytest.fixture(scope='module')
+def raw():
+    return pd.read_csv(SNAPSHOT, dtype=str)["content"].fillna("").tolist()
+
+@pytest.fixture(scope='module')
+def clean(raw):
+    return [c for c in (v3.clean_whirlpool_text(t) for t in raw) if c]
+
+def test_clean_series_matches_scalar(raw):
+    got = eb.clean_series(raw).tolist()
+    assert got == [v3.clean_whirlpool_text(t) for t in raw]
+    assert got == [vf.clean_text(t) for t in raw]
+
+def test_quality_matches_v3(clean):
+    scored = eb.score_posts(clean)
+    assert scored["answer_like"].tolist() == [v3.answer_like(t) for t in clean]
+    assert scored["quality_score"].tolist() == [v3.quality_score(t) for t in clean]
+
+def test_value_matches_value_filter(clean):
+    scored = eb.score_posts(clean)
+    assert scored["passes_answer_gate"].tolist() == [vf.passes_answer_gate(t) for t in clean]
+    assert scored["value_score"].tolist() == [vf.value_score(t) for t in clean]
+
+def test_value_uses_value_filter_terms(clean, monkeypatch):
+    # Diverge the value filter's lists from v3's: only the value columns may follow
+    monkeypatch.setattr(vf, "PROGRAM_TERMS", vf.PROGRAM_TERMS[:2] + ["firm"])
+    monkeypatch.setattr(vf, "PAST_TENSE", vf.PAST_TENSE[:3])
+    monkeypatch.setattr(vf, "MONTHS", "jan|feb")
+    scored = eb.score_posts(clean)
+    assert scored["passes_answer_gate"].tolist() == [vf.passes_answer_gate(t) for t in clean]
+    assert scored["value_score"].tolist() == [vf.value_score(t) for t in clean]
+    assert scored["quality_score"].tolist() == [v3.quality_score(t) for t in clean]
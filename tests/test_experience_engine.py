@@ -0,0 +1,48 @@
+# tests/test_experience_engine.py
+# Every registered profile must reproduce the filter module it replaces: same
+# score, question/answer gate and kept posts, post by post, on the bench corpus
+# snapshot.
+
+import pandas as pd
+import pytest
+
+import experience_engine as ee
+import experience_filter as basic
+import experience_quality as v1
+import experience_quality_v2 as v2
+import experience_quality_v3 as v3
+import experience_value_filter as vf
+
+SNAPSHOT = "bench/corpus_snapshot.csv"
+
+# profile -> (scalar score, scalar gate)
+REFERENCE = {
+    "strict": (v3.quality_score, v3.answer_like),
+    "value": (vf.value_score, vf.passes_answer_gate),
+    "lenient": (lambda t: v2.quality_score(t)[0], lambda t: not v2.is_question(t)),
+    "legacy": (lambda t: v1.quality_score(t)[0], lambda t: not v1.is_question(t)),
+    "basic": (basic.compute_quality_score, lambda t: not basic.is_question(t)),
+}
+
+@pytest.fixture(scope='module')
+def clean():
+    raw = pd.read_csv(SNAPSHOT, dtype=str)["content"].fillna("").tolist()
+    return [c for c in (v3.clean_whirlpool_text(t) for t in raw) if c]
+
+@pytest.fixture(scope='module')
+def scored(clean):
+    return ee.evaluate(ee.extract_features(clean))
+
+def test_every_profile_has_a_reference():
+    assert set(ee.PROFILES) == set(REFERENCE)
+
+@pytest.mark.parametrize("name", sorted(REFERENCE))
+def test_profile_matches_scalar(name, clean, scored):
+    score_fn, gate_fn = REFERENCE[name]
+    want_score = [score_fn(t) for t in clean]
+    want_gate = [gate_fn(t) for t in clean]
+    min_score = ee.PROFILES[name]["min_score"]
+    score, gate = ee.PROFILES[name]["fn"](scored)
+    assert score.tolist() == want_score
+    assert gate.tolist() == want_gate
+    assert scored[f"{name}_keep"].tolist() == [g and s >= min_score for s, g in zip(want_score, want_gate, strict=True)]
@@ -0,0 +1,360 @@
+# tests/test_law_match_engine.py
+# The vectorized scorer must reproduce the original per-firm if/elif loop from
+# main.py exactly: same scores (bit for bit, int/float type included), reasons,
+# confidence and shortlist, for random candidates across every month.
+
+import random
+from datetime import datetime
+from typing import Dict, List, Optional, Tuple
+
+import pytest
+
+from law_match_engine import INTEREST_KEYWORDS, rank_candidates, score_firms, select_top_firms
+from law_match_profiles import get_firm_profiles, SIGNALS_CSV
+
+N_CANDIDATES = 5000
+SEED = 7
+
+def score_firms_reference(candidate: Dict, firm_profiles: Dict[str, Dict], firm_data_lookup: Dict[str, Dict],
+                          uni_data: Dict[str, Dict], month: Optional[int] = None) -> Dict[str, Dict]:
+    """The original per-firm scoring loop from main.py, the oracle for score_firms()."""
+    uni, wam = candidate['uni'], candidate['wam']
+    interest, preference = candidate['interest'], candidate['preference']
+    experience, location = candidate['experience'], candidate['location']
+    grad_year = candidate['grad_year']
+    month = month or datetime.now().month
+
+    # Enhanced data-driven scoring algorithm
+    firm_scores = {}
+    
+    for firm, profile in firm_profiles.items():
+        score = 40.0  # Lower base score to emphasize data-driven factors
+        reasons = []
+        confidence_factors = []
+        
+        # Market activity bonus (based on real CSV data)
+        activity_score = profile.get('market_activity', 0) * 15
+        if activity_score >= 10:
+            score += activity_score
+            reasons.append("High recent graduate recruitment activity")
+            confidence_factors.append('active_recruiting')
+        elif activity_score >= 5:
+            score += activity_score
+            reasons.append("Active graduate recruitment")
+            confidence_factors.append('moderate_recruiting')
+        
+        # Data confidence bonus (how reliable our insights are)
+        csv_confidence = profile.get('csv_confidence', 0.5)
+        csv_mentions = profile.get('csv_mentions', 0)
+        if csv_confidence >= 0.8 and csv_mentions >= 10:
+            score += 8
+            confidence_factors.append('high_data_quality')
+        elif csv_confidence >= 0.7 and csv_mentions >= 5:
+            score += 5
+            confidence_factors.append('good_data_quality')
+        
+        # University representation (weighted by firm tier and data quality)
+        uni_percentage = uni_data.get(firm, {}).get(uni, uni_data.get(firm, {}).get('Other', 0))
+        data_weight = 1.0 + (profile.get('csv_confidence', 0.5) - 0.5)  # Boost for high-quality data
+        tier_weight = 1.5 if profile['tier'] == 'top' else 1.2 if profile['tier'] == 'mid-top' else 1.0
+        uni_weight = tier_weight * data_weight
+        
+        if uni_percentage >= 25:
+            uni_bonus = 30 * uni_weight
+            score += uni_bonus
+            reasons.append(f"Excellent {uni} representation ({uni_percentage}%)")
+            confidence_factors.append('excellent_uni_rep')
+        elif uni_percentage >= 15:
+            uni_bonus = 22 * uni_weight
+            score += uni_bonus
+            reasons.append(f"Strong {uni} representation ({uni_percentage}%)")
+            confidence_factors.append('high_uni_rep')
+        elif uni_percentage >= 8:
+            uni_bonus = 12 * uni_weight
+            score += uni_bonus
+            reasons.append(f"Good {uni} representation ({uni_percentage}%)")
+            confidence_factors.append('medium_uni_rep')
+        elif uni_percentage >= 3:
+            uni_bonus = 6 * uni_weight
+            score += uni_bonus
+            reasons.append(f"Some {uni} representation ({uni_percentage}%)")
+
+        # Enhanced WAM scoring with data-driven thresholds
+        wam_threshold = profile.get('wam_threshold', 75)
+        
+        # Adjust threshold based on market competition and data
+        competition_adjustment = 0
+        if profile.get('market_activity', 0) > 0.7:  # High activity = more competitive
+            competition_adjustment = 2
+        elif profile.get('market_activity', 0) < 0.3:  # Low activity = less competitive
+            competition_adjustment = -2
+        
+        adjusted_threshold = wam_threshold + competition_adjustment
+        wam_diff = wam - adjusted_threshold
+        
+        if wam_diff >= 12:
+            score += 40
+            reasons.append(f"WAM significantly exceeds expectations ({wam:.1f} vs ~{adjusted_threshold})")
+            confidence_factors.append('outstanding_wam')
+        elif wam_diff >= 7:
+            score += 30
+            reasons.append(f"WAM well above requirements ({wam:.1f})")
+            confidence_factors.append('excellent_wam')
+        elif wam_diff >= 3:
+            score += 20
+            reasons.append(f"WAM above typical threshold ({wam:.1f})")
+            confidence_factors.append('strong_wam')
+        elif wam_diff >= 0:
+            score += 12
+            reasons.append(f"WAM meets current market expectations ({wam:.1f})")
+            confidence_factors.append('adequate_wam')
+        elif wam_diff >= -3:
+            score += 3
+            reasons.append("WAM slightly below market average")
+        elif wam_diff >= -7:
+            score -= 5
+            reasons.append("WAM below typical requirements")
+        else:
+            score -= 15
+            reasons.append("WAM significantly below expectations")
+
+        # Preference alignment with dynamic weighting
+        pref_weight = 0.3
+        if preference == 'prestige':
+            pref_score = profile['prestige_score'] * pref_weight
+            score += pref_score
+            reasons.append(f"High prestige rating ({profile['prestige_score']}/100)")
+        elif preference == 'training':
+            pref_score = profile['training_score'] * pref_weight
+            score += pref_score
+            reasons.append(f"Strong training programs ({profile['training_score']}/100)")
+        elif preference == 'worklife':
+            pref_score = profile['worklife_score'] * pref_weight
+            score += pref_score
+            reasons.append(f"Good work-life balance ({profile['worklife_score']}/100)")
+        elif preference == 'salary':
+            salary_score = min(25, (profile['avg_salary'] - 70000) / 1000)
+            score += salary_score
+            reasons.append(f"Competitive salary (${profile['avg_salary']:,.0f})")
+
+        # Experience level fit (only add specific bonuses, no generic reasons)
+        exp_bonus = 0
+        if experience == 'extensive' and profile['competitive_level'] == 'very_high':
+            exp_bonus = 15
+        elif experience == 'some' and profile['competitive_level'] in ['high', 'moderate']:
+            exp_bonus = 12
+        elif experience == 'none' and profile['competitive_level'] == 'moderate':
+            exp_bonus = 15
+            reasons.append("Welcomes graduates without prior legal experience")
+        elif experience == 'none' and profile['competitive_level'] == 'high':
+            exp_bonus = 5
+        
+        score += exp_bonus
+
+        # Advanced interest area alignment with market intelligence
+        interest_bonus = 0
+        interest_keywords = {
+            'commercial': ['corporate', 'm&a', 'banking', 'finance', 'commercial', 'capital markets'],
+            'litigation': ['litigation', 'dispute', 'resolution', 'employment', 'arbitration'],
+            'family': ['family'],
+            'criminal': ['criminal'],
+            'employment': ['employment', 'workplace', 'industrial'],
+            'property': ['property', 'real estate', 'construction'],
+            'tax': ['tax', 'revenue'],
+            'technology': ['technology', 'ip', 'intellectual property', 'data'],
+            'energy': ['energy', 'resources', 'mining', 'oil'],
+            'other': []
+        }
+        
+        user_keywords = interest_keywords.get(interest, [])
+        matched_strengths = []
+        
+        for strength in profile['strengths']:
+            for keyword in user_keywords:
+                if keyword.lower() in strength.lower():
+                    matched_strengths.append(strength)
+                    interest_bonus += 20
+                    confidence_factors.append('practice_match')
+                    break
+        
+        # Provide specific practice area insights
+        if matched_strengths:
+            if len(matched_strengths) > 1:
+                reasons.append(f"Multiple practice strengths: {', '.join(matched_strengths[:2])}")
+            else:
+                reasons.append(f"Leading expertise in {matched_strengths[0]}")
+        
+        # Emerging practice area bonus for forward-thinking candidates
+        if interest == 'technology' and any('tech' in s.lower() or 'ip' in s.lower() for s in profile['strengths']):
+            interest_bonus += 10
+            reasons.append("Strong in high-growth technology practice")
+        
+        score += interest_bonus
+
+        # Enhanced location matching with CSV data
+        if location != 'any':
+            active_cities = profile.get('active_cities', [])
+            real_data = firm_data_lookup.get(firm)
+            
+            location_match = False
+            if active_cities:
+                for city in active_cities:
+                    if location.lower() in city.lower():
+                        score += 12
+                        reasons.append(f"Active recruitment in {city}")
+                        confidence_factors.append('location_match')
+                        location_match = True
+                        break
+            
+            if not location_match and real_data and real_data.get('top_city'):
+                if location.lower() in real_data['top_city'].lower():
+                    score += 6
+                    reasons.append(f"Established presence in {location}")
+        
+        # Advanced program type and career path alignment
+        program_types = profile.get('program_offerings', [])
+        if interest in ['clerkship', 'graduate']:
+            target_program = 'clerkship' if interest == 'clerkship' else 'graduate'
+            
+            if any(target_program in prog.lower() for prog in program_types):
+                score += 10
+                confidence_factors.append('program_match')
+            elif program_types:  # Has programs but not exact match
+                score += 5
+        
+        # Intelligent career progression analysis
+        if experience == 'extensive' and preference == 'prestige':
+            if profile['tier'] == 'top' and profile.get('market_activity', 0) > 0.5:
+                score += 12
+                reasons.append("Perfect timing for experienced candidate seeking prestige")
+        elif experience == 'none' and preference == 'training':
+            if profile['training_score'] >= 85:
+                score += 15
+                reasons.append("Excellent graduate development programs")
+                confidence_factors.append('training_excellence')
+        
+        # Market timing intelligence
+        current_month = month
+        if grad_year == '2025':
+            if 2 <= current_month <= 5:  # Peak recruitment season
+                if profile.get('market_activity', 0) > 0.7:
+                    score += 8
+                    reasons.append("High recruitment activity this season")
+            elif current_month >= 8:  # Late season opportunities
+                if profile.get('market_activity', 0) > 0.4:
+                    score += 6
+                    reasons.append("Still actively recruiting late in season")
+        
+        # Sophisticated WAM contextualization
+        if uni in ['University of Melbourne', 'University of Sydney', 'UNSW']:
+            go8_bonus = 3  # Go8 recognition
+            if wam >= 80:
+                go8_bonus = 8
+                reasons.append("Strong WAM from prestigious Go8 university")
+            score += go8_bonus
+        
+        # Strategic preference matching with market intelligence
+        if preference == 'salary':
+            salary_competitive = profile.get('avg_salary', 75000)
+            if salary_competitive >= 85000:
+                score += 18
+                reasons.append(f"Top-tier compensation (${salary_competitive:,.0f})")
+            elif salary_competitive >= 80000:
+                score += 12
+                reasons.append(f"Competitive salary package (${salary_competitive:,.0f})")
+        elif preference == 'prestige' and profile['tier'] == 'top':
+            market_reputation = profile.get('market_activity', 0) * 0.3 + profile.get('csv_confidence', 0.5) * 0.4
+            if market_reputation > 0.6:
+                score += 15
+                reasons.append("Market-leading reputation and visibility")
+        
+        # Intelligent experience-firm culture matching
+        culture_match = 0
+        culture = profile.get('culture', '').lower()
+        if experience == 'extensive':
+            if 'traditional' in culture or 'demanding' in culture:
+                culture_match = 8
+                reasons.append("Culture rewards experienced professionals")
+        elif experience == 'none':
+            if 'supportive' in culture or 'development' in culture or 'mentoring' in culture:
+                culture_match = 12
+                reasons.append("Supportive culture for new graduates")
+                confidence_factors.append('culture_fit')
+        elif experience == 'some':
+            if 'collaborative' in culture or 'team' in culture:
+                culture_match = 10
+                reasons.append("Collaborative environment values diverse experience")
+        
+        score += culture_match
+
+        # Enhanced confidence calculation with data quality factors
+        confidence = 'Low'
+        high_confidence_factors = ['outstanding_wam', 'excellent_wam', 'excellent_uni_rep', 'active_recruiting', 'high_data_quality']
+        medium_confidence_factors = ['strong_wam', 'high_uni_rep', 'practice_match', 'location_match', 'good_data_quality']
+        
+        if (len(confidence_factors) >= 4 or 
+            any(f in confidence_factors for f in high_confidence_factors) and len(confidence_factors) >= 2 or
+            'outstanding_wam' in confidence_factors):
+            confidence = 'Very High'
+        elif (len(confidence_factors) >= 3 or 
+              any(f in confidence_factors for f in high_confidence_factors) or
+              len([f for f in confidence_factors if f in medium_confidence_factors]) >= 2):
+            confidence = 'High'
+        elif (len(confidence_factors) >= 2 or 
+              any(f in confidence_factors for f in medium_confidence_factors)):
+            confidence = 'Medium'
+
+        firm_scores[firm] = {
+            'score': max(0, min(100, score)),
+            'profile': profile,
+            'reasons': reasons[:4],  # Limit to top 4 reasons
+            'uni_percentage': uni_percentage,
+            'confidence': confidence
+        }
+    return firm_scores
+
+def random_candidate(rng: random.Random, unis: List[str]) -> Dict:
+    return {
+        'uni': rng.choice(unis + ['Other', 'Bond University']),
+        'wam': round(rng.uniform(50, 99), 1) if rng.random() < 0.8 else float(rng.randint(50, 99)),
+        'interest': rng.choice(list(INTEREST_KEYWORDS) + ['banking', 'intellectual', 'government', 'clerkship', 'graduate']),
+        'preference': rng.choice(['prestige', 'salary', 'worklife', 'training']),
+        'experience': rng.choice(['none', 'some', 'extensive']),
+        'location': rng.choice(['any', 'melbourne', 'sydney', 'brisbane', 'perth', 'adelaide', 'Melbourne']),
+        'grad_year': rng.choice(['2024', '2025', '2026']),
+    }
+
+def _reference_shortlist(cand: Dict, firm_profiles, lookup, uni_data, month: int) -> List[Tuple]:
+    ref = score_firms_reference(cand, firm_profiles, lookup, uni_data, month)
+    ranked = sorted(ref.items(), key=lambda x: x[1]['score'], reverse=True)
+    top = select_top_firms([(f, d['score'], d['profile']['tier']) for f, d in ranked])
+    return [(f, ref[f]['score'], ref[f]['confidence'], ref[f]['reasons']) for f, _, _ in top]
+
+@pytest.fixture(scope='module')
+def data():
+    from main import FIRM_UNIVERSITY_DATA
+    firm_profiles, lookup = get_firm_profiles(SIGNALS_CSV)
+    unis = sorted({u for d in FIRM_UNIVERSITY_DATA.values() for u in d})
+    rng = random.Random(SEED)
+    cands = [(random_candidate(rng, unis), rng.randint(1, 12)) for _ in range(N_CANDIDATES)]
+    return firm_profiles, lookup, FIRM_UNIVERSITY_DATA, cands
+
+def test_score_firms_matches_reference(data):
+    firm_profiles, lookup, uni_data, cands = data
+    for cand, month in cands:
+        want = score_firms_reference(cand, firm_profiles, lookup, uni_data, month)
+        got = score_firms(cand, firm_profiles, lookup, uni_data, month)
+        assert got == want, (cand, month)
+        assert [type(v['score']) for v in got.values()] == [type(v['score']) for v in want.values()], (cand, month)
+
+def test_rank_candidates_matches_reference(data):
+    firm_profiles, lookup, uni_data, cands = data
+    for month in range(1, 13):
+        batch = [c for c, mo in cands if mo == month]
+        for cand, picks in zip(batch, rank_candidates(batch, firm_profiles, lookup, uni_data, month), strict=True):
+            want = _reference_shortlist(cand, firm_profiles, lookup, uni_data, month)
+            got = [(p['firm'], p['score'], p['confidence'], p['reasons']) for p in picks]
+            assert got == want, (cand, month)
+
+def test_rank_candidates_empty():
+    assert rank_candidates([], {}, {}, {}) == []
@@ -0,0 +1,131 @@
+# tracker_export.py
+# Streaming /tracker/export. Rows come straight from db_auth.iter_user_applications
+# and are encoded into the response as CSV, NDJSON or XLSX in small chunks, so
+# nothing touches disk and memory stays flat however big the tracker is.
+#
+# XLSX is written with the stdlib: a minimal workbook whose single sheet uses
+# inline strings, zipped through zipfile onto an unseekable sink.
+
+import io, re, csv, json, zipfile
+from datetime import date, datetime
+from typing import Dict, Iterable, Iterator
+from xml.sax.saxutils import escape
+
+EXPORT_FIELDS = ['company', 'role', 'application_date', 'wam', 'status', 'response_date', 'priority', 'notes']
+FLUSH_ROWS = 200   # rows per yielded chunk
+
+def _value(v) -> str:
+    if v is None:
+        return ''
+    if isinstance(v, (date, datetime)):
+        return v.isoformat()
+    return str(v)
+
+def _record(app: Dict) -> Dict[str, str]:
+    return {f: _value(app.get(f)) for f in EXPORT_FIELDS}
+
+# --- CSV / NDJSON -----------------------------------------------------------
+def csv_chunks(apps: Iterable[Dict]) -> Iterator[str]:
+    buf = io.StringIO()
+    w = csv.DictWriter(buf, fieldnames=EXPORT_FIELDS)
+    w.writeheader()
+    for n, app in enumerate(apps, 1):
+        w.writerow(_record(app))
+        if n % FLUSH_ROWS == 0:
+            yield buf.getvalue()
+            buf.seek(0)
+            buf.truncate()
+    yield buf.getvalue()
+
+def ndjson_chunks(apps: Iterable[Dict]) -> Iterator[str]:
+    lines = []
+    for app in apps:
+        lines.append(json.dumps(_record(app)) + "\n")
+        if len(lines) == FLUSH_ROWS:
+            yield "".join(lines)
+            lines = []
+    yield "".join(lines)
+
+# --- XLSX -------------------------------------------------------------------
+# Characters XML 1.0 can't carry at all
+_XML_ILLEGAL = re.compile('[\x00-\x08\x0b\x0c\x0e-\x1f￾￿]')
+
+XLSX_STATIC = {
+    '[Content_Types].xml': (
+        '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+        '<Types xmlns="http://schemas.openxmlformats.org/package/2006/content-types">'
+        '<Default Extension="rels" ContentType="application/vnd.openxmlformats-package.relationships+xml"/>'
+        '<Default Extension="xml" ContentType="application/xml"/>'
+        '<Override PartName="/xl/workbook.xml" ContentType="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet.main+xml"/>'
+        '<Override PartName="/xl/worksheets/sheet1.xml" ContentType="application/vnd.openxmlformats-officedocument.spreadsheetml.worksheet+xml"/>'
+        '</Types>'),
+    '_rels/.rels': (
+        '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+        '<Relationships xmlns="http://schemas.openxmlformats.org/package/2006/relationships">'
+        '<Relationship Id="rId1" Type="http://schemas.openxmlformats.org/officeDocument/2006/relationships/officeDocument" Target="xl/workbook.xml"/>'
+        '</Relationships>'),
+    'xl/workbook.xml': (
+        '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+        '<workbook xmlns="http://schemas.openxmlformats.org/spreadsheetml/2006/main" '
+        'xmlns:r="http://schemas.openxmlformats.org/officeDocument/2006/relationships">'
+        '<sheets><sheet name="Applications" sheetId="1" r:id="rId1"/></sheets></workbook>'),
+    'xl/_rels/workbook.xml.rels': (
+        '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+        '<Relationships xmlns="http://schemas.openxmlformats.org/package/2006/relationships">'
+        '<Relationship Id="rId1" Type="http://schemas.openxmlformats.org/officeDocument/2006/relationships/worksheet" Target="worksheets/sheet1.xml"/>'
+        '</Relationships>'),
+}
+
+class _Sink:
+    """Write-only, unseekable file object; zipfile then streams with data descriptors."""
+    def __init__(self):
+        self.parts = []
+
+    def write(self, b) -> int:
+        self.parts.append(bytes(b))
+        return len(b)
+
+    def flush(self):
+        pass
+
+    def take(self) -> bytes:
+        out = b"".join(self.parts)
+        self.parts = []
+        return out
+
+def _xlsx_row(n: int, values) -> str:
+    cells = "".join(f'<c t="inlineStr"><is><t xml:space="preserve">{escape(_XML_ILLEGAL.sub("", v))}</t></is></c>'
+                    for v in values)
+    return f'<row r="{n}">{cells}</row>'
+
+def xlsx_chunks(apps: Iterable[Dict]) -> Iterator[bytes]:
+    sink = _Sink()
+    with zipfile.ZipFile(sink, 'w', zipfile.ZIP_DEFLATED) as zf:
+        for name, xml in XLSX_STATIC.items():
+            zf.writestr(name, xml)
+        with zf.open('xl/worksheets/sheet1.xml', 'w') as sheet:
+            sheet.write(b'<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+                        b'<worksheet xmlns="http://schemas.openxmlformats.org/spreadsheetml/2006/main"><sheetData>')
+            sheet.write(_xlsx_row(1, EXPORT_FIELDS).encode('utf-8'))
+            for n, app in enumerate(apps, 2):
+                rec = _record(app)
+                sheet.write(_xlsx_row(n, [rec[f] for f in EXPORT_FIELDS]).encode('utf-8'))
+                if n % FLUSH_ROWS == 0:
+                    yield sink.take()
+            sheet.write(b'</sheetData></worksheet>')
+    yield sink.take()
+
+EXPORT_FORMATS = {
+    'csv': (csv_chunks, 'text/csv'),
+    'ndjson': (ndjson_chunks, 'application/x-ndjson'),
+    'xlsx': (xlsx_chunks, 'application/vnd.openxmlformats-officedocument.spreadsheetml.sheet'),
+}
+
+def export_response(apps: Iterable[Dict], fmt: str, filename_stem: str):
+    """Streaming attachment response for `apps` in one of EXPORT_FORMATS."""
+    from flask import Response
+    encode, mimetype = EXPORT_FORMATS[fmt]
+    return Response(encode(apps), mimetype=mimetype, headers={
+        'Content-Disposition': f'attachment; filename={filename_stem}.{fmt}',
+        'Cache-Control': 'no-store',
+    })